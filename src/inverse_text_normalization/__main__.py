@@ -0,0 +1,65 @@
+import io
+import sys
+from argparse import ArgumentParser
+from contextlib import contextmanager
+
+from inverse_text_normalization.fst_utils import SEMIOTIC_CLASSES
+from inverse_text_normalization.run_predict import ENGINES, LANG_PACKAGES, inverse_normalize_stream
+
+'''
+Streams text through inverse text normalization, one sentence per line, with constant memory
+
+Example usage:
+python -m inverse_text_normalization --lang hi --input transcripts.txt --output itn.txt --workers 4 --progress
+cat transcripts.txt | python -m inverse_text_normalization --lang hi --input - --output -
+python -m inverse_text_normalization --lang hi --input transcripts.txt --classes cardinal ordinal
+'''
+
+
+def parse_args():
+    parser = ArgumentParser(prog="python -m inverse_text_normalization")
+    parser.add_argument("--lang", help="language", required=True, choices=sorted(LANG_PACKAGES), type=str)
+    parser.add_argument("--input", help="input file path, - for stdin", default='-', type=str)
+    parser.add_argument("--output", help="output file path, - for stdout", default='-', type=str)
+    parser.add_argument("--chunk_size", help="lines normalized per batch", default=1000, type=int)
+    parser.add_argument("--workers", help="number of worker processes", default=1, type=int)
+    parser.add_argument("--engine", help="fast parses lines that are a single cardinal without the grammars, hi and mr only",
+                        choices=ENGINES, default='fst', type=str)
+    parser.add_argument("--classes", help="semiotic classes to normalize, smaller grammars build faster",
+                        nargs='+', choices=SEMIOTIC_CLASSES, default=None)
+    parser.add_argument("--progress", help="report processed lines on stderr", action='store_true')
+    return parser.parse_args()
+
+
+@contextmanager
+def open_text(path: str, mode: str):
+    if path != '-':
+        with open(path, mode, encoding='utf-8') as f:
+            yield f
+        return
+    stream = sys.stdin if mode == 'r' else sys.stdout
+    wrapper = io.TextIOWrapper(stream.buffer, encoding='utf-8', newline=None if mode == 'r' else '\n')
+    try:
+        yield wrapper
+    finally:
+        # detached instead of closed, closing the wrapper would close the process's stdin/stdout
+        if mode != 'r':
+            wrapper.flush()
+        wrapper.detach()
+
+
+def main():
+    args = parse_args()
+    with open_text(args.input, 'r') as fin, open_text(args.output, 'w') as fout:
+        outputs = inverse_normalize_stream(fin, args.lang, chunk_size=args.chunk_size, workers=args.workers,
+                                          engine=args.engine, classes=args.classes)
+        if args.progress:
+            from tqdm import tqdm
+
+            outputs = tqdm(outputs, unit=' lines', file=sys.stderr)
+        for line in outputs:
+            fout.write(line + '\n')
+
+
+if __name__ == "__main__":
+    main()
@@ -15,7 +15,7 @@
 import itertools
 import sys
 from collections import OrderedDict
-from typing import List
+from typing import Iterable, List, Tuple
 
 # from inverse_text_normalization.lang_params import LANG
 # lang_taggers = f'inverse_text_normalization.taggers.{LANG}_taggers'
@@ -23,16 +23,50 @@ from typing import List
 
 # exec(f"from {lang_taggers}.tokenize_and_classify_final import ClassifyFinalFst")
 
+from inverse_text_normalization.asm.taggers.tokenize_and_classify import DEFAULT_CLASSES
 from inverse_text_normalization.asm.taggers.tokenize_and_classify_final import ClassifyFinalFst
+from inverse_text_normalization.asm.graph_utils import GraphFst
 from inverse_text_normalization.asm.token_parser import PRESERVE_ORDER_KEY, TokenParser
 from inverse_text_normalization.asm.verbalizers.verbalize_final import VerbalizeFinalFst
-from tqdm import tqdm
+from inverse_text_normalization.lexicon_overlay import get_overlay
+from inverse_text_normalization.fst_utils import (load_cached_grammars, pop_preloaded_grammars,
+                                                  prepare_for_composition, select_classes, shortest_string)
+
+# prepared (tagger, verbalizer) pairs, keyed by semiotic class selection
+_grammars = {}
+
+
+def get_grammars(classes: Iterable[str] = None) -> Tuple[GraphFst, GraphFst]:
+    """
+    Returns the tagger and verbalizer of a semiotic class selection. Each selection is built, or taken over from
+    grammars preloaded by warmup.py or cached by build_grammars.py in the ITN_GRAMMAR_CACHE directory, and prepared
+    for composition once, later calls with the same classes in any order reuse it.
+
+    Args:
+        classes: semiotic classes to normalize, DEFAULT_CLASSES of the taggers if None
+
+    Returns: tagger, verbalizer
+    """
+    key = select_classes(classes, DEFAULT_CLASSES)
+    if key not in _grammars:
+        preloaded = pop_preloaded_grammars('asm', key) or load_cached_grammars('asm', key)
+        if preloaded is None:
+            tagger = ClassifyFinalFst(key)
+            verbalizer = VerbalizeFinalFst(key)
+        else:
+            tagger = GraphFst(name="tokenize_and_classify_final", kind="classify")
+            verbalizer = GraphFst(name="verbalize_final", kind="verbalize")
+            tagger.fst, verbalizer.fst = preloaded
+        prepare_for_composition(tagger.fst)
+        prepare_for_composition(verbalizer.fst)
+        _grammars[key] = tagger, verbalizer
+    return _grammars[key]
+
 
 try:
     import pynini
 
-    tagger = ClassifyFinalFst()
-    verbalizer = VerbalizeFinalFst()
+    tagger, verbalizer = get_grammars()
     parser = TokenParser()
 
     PYNINI_AVAILABLE = True
@@ -106,43 +140,52 @@ def generate_permutations(tokens: List[dict]):
     return _helper("", tokens, 0)
 
 
-def find_tags(text: str) -> 'pynini.FstLike':
+def find_tags(text: str, classes: Iterable[str] = None, tenant: str = None) -> 'pynini.FstLike':
     """
     Given text use tagger Fst to tag text
 
     Args:
         text: sentence
+        classes: semiotic classes to tag, see get_grammars
+        tenant: tenant whose lexicon overlay phrases are tagged too, see lexicon_overlay.py
 
     Returns: tagged lattice
     """
-    lattice = text @ tagger.fst
+    tagger_fst = (tagger if classes is None else get_grammars(classes)[0]).fst
+    if tenant is not None:
+        overlay = get_overlay(tenant)
+        if overlay.matches(text):
+            tagger_fst = overlay.tagger(tagger_fst)
+    lattice = text @ tagger_fst
     return lattice
 
 
-def select_tag(lattice: 'pynini.FstLike') -> str:
+def select_tag(lattice: 'pynini.FstLike', prune_threshold: float = None) -> str:
     """
     Given tagged lattice return shortest path
 
     Args:
-        tagged_text: tagged text
+        lattice: tagged lattice
+        prune_threshold: optional weight threshold for pruning the lattice before the search
 
     Returns: shortest path
     """
-    tagged_text = pynini.shortestpath(lattice, nshortest=1, unique=True).string()
+    tagged_text = shortest_string(lattice, prune_threshold)
     return tagged_text
 
 
-def find_verbalizer(tagged_text: str) -> 'pynini.FstLike':
+def find_verbalizer(tagged_text: str, classes: Iterable[str] = None) -> 'pynini.FstLike':
     """
     Given tagged text, e.g. token {name: ""} token {money {fractional: ""}}, creates verbalization lattice
     This is context-independent.
 
     Args:
         tagged_text: input text
+        classes: semiotic classes to verbalize, see get_grammars
 
     Returns: verbalized lattice
     """
-    lattice = tagged_text @ verbalizer.fst
+    lattice = tagged_text @ (verbalizer if classes is None else get_grammars(classes)[1]).fst
     return lattice
 
 
@@ -155,32 +198,36 @@ def select_verbalizer(lattice: 'pynini.FstLike') -> str:
 
     Returns: shortest path
     """
-    output = pynini.shortestpath(lattice, nshortest=1, unique=True).string()
+    output = shortest_string(lattice)
     return output
 
 
-def inverse_normalize(text: str, verbose: bool) -> str:
+def inverse_normalize(text: str, verbose: bool, prune_threshold: float = None, classes: Iterable[str] = None,
+                      tenant: str = None) -> str:
     """
     main function. normalizes spoken tokens in given text to its written form
         e.g. twelve kilograms -> 12 kg
 
     Args:
         text: string that may include semiotic classes.
+        prune_threshold: optional weight threshold for pruning the tagged lattice
+        classes: semiotic classes to normalize, see get_grammars
+        tenant: tenant whose lexicon overlay applies, see find_tags
 
     Returns: written form
     """
 
     text = pynini.escape(text)
-    tagged_lattice = find_tags(text)
+    tagged_lattice = find_tags(text, classes, tenant)
     # # print("tagged lattice is ", tagged_lattice)
-    tagged_text = select_tag(tagged_lattice)
+    tagged_text = select_tag(tagged_lattice, prune_threshold)
     parser(tagged_text)
     tokens = parser.parse()
     tags_reordered = generate_permutations(tokens)
     for tagged_text in tags_reordered:
         tagged_text = pynini.escape(tagged_text)
         # # print("tagged text is ", tagged_text)
-        verbalizer_lattice = find_verbalizer(tagged_text)
+        verbalizer_lattice = find_verbalizer(tagged_text, classes)
         if verbalizer_lattice.num_states() == 0:
             continue
         output = select_verbalizer(verbalizer_lattice)
@@ -202,7 +249,8 @@ def inverse_normalize_identity(texts: List[str], verbose=False) -> List[str]:
     return texts
 
 
-def inverse_normalize_nemo(texts: List[str], verbose=False) -> List[str]:
+def inverse_normalize_nemo(texts: List[str], verbose=False, prune_threshold: float = None,
+                           classes: Iterable[str] = None, tenant: str = None) -> List[str]:
     """
     NeMo inverse text normalizer 
 
@@ -214,7 +262,8 @@ def inverse_normalize_nemo(texts: List[str], verbose=False) -> List[str]:
     res = []
     for input in texts:
         try:
-            text = inverse_normalize(input, verbose=verbose)
+            text = inverse_normalize(input, verbose=verbose, prune_threshold=prune_threshold, classes=classes,
+                                     tenant=tenant)
         except:
             raise Exception
         res.append(text)
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from inverse_text_normalization.asm.data_loader_utils import get_abs_path
+from inverse_text_normalization.lexicon_registry import load_string_file
 from inverse_text_normalization.asm.graph_utils import (
     NEMO_SIGMA,
     GraphFst,
@@ -28,9 +29,9 @@ try:
     import pynini
     from pynini.lib import pynutil
 
-    graph_teen = pynini.string_file(get_abs_path(lang_data_path + "numbers/teen.tsv")).optimize()
-    graph_digit = pynini.string_file(get_abs_path(lang_data_path + "numbers/digit.tsv")).optimize()
-    ties_graph = pynini.string_file(get_abs_path(lang_data_path + "numbers/ties.tsv")).optimize()
+    graph_teen = load_string_file(get_abs_path(lang_data_path + "numbers/teen.tsv")).optimize()
+    graph_digit = load_string_file(get_abs_path(lang_data_path + "numbers/digit.tsv")).optimize()
+    ties_graph = load_string_file(get_abs_path(lang_data_path + "numbers/ties.tsv")).optimize()
 
     PYNINI_AVAILABLE = True
 except (ModuleNotFoundError, ImportError):
@@ -43,7 +44,7 @@ except (ModuleNotFoundError, ImportError):
 
 
 def _get_month_graph():
-    month_graph = pynini.string_file(get_abs_path(lang_data_path + "months.tsv"))
+    month_graph = load_string_file(get_abs_path(lang_data_path + "months.tsv"))
     month_graph = pynini.invert(month_graph).optimize()
     return month_graph
 
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from inverse_text_normalization.asm.data_loader_utils import get_abs_path
+from inverse_text_normalization.lexicon_registry import load_string_file
 from inverse_text_normalization.asm.graph_utils import GraphFst, convert_space
 
 try:
@@ -37,6 +38,6 @@ class WhiteListFst(GraphFst):
     def __init__(self):
         super().__init__(name="whitelist", kind="classify")
 
-        whitelist = pynini.string_file(get_abs_path(lang_data_path+"whitelist.tsv")).invert()
+        whitelist = load_string_file(get_abs_path(lang_data_path+"whitelist.tsv")).invert()
         graph = pynutil.insert("name: \"") + convert_space(whitelist) + pynutil.insert("\"")
         self.fst = graph.optimize()
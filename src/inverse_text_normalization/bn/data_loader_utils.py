@@ -19,6 +19,8 @@ import os
 from collections import defaultdict, namedtuple
 from typing import Dict, List, Optional, Set, Tuple
 
+from inverse_text_normalization.grammar_cache import record_input
+
 EOS_TYPE = "EOS"
 PUNCT_TYPE = "PUNCT"
 PLAIN_TYPE = "PLAIN"
@@ -208,6 +210,8 @@ def get_abs_path(rel_path):
     Args:
         rel_path: relative path to this file
         
-    Returns absolute path
+    Returns absolute path, recorded as an input of the grammar component being built
     """
-    return os.path.dirname(os.path.abspath(__file__)) + '/' + rel_path
+    path = os.path.dirname(os.path.abspath(__file__)) + '/' + rel_path
+    record_input(path)
+    return path
@@ -17,6 +17,7 @@ import pynini
 from pynini.lib import pynutil, utf8
 
 from inverse_text_normalization.bn.data_loader_utils import get_abs_path
+from inverse_text_normalization.lexicon_registry import load_rows, load_string_file
 from inverse_text_normalization.bn.graph_utils import (
     NEMO_DIGIT,
     NEMO_SIGMA,
@@ -29,6 +30,13 @@ from inverse_text_normalization.bn.utils import num_to_word
 # data_path = f'data/{LANG}_data/'
 data_path = 'data/'
 
+# place value words of the cardinal grammar, also read by inverse_text_normalization.cardinal_parser
+HUNDREDS = ("শো", "শ", "শত", "হানড্রেড", "হন্ডরেড", "হানড্রড", "হান্ড্রেড")
+THOUSANDS = ("হাজার", "থাউসেন্ড", "থৌসান্ড", "থৌস্যান্ড", "থাউসান্ড", "থাউজেন্ড")
+LAKHS = ("লাখ", "ল্যাখ")
+CRORES = ("কোটি", "ক্রোর")
+AND_WORDS = ("এন্ড",)
+
 def get_alternate_spellings(text):
     return
 
@@ -59,28 +67,26 @@ class CardinalFst(GraphFst):
         # NEMO_NON_BREAKING_SPACE = u"\u00A0"
 
         hindi_digit_file = get_abs_path(data_path + 'numbers/digit.tsv')
-        with open(hindi_digit_file, encoding='utf-8') as f:
-            digits = f.readlines()
-        hindi_digits = ''.join([line.split()[-1] for line in digits])
+        hindi_digits = ''.join([row[-1] for row in load_rows(hindi_digit_file)])
         hindi_digits_with_zero = "0" + hindi_digits
         # # print(f'hindi digits is {hindi_digits}')
         HINDI_DIGIT = pynini.union(*hindi_digits).optimize()
         HINDI_DIGIT_WITH_ZERO = pynini.union(*hindi_digits_with_zero).optimize()
 
-        graph_zero = pynini.string_file(get_abs_path(data_path + "numbers/zero.tsv"))
-        graph_tens = pynini.string_file(get_abs_path(data_path + "numbers/tens.tsv"))
-        graph_digit = pynini.string_file(get_abs_path(data_path + "numbers/digit.tsv"))
-        graph_chars = pynini.string_file(get_abs_path(data_path + "numbers/alphabets.tsv"))
-        graph_multiples = pynini.string_file(get_abs_path(data_path + "numbers/multiples.tsv"))
-        graph_tens_en = pynini.string_file(get_abs_path(data_path + "numbers/tens_en.tsv"))
-        graph_char_multiples = pynini.string_file(get_abs_path(data_path + "numbers/multiples_alphabets.tsv"))
+        graph_zero = load_string_file(get_abs_path(data_path + "numbers/zero.tsv"))
+        graph_tens = load_string_file(get_abs_path(data_path + "numbers/tens.tsv"))
+        graph_digit = load_string_file(get_abs_path(data_path + "numbers/digit.tsv"))
+        graph_chars = load_string_file(get_abs_path(data_path + "numbers/alphabets.tsv"))
+        graph_multiples = load_string_file(get_abs_path(data_path + "numbers/multiples.tsv"))
+        graph_tens_en = load_string_file(get_abs_path(data_path + "numbers/tens_en.tsv"))
+        graph_char_multiples = load_string_file(get_abs_path(data_path + "numbers/multiples_alphabets.tsv"))
 
-        cents = pynini.accep("শো") |  pynini.accep("শ") | pynini.accep("শত") | pynini.accep("হানড্রেড") | pynini.accep("হন্ডরেড") | pynini.accep("হানড্রড") | pynini.accep("হান্ড্রেড")
-        thousands = pynini.accep("হাজার") | pynini.accep("থাউসেন্ড") | pynini.accep("থৌসান্ড") | pynini.accep("থৌস্যান্ড") | pynini.accep("থাউসান্ড") | pynini.accep("থাউজেন্ড")
-        lakhs = pynini.accep("লাখ") | pynini.accep("ল্যাখ")
-        crores = pynini.accep("কোটি") | pynini.accep("ক্রোর")
+        cents = pynini.union(*HUNDREDS)
+        thousands = pynini.union(*THOUSANDS)
+        lakhs = pynini.union(*LAKHS)
+        crores = pynini.union(*CRORES)
 
-        del_And = pynutil.delete(pynini.closure(pynini.accep("এন্ড"), 1 ,1 ))
+        del_And = pynutil.delete(pynini.union(*AND_WORDS))
         
         graph_hundred = pynini.cross("শো", "100") | pynini.cross("শ", "100") | pynini.cross("শত", "100") | pynini.cross("হানড্রেড", "100") | pynini.cross("হন্ডরেড", "100") | pynini.cross("হানড্রড", "100") | pynini.cross("হান্ড্রেড", "100")
         graph_thousand  = pynini.cross("হাজার", "1000") | pynini.cross("থাউসেন্ড", "1000") | pynini.cross("থৌসান্ড", "1000") | pynini.cross("থৌস্যান্ড", "1000") | pynini.cross("থাউসান্ড", "1000") | pynini.cross("থাউজেন্ড", "1000")
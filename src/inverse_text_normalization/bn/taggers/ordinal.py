@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from inverse_text_normalization.bn.data_loader_utils import get_abs_path
+from inverse_text_normalization.lexicon_registry import load_string_file
 from inverse_text_normalization.bn.graph_utils import NEMO_CHAR, GraphFst
 
 # from inverse_text_normalization.lang_params import LANG
@@ -41,8 +42,8 @@ class OrdinalFst(GraphFst):
         super().__init__(name="ordinal", kind="classify")
 
         cardinal_graph = cardinal.graph_no_exception
-        graph_digit = pynini.string_file(get_abs_path(data_path+"ordinals/digit.tsv"))
-        graph_teens = pynini.string_file(get_abs_path(data_path+"ordinals/teen.tsv"))
+        graph_digit = load_string_file(get_abs_path(data_path+"ordinals/digit.tsv"))
+        graph_teens = load_string_file(get_abs_path(data_path+"ordinals/teen.tsv"))
         # change to General UTF8
         graph = pynini.closure(NEMO_CHAR) + pynini.union(
             graph_digit, graph_teens, pynini.cross("tieth", "ty"), pynini.cross("th", "")
@@ -18,6 +18,8 @@
 lang_taggers = 'inverse_text_normalization.bn.taggers'
 
 from inverse_text_normalization.bn.graph_utils import GraphFst
+from inverse_text_normalization.fst_utils import select_classes
+from inverse_text_normalization.grammar_cache import ComponentBuilder
 exec(f"from {lang_taggers}.cardinal import CardinalFst")
 exec(f"from {lang_taggers}.date import DateFst")
 exec(f"from {lang_taggers}.decimal import DecimalFst")
@@ -35,41 +37,59 @@ try:
 except (ModuleNotFoundError, ImportError):
     PYNINI_AVAILABLE = False
 
+# semiotic classes tagged when no selection is given
+DEFAULT_CLASSES = ('whitelist', 'time', 'date', 'decimal', 'measure', 'cardinal', 'ordinal')
+# weights of the class taggers, in the order of their union
+CLASS_WEIGHTS = {
+    'whitelist': 1.01,
+    'time': 1.1,
+    'date': 1.09,
+    'decimal': 1.1,
+    'measure': 1.1,
+    'cardinal': 1.1,
+    'ordinal': 1.1,
+    'money': 1.1,
+}
+# grammar class of every semiotic class
+CLASS_TAGGERS = {
+    'whitelist': WhiteListFst,
+    'time': TimeFst,
+    'date': DateFst,
+    'decimal': DecimalFst,
+    'measure': MeasureFst,
+    'cardinal': CardinalFst,
+    'ordinal': OrdinalFst,
+    'money': MoneyFst,
+}
+# grammars passed to the constructor of a class grammar
+CLASS_DEPENDENCIES = {
+    'ordinal': ('cardinal',),
+    'decimal': ('cardinal',),
+    'measure': ('cardinal', 'decimal'),
+    'date': ('ordinal',),
+    'money': ('cardinal', 'decimal'),
+}
+
 
 class ClassifyFst(GraphFst):
     """
     Composes other classfier grammars. This class will be compiled and exported to thrax FAR. 
+
+    Args:
+        classes: semiotic classes to tag, DEFAULT_CLASSES if None. Words of other classes are tagged as plain words
+        cache: optional grammar_cache.GrammarCache, class grammars whose inputs did not change are loaded from it
     """
 
-    def __init__(self):
+    def __init__(self, classes=None, cache=None):
         super().__init__(name="tokenize_and_classify", kind="classify")
+        classes = select_classes(classes, DEFAULT_CLASSES)
 
-        cardinal_graph_fst = CardinalFst()
-        cardinal = cardinal_graph_fst.fst
-
-        ordinal_graph_fst = OrdinalFst(cardinal_graph_fst)
-        ordinal = ordinal_graph_fst.fst
-
-        decimal_graph_fst = DecimalFst(cardinal_graph_fst)
-        decimal = decimal_graph_fst.fst
-
-        measure = MeasureFst(cardinal_graph_fst, decimal_graph_fst).fst
-        date = DateFst(ordinal_graph_fst).fst
-        word = WordFst().fst
-        time = TimeFst().fst
-        money = MoneyFst(cardinal_graph_fst, decimal_graph_fst).fst
-        whitelist = WhiteListFst().fst
-
-        graph = (
-            pynutil.add_weight(whitelist, 1.01)
-            | pynutil.add_weight(time, 1.1)
-            | pynutil.add_weight(date, 1.09)
-            | pynutil.add_weight(decimal, 1.1)
-            | pynutil.add_weight(measure, 1.1)
-            | pynutil.add_weight(cardinal, 1.1)
-            | pynutil.add_weight(ordinal, 1.1)
-            # | pynutil.add_weight(money, 1.1)
-            | pynutil.add_weight(word, 100)
-        )
+        builder = ComponentBuilder('classify', CLASS_TAGGERS, CLASS_DEPENDENCIES, cache)
+        graph = None
+        for name, weight in CLASS_WEIGHTS.items():
+            if name in classes:
+                class_graph = pynutil.add_weight(builder.fst(name), weight)
+                graph = class_graph if graph is None else graph | class_graph
+        graph = graph | pynutil.add_weight(WordFst().fst, 100)
 
         self.fst = graph.optimize()
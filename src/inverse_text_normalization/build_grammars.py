@@ -0,0 +1,81 @@
+import importlib
+import time
+from argparse import ArgumentParser
+from typing import List
+
+from inverse_text_normalization.fst_utils import SEMIOTIC_CLASSES, select_classes
+from inverse_text_normalization.grammar_cache import ComponentBuild, GrammarCache, package_sources, recording_inputs
+from inverse_text_normalization.run_predict import LANG_PACKAGES
+
+'''
+Builds the grammars of languages incrementally: class grammars whose data files and source modules did not change
+since the previous build are loaded from the cache, the others are compiled again, then the top level tagger and
+verbalizer are unioned and optimized and stored in the cache too. Prints what was rebuilt, why, and how long it
+took. Language packages imported with ITN_GRAMMAR_CACHE set to the cache directory load the top level grammars
+from it while they are up to date.
+
+Example usage:
+python -m inverse_text_normalization.build_grammars --langs hi ta --cache_dir grammar_cache
+ITN_GRAMMAR_CACHE=grammar_cache python -m inverse_text_normalization --lang hi --input transcripts.txt --output itn.txt
+'''
+
+
+def parse_args():
+    parser = ArgumentParser()
+    parser.add_argument("--langs", help="languages to build", nargs='+', choices=sorted(LANG_PACKAGES),
+                        required=True)
+    parser.add_argument("--cache_dir", help="directory of the compiled class grammars", required=True, type=str)
+    parser.add_argument("--classes", help="semiotic classes to build, all classes of the language by default",
+                        nargs='+', choices=SEMIOTIC_CLASSES, default=None)
+    return parser.parse_args()
+
+
+def build_grammars(lang: str, cache_dir: str, classes: List[str] = None) -> List[ComponentBuild]:
+    """
+    Builds the tagger and verbalizer of a language with a component cache and stores them in the cache as
+    <cache_dir>/<package>/<kind>/<name>.far, with the files they were built from
+
+    Args:
+        lang: language code
+        cache_dir: cache directory
+        classes: semiotic classes to build, None for the default classes of the language
+
+    Returns: build report, one line per class grammar and one per top level grammar
+    """
+    package = LANG_PACKAGES[lang]
+    cache = GrammarCache(cache_dir, package)
+    taggers = importlib.import_module(f'inverse_text_normalization.{package}.taggers.tokenize_and_classify')
+    classes = select_classes(classes, taggers.DEFAULT_CLASSES)
+    final_grammars = (
+        ('classify', f'inverse_text_normalization.{package}.taggers.tokenize_and_classify_final', 'ClassifyFinalFst'),
+        ('verbalize', f'inverse_text_normalization.{package}.verbalizers.verbalize_final', 'VerbalizeFinalFst'),
+    )
+    report = []
+    for kind, module_name, class_name in final_grammars:
+        final_class = getattr(importlib.import_module(module_name), class_name)
+        start = time.perf_counter()
+        num_components = len(cache.report)
+        with recording_inputs() as inputs:
+            grammar = final_class(classes, cache)
+        components = cache.report[num_components:]
+        seconds = time.perf_counter() - start - sum(component.seconds for component in components)
+
+        # cached class grammars read no files, their inputs come from the manifest
+        for component in components:
+            inputs |= cache.component_inputs(component.component)
+        inputs |= package_sources(module_name, package)
+        cache.store_final(kind, grammar.name, classes, grammar.fst, inputs, seconds)
+        report += components + [ComponentBuild(f'{kind}/{grammar.name}', True, seconds, ['union and optimize'])]
+    return report
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    for lang in args.langs:
+        start = time.perf_counter()
+        for component, rebuilt, seconds, changed_inputs in build_grammars(lang, args.cache_dir, args.classes):
+            reason = ', '.join(changed_inputs[:3])
+            if len(changed_inputs) > 3:
+                reason += f' and {len(changed_inputs) - 3} more'
+            print(f'{lang} {component:<40} {"rebuilt" if rebuilt else "cached":>7} {seconds:8.2f}s  {reason}')
+        print(f'{lang} {"total":<40} {"":>7} {time.perf_counter() - start:8.2f}s')
@@ -0,0 +1,228 @@
+import csv
+import importlib
+import os
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+'''
+Pure Python parser for spoken cardinals, a fast alternative to the pynini cardinal grammar for lines that are a
+single cardinal, e.g. "बारह लाख बीस हज़ार सात सौ पंद्रह" -> "1220715".
+
+The parser reads the same data/numbers/*.tsv lexicons and place value words as taggers/cardinal.py and parses
+deterministically from left to right. Anything it is not sure about (single words, which are frozen by context,
+zeros, digit sequences, letters, "minus", ambiguous lexicon entries) is rejected, so that the caller can fall back
+to the grammar. run_benchmark.py --benchmark cardinal compares both engines on generated numbers.
+'''
+
+# language packages whose cardinal grammar is the place value grammar of hi/taggers/cardinal.py,
+# with whether english ties (e.g. "ट्वेंटी") are combined with a following digit
+PLACE_VALUE_PACKAGES = {
+    'hi': True,
+    'mr': True,
+    'gu': True,
+    'ori': True,
+    'pa': False,
+    'bn': False,
+}
+# packages whose parser gives the same output as the grammars on every line it accepts, checked by
+# run_benchmark.py --benchmark cardinal, the fast engine supports these only. The gu, pa and bn grammars write a single
+# digit lakh or thousand after a higher place with an extra zero (e.g. 9 crore 5 lakh 24927 as 900524927) and the ori
+# grammar reads ସିକ୍ସଟିନ as 61. ta, te, kn, ml, asm and en have other cardinal grammars and no parser
+FAST_ENGINE_PACKAGES = frozenset(['hi', 'mr'])
+
+DIGIT, TENS, TIES = 'digit', 'tens', 'ties'
+
+HUNDRED = 100
+THOUSAND = 1000
+LAKH = 100000
+CRORE = 10000000
+
+
+def load_number_file(path: str, width: int) -> Dict[Tuple[str, ...], Optional[int]]:
+    """
+    Loads a two column number lexicon, spoken form -> value
+
+    Args:
+        path: tsv file path
+        width: expected number of digits of the values, rows with other values are skipped
+
+    Returns: dictionary from spoken words to value, None for spoken forms listed with different values
+    """
+    lexicon = {}
+    with open(path, encoding='utf-8') as f:
+        for row in csv.reader(f, delimiter='\t'):
+            if len(row) != 2 or len(row[1]) != width or not row[1].isascii() or not row[1].isdigit():
+                continue
+            words, value = tuple(row[0].split()), int(row[1])
+            if words:
+                lexicon[words] = value if lexicon.get(words, value) == value else None
+    return lexicon
+
+
+class CardinalParser:
+    """
+    Deterministic left to right parser of spoken cardinals in lakh/crore place value notation
+
+    Args:
+        lexicons: kind (digit, tens or ties) -> spoken words -> value
+        hundreds: words for hundred
+        thousands: words for thousand
+        lakhs: words for lakh
+        crores: words for crore
+        and_words: connectives that may follow a place value word, e.g. "एंड"
+    """
+
+    def __init__(self, lexicons: Dict[str, Dict[Tuple[str, ...], Optional[int]]], hundreds: Iterable[str],
+                 thousands: Iterable[str], lakhs: Iterable[str], crores: Iterable[str], and_words: Iterable[str]):
+        self.hundreds = frozenset(hundreds)
+        self.magnitudes = {}
+        for magnitude, words in ((THOUSAND, thousands), (LAKH, lakhs), (CRORE, crores)):
+            for word in words:
+                self.magnitudes[word] = magnitude if self.magnitudes.get(word, magnitude) == magnitude else None
+        self.and_words = frozenset(and_words)
+
+        # token trie: first word -> number of words -> list of (kind, words, value)
+        self.trie = {}
+        keywords = self.hundreds | set(self.magnitudes) | self.and_words
+        for kind, lexicon in lexicons.items():
+            for words, value in lexicon.items():
+                if value is None or keywords.intersection(words):
+                    continue
+                self.trie.setdefault(words[0], {}).setdefault(len(words), []).append((kind, words, value))
+
+    @classmethod
+    def from_package(cls, package: str) -> 'CardinalParser':
+        """
+        Builds the parser of a language package from its number lexicons and cardinal grammar place value words
+        """
+        cardinal = importlib.import_module(f'inverse_text_normalization.{package}.taggers.cardinal')
+        numbers_dir = os.path.join(os.path.dirname(os.path.abspath(cardinal.__file__)), '..', 'data', 'numbers')
+
+        lexicons = {DIGIT: load_number_file(os.path.join(numbers_dir, 'digit.tsv'), 1), TENS: {}}
+        for name in ('tens.tsv', 'tens-en.tsv', 'tens_en.tsv'):
+            path = os.path.join(numbers_dir, name)
+            if os.path.exists(path):
+                for words, value in load_number_file(path, 2).items():
+                    lexicons[TENS][words] = value if lexicons[TENS].get(words, value) == value else None
+        if PLACE_VALUE_PACKAGES[package]:
+            lexicons[TIES] = load_number_file(os.path.join(numbers_dir, 'ties.tsv'), 1)
+        return cls(lexicons, cardinal.HUNDREDS, cardinal.THOUSANDS, cardinal.LAKHS, cardinal.CRORES,
+                   cardinal.AND_WORDS)
+
+    def _matches(self, tokens: List[str], pos: int) -> List[Tuple[str, int, int]]:
+        """
+        Returns (kind, end position, value) of every lexicon entry starting at pos
+        """
+        matches = []
+        for length, entries in self.trie.get(tokens[pos], {}).items():
+            for kind, words, value in entries:
+                if tuple(tokens[pos:pos + length]) == words:
+                    matches.append((kind, pos + length, value))
+        return matches
+
+    def _below_hundred(self, tokens: List[str], pos: int) -> Optional[Tuple[int, int]]:
+        """
+        Parses 1..99 at pos, the longest reading wins. Returns (value, end position), None if there is no reading
+        or the longest readings disagree
+        """
+        if pos >= len(tokens):
+            return None
+        readings = set()
+        for kind, end, value in self._matches(tokens, pos):
+            if kind == TIES:
+                digits = [(e, v) for k, e, v in self._matches(tokens, end) if k == DIGIT] if end < len(tokens) else []
+                readings.update((e, value * 10 + v) for e, v in digits)
+                readings.add((end, value * 10))
+            else:
+                readings.add((end, value))
+        if not readings:
+            return None
+        end = max(end for end, _ in readings)
+        values = {value for e, value in readings if e == end}
+        if len(values) != 1:
+            return None
+        return values.pop(), end
+
+    def _group(self, tokens: List[str], pos: int) -> Optional[Tuple[int, int, bool]]:
+        """
+        Parses a number below a thousand at pos, e.g. "चार सौ एंड बीस", or a hundred prefixed by tens,
+        e.g. "पंद्रह सौ सात". Returns (value, end position, whether hundreds are prefixed by tens)
+        """
+        n = len(tokens)
+        if tokens[pos] in self.hundreds:
+            prefix, end, tens_prefix = 1, pos + 1, False
+        else:
+            prefixes = {(e, v, k == TENS) for k, e, v in self._matches(tokens, pos)
+                        if k in (DIGIT, TENS) and e < n and tokens[e] in self.hundreds}
+            if not prefixes:
+                rest = self._below_hundred(tokens, pos)
+                return None if rest is None else rest + (False,)
+            if len(prefixes) != 1:
+                return None
+            end, prefix, tens_prefix = prefixes.pop()
+            end += 1
+
+        value = prefix * HUNDRED
+        if end < n and tokens[end] in self.and_words:
+            end += 1
+            rest = self._below_hundred(tokens, end)
+            if rest is None:
+                return None
+        else:
+            rest = self._below_hundred(tokens, end)
+        if rest is not None:
+            value, end = value + rest[0], rest[1]
+        return value, end, tens_prefix
+
+    def parse(self, text: str) -> Optional[str]:
+        """
+        Parses a line that is a single spoken cardinal of at least two words
+
+        Args:
+            text: spoken form, e.g. "चार करोड़ इक्कीस लाख चार हज़ार चार सौ चार"
+
+        Returns: written form, e.g. "42104404", None when the line is not a cardinal the parser is sure about
+        """
+        tokens = text.split()
+        if len(tokens) < 2:
+            return None
+        n = len(tokens)
+        total, pos, previous = 0, 0, None
+        while pos < n:
+            if tokens[pos] in self.magnitudes:
+                coefficient, end = 1, pos
+            else:
+                group = self._group(tokens, pos)
+                if group is None:
+                    return None
+                coefficient, end, tens_prefix = group
+                if end == n:
+                    # the grammar writes hundreds prefixed by tens as four digits into the three digit hundreds
+                    # slot, e.g. "दो लाख पंद्रह सौ", leave those to it
+                    if tens_prefix and previous is not None:
+                        return None
+                    return str(total + coefficient)
+            magnitude = self.magnitudes.get(tokens[end])
+            if magnitude is None or (previous is not None and magnitude >= previous):
+                return None
+            total += coefficient * magnitude
+            previous, pos = magnitude, end + 1
+            if pos == n and coefficient >= HUNDRED and magnitude > THOUSAND:
+                # the grammar writes a trailing lakh or crore after hundreds apart, e.g. "दो सौ करोड़" as
+                # 20010000000, leave those to it
+                return None
+            if pos < n and tokens[pos] in self.and_words:
+                pos += 1
+                if pos == n:
+                    return None
+        return str(total)
+
+
+@lru_cache(maxsize=None)
+def get_cardinal_parser(package: str) -> CardinalParser:
+    """
+    Returns the cardinal parser of the fast engine for a language package, see FAST_ENGINE_PACKAGES
+    """
+    if package not in FAST_ENGINE_PACKAGES:
+        raise ValueError(f"The fast engine does not support language package: {package}")
+    return CardinalParser.from_package(package)
@@ -17,6 +17,7 @@ import pynini
 from pynini.lib import pynutil, utf8
 
 from inverse_text_normalization.en.data_loader_utils import get_abs_path
+from inverse_text_normalization.lexicon_registry import load_rows, load_string_file
 from inverse_text_normalization.en.graph_utils import (
     NEMO_DIGIT,
     NEMO_SIGMA,
@@ -56,23 +57,21 @@ class CardinalFst(GraphFst):
         # NEMO_NON_BREAKING_SPACE = u"\u00A0"
 
         english_digit_file = get_abs_path(data_path + 'numbers/digit.tsv')
-        with open(english_digit_file, encoding='utf-8') as f:
-            digits = f.readlines()
-        english_digits = ''.join([line.split()[-1] for line in digits])
+        english_digits = ''.join([row[-1] for row in load_rows(english_digit_file)])
         english_digits_with_zero = "0" + english_digits
         # # print(f'hindi digits is {hindi_digits}')
         ENGLISH_DIGIT = pynini.union(*english_digits).optimize()
         ENGLISH_DIGIT_WITH_ZERO = pynini.union(*english_digits_with_zero).optimize()
 
-        graph_zero = pynini.string_file(get_abs_path(data_path + "numbers/zero.tsv"))
+        graph_zero = load_string_file(get_abs_path(data_path + "numbers/zero.tsv"))
         #graph_tens = pynini.string_file(get_abs_path(data_path + "numbers/tens.tsv"))
-        graph_digit = pynini.string_file(get_abs_path(data_path + "numbers/digit.tsv"))
-        graph_multiples = pynini.string_file(get_abs_path(data_path + "numbers/multiples.tsv"))
-        graph_ties = pynini.string_file(get_abs_path(data_path + "numbers/ties.tsv"))
-        graph_chars = pynini.string_file(get_abs_path(data_path + "numbers/alphabets.tsv"))
-        graph_char_multiples = pynini.string_file(get_abs_path(data_path + "numbers/multiples_alphabets.tsv"))
+        graph_digit = load_string_file(get_abs_path(data_path + "numbers/digit.tsv"))
+        graph_multiples = load_string_file(get_abs_path(data_path + "numbers/multiples.tsv"))
+        graph_ties = load_string_file(get_abs_path(data_path + "numbers/ties.tsv"))
+        graph_chars = load_string_file(get_abs_path(data_path + "numbers/alphabets.tsv"))
+        graph_char_multiples = load_string_file(get_abs_path(data_path + "numbers/multiples_alphabets.tsv"))
         #graph_tens_en = pynini.string_file(get_abs_path(data_path + "numbers/tens-en.tsv"))
-        graph_teen = pynini.string_file(get_abs_path(data_path + "numbers/teen.tsv"))
+        graph_teen = load_string_file(get_abs_path(data_path + "numbers/teen.tsv"))
 
         graph_tens = pynini.union(graph_ties + delete_space + graph_digit, graph_teen)
 
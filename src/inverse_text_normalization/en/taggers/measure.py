@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from inverse_text_normalization.en.data_loader_utils import get_abs_path
+from inverse_text_normalization.lexicon_registry import load_string_file
 from inverse_text_normalization.en.graph_utils import (
     NEMO_SIGMA,
     GraphFst,
@@ -47,7 +48,7 @@ class MeasureFst(GraphFst):
 
         cardinal_graph = cardinal.graph_no_exception
 
-        graph_unit = pynini.string_file(get_abs_path("data/measurements.tsv"))
+        graph_unit = load_string_file(get_abs_path("data/measurements.tsv"))
         graph_unit_singular = pynini.invert(graph_unit)  # singular -> abbr
         graph_unit_plural = get_singulars(graph_unit_singular)  # plural -> abbr
 
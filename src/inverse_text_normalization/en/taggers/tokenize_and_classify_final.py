@@ -29,12 +29,16 @@ class ClassifyFinalFst(GraphFst):
     """
     Final FST that tokenizes an entire sentence
         e.g. its twelve thirty now. -> tokens { name: "its" } tokens { time { hours: "12" minutes: "30" } } tokens { name: "now" } tokens { name: "." pause_length: "PAUSE_LONG phrase_break: true type: PUNCT" }
+
+    Args:
+        classes: semiotic classes to tag, see ClassifyFst
+        cache: optional grammar_cache.GrammarCache of the class grammars
     """
 
-    def __init__(self):
+    def __init__(self, classes=None, cache=None):
         super().__init__(name="tokenize_and_classify_final", kind="classify")
 
-        classify = ClassifyFst().fst
+        classify = ClassifyFst(classes, cache).fst
         punct = PunctuationFst().fst
         token = pynutil.insert("tokens { ") + classify + pynutil.insert(" }")
         token_plus_punct = (
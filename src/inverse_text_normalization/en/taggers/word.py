@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from inverse_text_normalization.en.data_loader_utils import get_abs_path
+from inverse_text_normalization.lexicon_registry import load_string_file
 from inverse_text_normalization.en.graph_utils import NEMO_NOT_SPACE, GraphFst, convert_space
 
 try:
@@ -33,7 +34,7 @@ class WordFst(GraphFst):
     def __init__(self):
         super().__init__(name="word", kind="classify")
 
-        exceptions = pynini.string_file(get_abs_path("data/sentence_boundary_exceptions.txt"))
+        exceptions = load_string_file(get_abs_path("data/sentence_boundary_exceptions.txt"))
         word = (
             pynutil.insert("name: \"")
             + (pynini.closure(pynutil.add_weight(NEMO_NOT_SPACE, weight=0.1), 1) | convert_space(exceptions))
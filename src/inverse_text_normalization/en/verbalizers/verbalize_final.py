@@ -32,11 +32,15 @@ class VerbalizeFinalFst(GraphFst):
     Finite state transducer that verbalizes an entire sentence
         e.g. tokens { name: "its" } tokens { time { hours: "12" minutes: "30" } } tokens { name: "now" } tokens { name: "." pause_length: "PAUSE_LONG phrase_break: true type: PUNCT" }
             -> its 12:30 now .
+
+    Args:
+        classes: semiotic classes to verbalize, see VerbalizeFst
+        cache: optional grammar_cache.GrammarCache of the class grammars
     """
 
-    def __init__(self):
+    def __init__(self, classes=None, cache=None):
         super().__init__(name="verbalize_final", kind="verbalize")
-        verbalize = VerbalizeFst().fst
+        verbalize = VerbalizeFst(classes, cache).fst
         punct = PunctuationFst().fst
         word = WordFst().fst
         types = verbalize | word | punct
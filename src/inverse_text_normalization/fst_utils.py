@@ -0,0 +1,158 @@
+import os
+import tempfile
+from typing import Dict, FrozenSet, Iterable, Optional, Tuple
+
+try:
+    import pynini
+
+    PYNINI_AVAILABLE = True
+except (ModuleNotFoundError, ImportError):
+    PYNINI_AVAILABLE = False
+
+SEMIOTIC_CLASSES = ('whitelist', 'time', 'date', 'decimal', 'measure', 'cardinal', 'ordinal', 'money')
+
+# directory of the grammars written by build_grammars.py, get_grammars of the language packages loads the top
+# level grammars from it while they are up to date instead of composing them
+GRAMMAR_CACHE_ENV = 'ITN_GRAMMAR_CACHE'
+
+# (language package, semiotic classes) -> (tagger fst, verbalizer fst) compiled elsewhere, e.g. by warmup.py,
+# taken over by the get_grammars function of the language package instead of building them again
+_preloaded_grammars = {}
+
+
+def select_classes(classes: Optional[Iterable[str]], default: Iterable[str]) -> FrozenSet[str]:
+    """
+    Resolves the semiotic classes a grammar is built for. Words outside the selected classes are tagged as plain
+    words, so a deployment that only needs numbers can build a much smaller grammar.
+
+    Args:
+        classes: requested classes, None for the default classes of the language
+        default: classes built when none are requested
+
+    Returns: selected classes
+    """
+    if classes is None:
+        return frozenset(default)
+    classes = frozenset(classes)
+    unknown = classes.difference(SEMIOTIC_CLASSES)
+    if unknown or not classes:
+        raise ValueError(f"Select semiotic classes among {SEMIOTIC_CLASSES}, got {sorted(classes)}")
+    return classes
+
+
+def prepare_for_composition(fst: 'pynini.Fst') -> 'pynini.Fst':
+    """
+    Prepares a compiled grammar once at load time for being the right hand side of `input @ grammar`.
+    Arcs are sorted by input label, so the composition matcher binary searches the arcs of every grammar
+    state instead of scanning them for each input symbol.
+
+    Args:
+        fst: grammar fst, modified in place
+
+    Returns: the same fst
+    """
+    return fst.arcsort(sort_type="ilabel")
+
+
+def shortest_string(lattice: 'pynini.Fst', prune_threshold: float = None) -> str:
+    """
+    Returns the output string of the single best path of a lattice.
+    For a single path OpenFst runs a plain shortest distance search, `unique` only matters for n-best
+    extraction and is left off.
+
+    Args:
+        lattice: tagged or verbalized lattice
+        prune_threshold: optional weight threshold, paths worse than the best one by more than this are
+            pruned before the search. The best path is never pruned, so outputs do not change.
+
+    Returns: best output string
+    """
+    if prune_threshold is not None:
+        lattice = pynini.prune(lattice, weight=prune_threshold)
+    return pynini.shortestpath(lattice, nshortest=1, unique=False).string()
+
+
+def fsts_to_far_bytes(fsts: Dict[str, 'pynini.Fst']) -> bytes:
+    """
+    Serializes fsts into the bytes of a FAR archive, e.g. to pass compiled grammars between processes
+
+    Args:
+        fsts: name -> fst
+
+    Returns: FAR file content
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'grammars.far')
+        far = pynini.Far(path, mode='w', arc_type='standard', far_type='default')
+        for name in sorted(fsts):
+            far[name] = fsts[name]
+        far.close()
+        with open(path, 'rb') as f:
+            return f.read()
+
+
+def far_bytes_to_fsts(data: bytes) -> Dict[str, 'pynini.Fst']:
+    """
+    Reads the fsts of FAR file content written by fsts_to_far_bytes
+
+    Args:
+        data: FAR file content
+
+    Returns: name -> fst
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'grammars.far')
+        with open(path, 'wb') as f:
+            f.write(data)
+        far = pynini.Far(path, mode='r', arc_type='standard', far_type='default')
+        fsts = {}
+        while not far.done():
+            fsts[far.get_key()] = far.get_fst()
+            far.next()
+        far.close()
+        return fsts
+
+
+def preload_grammars(package: str, classes: FrozenSet[str], tagger: 'pynini.Fst', verbalizer: 'pynini.Fst'):
+    """
+    Hands compiled grammars to a language package, its get_grammars(classes) uses them instead of building them
+
+    Args:
+        package: language package, e.g. 'hi'
+        classes: semiotic classes the grammars were built for
+        tagger: ClassifyFinalFst fst
+        verbalizer: VerbalizeFinalFst fst
+    """
+    _preloaded_grammars[(package, frozenset(classes))] = tagger, verbalizer
+
+
+def pop_preloaded_grammars(package: str, classes: FrozenSet[str]) -> Optional[Tuple['pynini.Fst', 'pynini.Fst']]:
+    """
+    Returns and forgets the grammars preloaded for a language package and class selection, None if there are none
+    """
+    return _preloaded_grammars.pop((package, classes), None)
+
+
+def load_cached_grammars(package: str, classes: FrozenSet[str]) -> Optional[Tuple['pynini.Fst', 'pynini.Fst']]:
+    """
+    Returns the tagger and verbalizer build_grammars.py stored for a language package and class selection in the
+    ITN_GRAMMAR_CACHE directory, None if the variable is not set or the grammars are not cached, were built for
+    other classes or any of the data files and modules they were built from changed since
+
+    Args:
+        package: language package, e.g. 'hi'
+        classes: semiotic classes
+
+    Returns: tagger fst, verbalizer fst
+    """
+    cache_dir = os.environ.get(GRAMMAR_CACHE_ENV)
+    if not cache_dir:
+        return None
+    from inverse_text_normalization.grammar_cache import GrammarCache
+
+    cache = GrammarCache(cache_dir, package)
+    tagger = cache.load_final('classify', 'tokenize_and_classify_final', classes)
+    verbalizer = cache.load_final('verbalize', 'verbalize_final', classes)
+    if tagger is None or verbalizer is None:
+        return None
+    return tagger, verbalizer
@@ -0,0 +1,284 @@
+import ast
+import hashlib
+import importlib.util
+import json
+import os
+import sys
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    import pynini
+
+    PYNINI_AVAILABLE = True
+except (ModuleNotFoundError, ImportError):
+    PYNINI_AVAILABLE = False
+
+'''
+Incremental builds of the inverse text normalization grammars
+
+Every class grammar of a ClassifyFst or VerbalizeFst (cardinal, measure, whitelist, ...) is a component. While a
+component is built, the data files it reads through data_loader_utils.get_abs_path are recorded; together with the
+source files of its module and of the package modules that module imports, and with the inputs of the components
+passed to its constructor, they are the inputs of the component. A GrammarCache stores each compiled component as
+a FAR file with the hashes of its inputs, so that after editing e.g. whitelist.tsv only the whitelist component is
+compiled again before the top level grammars are unioned and optimized. The top level tagger and verbalizer are
+stored the same way, with the semiotic classes they were built for, and get_grammars of the language packages loads
+them instead of composing the grammars when ITN_GRAMMAR_CACHE names the cache directory, see fst_utils.py.
+
+Example usage:
+python -m inverse_text_normalization.build_grammars --langs hi ta --cache_dir grammar_cache
+'''
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# one build report line, changed_inputs lists why a rebuilt component was rebuilt
+ComponentBuild = namedtuple('ComponentBuild', 'component rebuilt seconds changed_inputs')
+
+# sets collecting the files read by the components being built, innermost last
+_recorders = []
+# files read while no component was being built, e.g. by graph_utils at import time
+_import_time_inputs = set()
+
+
+def record_input(path: str):
+    """
+    Records a data file read by the grammars, called by data_loader_utils.get_abs_path
+
+    Args:
+        path: file path
+    """
+    path = os.path.abspath(path)
+    if not _recorders:
+        _import_time_inputs.add(path)
+    for recorder in _recorders:
+        recorder.add(path)
+
+
+@contextmanager
+def recording_inputs():
+    """
+    Collects the data files recorded while the block runs into the yielded set
+    """
+    recorder = set()
+    _recorders.append(recorder)
+    try:
+        yield recorder
+    finally:
+        _recorders.pop()
+
+
+def _module_file(module_name: str) -> Optional[str]:
+    try:
+        spec = importlib.util.find_spec(module_name)
+    except (ModuleNotFoundError, ValueError):
+        return None
+    return spec.origin if spec is not None and spec.origin and spec.origin.endswith('.py') else None
+
+
+def module_sources(module_name: str) -> Set[str]:
+    """
+    Returns the source file of a module and of the inverse_text_normalization modules it imports, recursively
+    """
+    sources, pending = set(), [module_name]
+    while pending:
+        path = _module_file(pending.pop())
+        if path is None or path in sources:
+            continue
+        sources.add(path)
+        with open(path, encoding='utf-8') as f:
+            tree = ast.parse(f.read())
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                pending += [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                pending.append(node.module)
+                pending += [f'{node.module}.{alias.name}' for alias in node.names]
+        pending = [name for name in pending if name.startswith('inverse_text_normalization.')]
+    return sources
+
+
+def package_sources(module_name: str, package: str) -> Set[str]:
+    """
+    Returns the files a top level grammar module depends on besides its class grammars: its module_sources, every
+    imported module of its language package, as modules imported through exec are not found by module_sources, and
+    the data files read at import time
+    """
+    prefix = f'inverse_text_normalization.{package}.'
+    sources = {module.__file__ for name, module in list(sys.modules.items())
+               if name.startswith(prefix) and getattr(module, '__file__', None)}
+    return sources | module_sources(module_name) | _import_time_inputs
+
+
+class GrammarCache:
+    """
+    Compiled grammar components of one language package. Each component is stored as a FAR file, manifest.json
+    keeps the hashes of the files it was built from. Components whose inputs all hash the same are loaded from
+    the cache, the others are built and stored again.
+
+    Args:
+        cache_dir: cache directory, shared by all language packages
+        package: language package, e.g. 'hi'
+    """
+
+    def __init__(self, cache_dir: str, package: str):
+        if not PYNINI_AVAILABLE:
+            raise ImportError('pynini is required to build or load cached grammars')
+        self.directory = os.path.join(cache_dir, package)
+        self.manifest_path = os.path.join(self.directory, 'manifest.json')
+        self.manifest = {}
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, encoding='utf-8') as f:
+                self.manifest = json.load(f)
+        if self.manifest.get('pynini') != pynini.__version__:
+            self.manifest = {'pynini': pynini.__version__, 'components': {}}
+        self.report = []
+        self._hashes = {}
+
+    def _hash(self, path: str) -> Optional[str]:
+        if path not in self._hashes:
+            if os.path.exists(path):
+                with open(path, 'rb') as f:
+                    self._hashes[path] = hashlib.sha256(f.read()).hexdigest()
+            else:
+                self._hashes[path] = None
+        return self._hashes[path]
+
+    def _far_path(self, component: str) -> str:
+        return os.path.join(self.directory, component + '.far')
+
+    def changed_inputs(self, component: str) -> List[str]:
+        """
+        Returns the inputs of a cached component that changed since it was built, ['not cached'] if there is no
+        usable cached version
+        """
+        entry = self.manifest['components'].get(component)
+        if entry is None or not os.path.exists(self._far_path(component)):
+            return ['not cached']
+        return [relative_path for relative_path, digest in entry['inputs'].items()
+                if self._hash(os.path.join(PACKAGE_DIR, relative_path)) != digest]
+
+    def component_inputs(self, component: str) -> Set[str]:
+        """
+        Returns the input files a cached component was built from
+        """
+        entry = self.manifest['components'].get(component, {'inputs': {}})
+        return {os.path.join(PACKAGE_DIR, relative_path) for relative_path in entry['inputs']}
+
+    def _load(self, component: str) -> 'pynini.Fst':
+        far = pynini.Far(self._far_path(component), mode='r', arc_type='standard', far_type='default')
+        return far.get_fst()
+
+    def _store(self, component: str, fst: 'pynini.Fst', inputs: Iterable[str], seconds: float,
+               classes: Iterable[str] = None):
+        far_path = self._far_path(component)
+        os.makedirs(os.path.dirname(far_path), exist_ok=True)
+        far = pynini.Far(far_path + '.tmp', mode='w', arc_type='standard', far_type='default')
+        far[component.replace('/', '_')] = fst
+        far.close()
+        os.replace(far_path + '.tmp', far_path)
+
+        self.manifest['components'][component] = {
+            'inputs': {os.path.relpath(path, PACKAGE_DIR): self._hash(path) for path in sorted(inputs)},
+            'build_seconds': round(seconds, 3),
+        }
+        if classes is not None:
+            self.manifest['components'][component]['classes'] = sorted(classes)
+        with open(self.manifest_path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, indent=1, ensure_ascii=False)
+        os.replace(self.manifest_path + '.tmp', self.manifest_path)
+
+    def fetch(self, component: str, build: Callable[[], Tuple['pynini.Fst', Set[str]]]) -> 'pynini.Fst':
+        """
+        Returns a compiled component, from the cache when its inputs did not change
+
+        Args:
+            component: component name, e.g. 'classify/cardinal'
+            build: builds the component, returns its fst and input files
+
+        Returns: component fst
+        """
+        start = time.perf_counter()
+        changed = self.changed_inputs(component)
+        if not changed:
+            fst = self._load(component)
+            self.report.append(ComponentBuild(component, False, time.perf_counter() - start, []))
+            return fst
+        fst, inputs = build()
+        seconds = time.perf_counter() - start
+        self._store(component, fst, inputs, seconds)
+        self.report.append(ComponentBuild(component, True, seconds, changed))
+        return fst
+
+    def store_final(self, kind: str, name: str, classes: Iterable[str], fst: 'pynini.Fst', inputs: Iterable[str],
+                    seconds: float):
+        """
+        Stores a top level grammar as <kind>/<name>.far
+
+        Args:
+            kind: 'classify' or 'verbalize'
+            name: grammar name, e.g. 'tokenize_and_classify_final'
+            classes: semiotic classes the grammar was built for
+            fst: grammar fst
+            inputs: every file the grammar was built from
+            seconds: build time
+        """
+        self._store(f'{kind}/{name}', fst, inputs, seconds, classes)
+
+    def load_final(self, kind: str, name: str, classes: Iterable[str]) -> Optional['pynini.Fst']:
+        """
+        Returns a top level grammar stored by store_final, None if it is not cached, was built for other classes or
+        any of its inputs changed since
+        """
+        component = f'{kind}/{name}'
+        entry = self.manifest['components'].get(component)
+        if entry is None or entry.get('classes') != sorted(classes) or self.changed_inputs(component):
+            return None
+        return self._load(component)
+
+
+class ComponentBuilder:
+    """
+    Builds the class grammars of a ClassifyFst or VerbalizeFst. A grammar object is built once, after the objects
+    passed to its constructor, and the files it reads are recorded. With a cache, grammars whose inputs did not
+    change are loaded from the cache and their objects are never built.
+
+    Args:
+        kind: 'classify' or 'verbalize'
+        constructors: class name -> grammar class
+        dependencies: class name -> class names of the grammars its constructor takes
+        cache: optional GrammarCache
+    """
+
+    def __init__(self, kind: str, constructors: Dict[str, Callable], dependencies: Dict[str, Tuple[str, ...]] = None,
+                 cache: GrammarCache = None):
+        self.kind = kind
+        self.constructors = constructors
+        self.dependencies = dependencies or {}
+        self.cache = cache
+        self.objects = {}
+        self.inputs = {}
+
+    def build(self, name: str):
+        """
+        Returns the grammar object of a class, building it the first time
+        """
+        if name not in self.objects:
+            arguments = [self.build(dependency) for dependency in self.dependencies.get(name, ())]
+            with recording_inputs() as inputs:
+                self.objects[name] = self.constructors[name](*arguments)
+            inputs |= module_sources(self.constructors[name].__module__) | _import_time_inputs
+            for dependency in self.dependencies.get(name, ()):
+                inputs |= self.inputs[dependency]
+            self.inputs[name] = inputs
+        return self.objects[name]
+
+    def fst(self, name: str) -> 'pynini.Fst':
+        """
+        Returns the compiled grammar of a class
+        """
+        if self.cache is None:
+            return self.build(name).fst
+        return self.cache.fetch(f'{self.kind}/{name}', lambda: (self.build(name).fst, self.inputs[name]))
@@ -23,6 +23,7 @@ data_path = 'data/'
 try:
     import pynini
     from inverse_text_normalization.gu.data_loader_utils import get_abs_path
+    from inverse_text_normalization.lexicon_registry import load_string_file
     from pynini import Far
     from pynini.examples import plurals
     from pynini.lib import byte, pynutil, utf8
@@ -50,7 +51,7 @@ try:
     insert_space = pynutil.insert(" ")
     delete_extra_space = pynini.cross(pynini.closure(NEMO_WHITE_SPACE, 1), " ")
 
-    suppletive = pynini.string_file(get_abs_path(data_path + 'suppletive.tsv'))
+    suppletive = load_string_file(get_abs_path(data_path + 'suppletive.tsv'))
     # _v = pynini.union("a", "e", "i", "o", "u")
     _c = pynini.union(
         "b", "c", "d", "f", "g", "h", "j", "k", "l", "m", "n", "p", "q", "r", "s", "t", "v", "w", "x", "y", "z"
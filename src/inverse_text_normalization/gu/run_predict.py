@@ -13,15 +13,26 @@
 # limitations under the License.
 
 from argparse import ArgumentParser
+from functools import partial
 from typing import List
 
 from inverse_text_normalization.gu.inverse_normalize import INVERSE_NORMALIZERS
+from inverse_text_normalization import post_processing
+from inverse_text_normalization.post_processing import indian_format, post_process_sentence
 # from nemo_text_processing.inverse_text_normalization.inverse_normalize import InverseNormalizer
 
 '''
 Runs denormalization prediction on text data
 '''
 
+CURRENCY_HANDLED = '$₹'
+# 0, 00 and 000 are returned unchanged
+KEEP_SHORT_ZEROS = True
+
+# the former per-language helper, word level
+remove_starting_zeros = partial(post_processing.remove_starting_zeros, currency_signs=CURRENCY_HANDLED,
+                                keep_short_zeros=KEEP_SHORT_ZEROS)
+
 
 def load_file(file_path: str) -> List[str]:
     """
@@ -65,61 +76,12 @@ def parse_args():
     return parser.parse_args()
 
 
-def remove_starting_zeros(word, hindi_digits_with_zero):
-    currency_handled = ['$', '₹']
-    currency = ''
-    if word[0] in currency_handled:
-        currency = word[0]
-        word = word[1:]
-
-    if word == "0" or word == "00" or word == "000":
-        # print(word)
-        return word
-        
-    if all(v == '0' for v in word): # all the digits in num are zero eg: "00000000"
-        word = ''
-
-    elif word[0] in hindi_digits_with_zero and len(word) > 1:
-        if all([digit == "0" for digit in list(word)]):
-            return "1" + word
-        if '.' in word:
-            if len(word.split('.')[0]) == 1:
-                return word
-        pos_non_zero_nums = [pos for pos, word in enumerate(list(word)) if word != "0"]
-        # # print(pos_non_zero_nums, word)
-        first_non_zero_num = min(pos_non_zero_nums)
-        word = word[first_non_zero_num:]
-    if currency:
-        word = currency + ' ' + word
-    return word
-
-
-def indian_format(word, hindi_digits_with_zero):
-    if word[0] in hindi_digits_with_zero:
-        s, *d = str(word).partition(".")
-        # getting [num_before_decimal_point, decimal_point, num_after_decimal_point]
-        r = ",".join([s[x - 2:x] for x in range(-3, -len(s), -2)][::-1] + [s[-3:]])
-        # adding commas after every 2 digits after the last 3 digits
-        word = "".join([r] + d)  # joining decimal points as is
-        return word
-    else:
-        return word
-
-
-def inverse_normalize_text(text_list, verbose=False):
-
+def inverse_normalize_text(text_list, verbose=False, format_lang=None, classes=None, tenant=None):
     inverse_normalizer = INVERSE_NORMALIZERS['nemo']
-    hindi_digits_with_zero = '0123456789'
-    inverse_normalizer_prediction = inverse_normalizer(text_list, verbose=verbose)
-    astr_list = []
-    comma_sep_num_list = []
-    inverse_normalizer_prediction = [sent.replace('\r', '') for sent in inverse_normalizer_prediction]
-    for sent in inverse_normalizer_prediction:
-        trimmed_sent = ' '.join(
-            [remove_starting_zeros(word, hindi_digits_with_zero) for word in sent.split(' ')])
-        astr_list.append(trimmed_sent)
-
-    return astr_list
+    inverse_normalizer_prediction = inverse_normalizer(text_list, verbose=verbose, classes=classes, tenant=tenant)
+    return [post_process_sentence(sent, currency_signs=CURRENCY_HANDLED, format_lang=format_lang,
+                                  keep_short_zeros=KEEP_SHORT_ZEROS)
+            for sent in inverse_normalizer_prediction]
 
 
 if __name__ == "__main__":
@@ -128,38 +90,11 @@ if __name__ == "__main__":
 
     inverse_normalizer = INVERSE_NORMALIZERS[args.inverse_normalizer]
 
-    # print("Loading data: " + file_path)
     data = load_file(file_path)
-
-    # updated_sentences = []
-    # for sent in data:
-    #     if "हज़ार करोड़" in sent:
-    #         sent = sent.replace("हज़ार करोड़", "हज़ार करोड")
-    #     updated_sentences.append(sent)
-    #
-    # data = updated_sentences
-
-    hindi_digits_with_zero = '0123456789'
-
-    # # print("- Data: " + str(len(data)) + " sentences")
     inverse_normalizer_prediction = inverse_normalizer(data, verbose=False)
-
-    astr_list = []
-    comma_sep_num_list = []
-    # print(inverse_normalizer_prediction)
-    # print('-' * 100)
-    inverse_normalizer_prediction = [sent.replace('\r', '') for sent in inverse_normalizer_prediction]
-    # print(inverse_normalizer_prediction)
-    for sent in inverse_normalizer_prediction:
-        trimmed_sent = ' '.join([remove_starting_zeros(word, hindi_digits_with_zero) for word in sent.split(' ')])
-        astr_list.append(trimmed_sent)
-        comma_sep_num_list.append(
-            ' '.join([indian_format(word, hindi_digits_with_zero) for word in trimmed_sent.split(' ')]))
-
-    # print('Trimmed output')
-    # print(astr_list)
-    # print('-' * 100)
-    # print('Indian Format nums output')
-    # print(comma_sep_num_list)
+    comma_sep_num_list = [
+        post_process_sentence(sent, currency_signs=CURRENCY_HANDLED, format_lang='hi', separator=',',
+                              keep_short_zeros=KEEP_SHORT_ZEROS)
+        for sent in inverse_normalizer_prediction
+    ]
     write_file(args.output, comma_sep_num_list)
-    # # print(f"- Normalized. Writing out to {args.output}")
@@ -17,6 +17,7 @@ import pynini
 from pynini.lib import pynutil, utf8
 
 from inverse_text_normalization.gu.data_loader_utils import get_abs_path
+from inverse_text_normalization.lexicon_registry import load_rows, load_string_file
 from inverse_text_normalization.gu.graph_utils import (
     NEMO_DIGIT,
     NEMO_SIGMA,
@@ -29,6 +30,13 @@ from inverse_text_normalization.gu.utils import num_to_word
 # data_path = f'data/{LANG}_data/'
 data_path = 'data/'
 
+# place value words of the cardinal grammar, also read by inverse_text_normalization.cardinal_parser
+HUNDREDS = ("સો", "સ્સો", "હન્ડ્રેડ", "હુંદ્રેડ", "હંડ્રેડ", "હુંડ્રેડ", "સૌ")
+THOUSANDS = ("થાઉઝન્ડ", "હજાર", "થૌસંદ", "થૌઝન્ડ", "થાૌઝન્ડ", "થૌસન્ડ")
+LAKHS = ("લાખ",)
+CRORES = ("કરોડ઼", "કરોડ")
+AND_WORDS = ("એન્ડ", "ને")
+
 def get_alternate_spellings(text):
     return
 
@@ -59,28 +67,26 @@ class CardinalFst(GraphFst):
         # NEMO_NON_BREAKING_SPACE = u"\u00A0"
 
         hindi_digit_file = get_abs_path(data_path + 'numbers/digit.tsv')
-        with open(hindi_digit_file, encoding='utf-8') as f:
-            digits = f.readlines()
-        hindi_digits = ''.join([line.split()[-1] for line in digits])
+        hindi_digits = ''.join([row[-1] for row in load_rows(hindi_digit_file)])
         hindi_digits_with_zero = "0" + hindi_digits
         # # print(f'hindi digits is {hindi_digits}')
         HINDI_DIGIT = pynini.union(*hindi_digits).optimize()
         HINDI_DIGIT_WITH_ZERO = pynini.union(*hindi_digits_with_zero).optimize()
 
-        graph_zero = pynini.string_file(get_abs_path(data_path + "numbers/zero.tsv"))
-        graph_tens = pynini.string_file(get_abs_path(data_path + "numbers/tens.tsv"))
-        graph_digit = pynini.string_file(get_abs_path(data_path + "numbers/digit.tsv"))
-        graph_ties = pynini.string_file(get_abs_path(data_path + "numbers/ties.tsv"))
-        graph_chars = pynini.string_file(get_abs_path(data_path + "numbers/alphabets.tsv"))
-        graph_multiples = pynini.string_file(get_abs_path(data_path + "numbers/multiples.tsv"))
-        graph_tens_en = pynini.string_file(get_abs_path(data_path + "numbers/tens_en.tsv"))
-        graph_char_multiples = pynini.string_file(get_abs_path(data_path + "numbers/multiples_alphabets.tsv"))
-
-        cents = pynini.accep("સો") | pynini.accep("સ્સો") | pynini.accep("હન્ડ્રેડ")  | pynini.accep("હુંદ્રેડ")  | pynini.accep("હંડ્રેડ")  | pynini.accep("હુંડ્રેડ")  | pynini.accep("સૌ")
-        thousands = pynini.accep("થાઉઝન્ડ") | pynini.accep("હજાર") | pynini.accep("થૌસંદ") | pynini.accep("થૌઝન્ડ") | pynini.accep("થાૌઝન્ડ") | pynini.accep("થૌસન્ડ")
-        lakhs = pynini.accep("લાખ")
-        crores = pynini.accep("કરોડ઼") | pynini.accep("કરોડ")
-        and_ = pynini.accep("એન્ડ") | pynini.accep("ને")
+        graph_zero = load_string_file(get_abs_path(data_path + "numbers/zero.tsv"))
+        graph_tens = load_string_file(get_abs_path(data_path + "numbers/tens.tsv"))
+        graph_digit = load_string_file(get_abs_path(data_path + "numbers/digit.tsv"))
+        graph_ties = load_string_file(get_abs_path(data_path + "numbers/ties.tsv"))
+        graph_chars = load_string_file(get_abs_path(data_path + "numbers/alphabets.tsv"))
+        graph_multiples = load_string_file(get_abs_path(data_path + "numbers/multiples.tsv"))
+        graph_tens_en = load_string_file(get_abs_path(data_path + "numbers/tens_en.tsv"))
+        graph_char_multiples = load_string_file(get_abs_path(data_path + "numbers/multiples_alphabets.tsv"))
+
+        cents = pynini.union(*HUNDREDS)
+        thousands = pynini.union(*THOUSANDS)
+        lakhs = pynini.union(*LAKHS)
+        crores = pynini.union(*CRORES)
+        and_ = pynini.union(*AND_WORDS)
         
         graph_hundred = pynini.cross("સો", "100") | pynini.cross("સ્સો", "100") | pynini.cross("હન્ડ્રેડ", "100") | pynini.cross("હુંદ્રેડ", "100") | pynini.cross("હંડ્રેડ", "100") | pynini.cross("હુંડ્રેડ", "100") | pynini.cross("સૌ", "100")
         graph_thousand  = pynini.cross("થાઉઝન્ડ", "1000") | pynini.cross("હજાર", "1000") | pynini.cross("થૌસંદ", "1000")  | pynini.cross("થૌઝન્ડ", "1000")  | pynini.cross("થાૌઝન્ડ", "1000")  | pynini.cross("થૌસન્ડ", "1000")
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from inverse_text_normalization.gu.data_loader_utils import get_abs_path
+from inverse_text_normalization.lexicon_registry import load_string_file
 from inverse_text_normalization.gu.graph_utils import (
     NEMO_DIGIT,
     GraphFst,
@@ -66,8 +67,8 @@ class DecimalFst(GraphFst):
             cardinal.graph_hundred_component_at_least_one_none_zero_digit
         )
 
-        graph_decimal = pynini.string_file(get_abs_path(data_path+"numbers/digit.tsv"))
-        graph_decimal |= pynini.string_file(get_abs_path(data_path +"numbers/zero.tsv")) | pynini.cross("શૂન્ય", "0")
+        graph_decimal = load_string_file(get_abs_path(data_path+"numbers/digit.tsv"))
+        graph_decimal |= load_string_file(get_abs_path(data_path +"numbers/zero.tsv")) | pynini.cross("શૂન્ય", "0")
 
         graph_decimal = pynini.closure(graph_decimal + delete_space) + graph_decimal
         self.graph = graph_decimal
@@ -18,6 +18,7 @@ import pynini
 from pynini.lib import pynutil, utf8
 
 from inverse_text_normalization.hi.data_loader_utils import get_abs_path
+from inverse_text_normalization.lexicon_registry import load_rows, load_string_file
 from inverse_text_normalization.hi.graph_utils import (
     NEMO_DIGIT,
     NEMO_SIGMA,
@@ -30,6 +31,13 @@ from inverse_text_normalization.hi.utils import num_to_word
 # data_path = f'data/{LANG}_data/'
 data_path = 'data/'
 
+# place value words of the cardinal grammar, also read by inverse_text_normalization.cardinal_parser
+HUNDREDS = ("सौ", "हंड्रेड", "हन्ड्रड")
+THOUSANDS = ("थाउज़न्ड", "हज़ार", "थाउज़ेंड", "हजार", "थाउजेंड")
+LAKHS = ("लाख", "लैक", "लेक", "लाक")
+CRORES = ("करोड़", "क्रोर")
+AND_WORDS = ("एंड",)
+
 try:
     import pynini
     from pynini.lib import pynutil
@@ -57,29 +65,27 @@ class CardinalFst(GraphFst):
         # NEMO_NON_BREAKING_SPACE = u"\u00A0"
 
         hindi_digit_file = get_abs_path(data_path + 'numbers/digit.tsv')
-        with open(hindi_digit_file, encoding='utf-8') as f:
-            digits = f.readlines()
-        hindi_digits = ''.join([line.split()[-1] for line in digits])
+        hindi_digits = ''.join([row[-1] for row in load_rows(hindi_digit_file)])
         hindi_digits_with_zero = "0" + hindi_digits
         # # print(f'hindi digits is {hindi_digits}')
         HINDI_DIGIT = pynini.union(*hindi_digits).optimize()
         HINDI_DIGIT_WITH_ZERO = pynini.union(*hindi_digits_with_zero).optimize()
 
-        graph_zero = pynini.string_file(get_abs_path(data_path + "numbers/zero.tsv"))
-        graph_tens = pynini.string_file(get_abs_path(data_path + "numbers/tens.tsv"))
-        graph_digit = pynini.string_file(get_abs_path(data_path + "numbers/digit.tsv"))
-        graph_multiples = pynini.string_file(get_abs_path(data_path + "numbers/multiples.tsv"))
-        graph_ties = pynini.string_file(get_abs_path(data_path + "numbers/ties.tsv"))
-        graph_chars = pynini.string_file(get_abs_path(data_path + "numbers/alphabets.tsv"))
-        graph_char_multiples = pynini.string_file(get_abs_path(data_path + "numbers/multiples_alphabets.tsv"))
-        graph_tens_en = pynini.string_file(get_abs_path(data_path + "numbers/tens-en.tsv"))
-
-        cents = pynini.accep("सौ") | pynini.accep("हंड्रेड") | pynini.accep("हन्ड्रड")
-        thousands = pynini.accep("थाउज़न्ड") | pynini.accep("हज़ार") | pynini.accep("थाउज़ेंड") | pynini.accep("हजार") | pynini.accep("थाउजेंड")
-        lakhs = pynini.accep("लाख") | pynini.accep("लैक") | pynini.accep("लेक") | pynini.accep("लाक")
-        crores = pynini.accep("करोड़") | pynini.accep("क्रोर")
-
-        del_And = pynutil.delete(pynini.closure(pynini.accep("एंड"), 1 ,1 ))
+        graph_zero = load_string_file(get_abs_path(data_path + "numbers/zero.tsv"))
+        graph_tens = load_string_file(get_abs_path(data_path + "numbers/tens.tsv"))
+        graph_digit = load_string_file(get_abs_path(data_path + "numbers/digit.tsv"))
+        graph_multiples = load_string_file(get_abs_path(data_path + "numbers/multiples.tsv"))
+        graph_ties = load_string_file(get_abs_path(data_path + "numbers/ties.tsv"))
+        graph_chars = load_string_file(get_abs_path(data_path + "numbers/alphabets.tsv"))
+        graph_char_multiples = load_string_file(get_abs_path(data_path + "numbers/multiples_alphabets.tsv"))
+        graph_tens_en = load_string_file(get_abs_path(data_path + "numbers/tens-en.tsv"))
+
+        cents = pynini.union(*HUNDREDS)
+        thousands = pynini.union(*THOUSANDS)
+        lakhs = pynini.union(*LAKHS)
+        crores = pynini.union(*CRORES)
+
+        del_And = pynutil.delete(pynini.union(*AND_WORDS))
         
         graph_hundred = pynini.cross("सौ", "100") | pynini.cross("हंड्रेड", "100") | pynini.cross("हन्ड्रड", "100")
         graph_thousand  = pynini.cross("हज़ार", "1000") | pynini.cross("थाउज़न्ड", "1000") | pynini.cross("थाउज़ेंड", "1000") | pynini.cross("थाउजेंड", "1000") | pynini.cross("हजार", "1000")
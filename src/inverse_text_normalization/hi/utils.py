@@ -14,11 +14,8 @@
 
 from typing import Union
 
-import inflect
-
-_inflect = inflect.engine()
-
 from inverse_text_normalization.hi.data_loader_utils import get_abs_path
+from inverse_text_normalization.lexicon_registry import load_mapping
 
 data_path = 'data/'
 def num_to_word(x: Union[str, int]):
@@ -33,11 +30,7 @@ def num_to_word(x: Union[str, int]):
     if isinstance(x, int):
         x = str(x)
         # x = _inflect.number_to_words(str(x)).replace("-", " ").replace(",", "")
-        with open(get_abs_path(data_path + "numbers/digit.tsv"), encoding="utf-8") as f:
-            lines = f.readlines()
-        for line in lines:
-
-            if line.split('\t')[1].strip() == x.strip():
-                x = line.split('\t')[0].strip()
+        digit_words = load_mapping(get_abs_path(data_path + "numbers/digit.tsv"), key_column=1, value_column=0)
+        x = digit_words.get(x, x)
 
     return x
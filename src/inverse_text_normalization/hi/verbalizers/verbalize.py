@@ -14,6 +14,8 @@
 # limitations under the License.
 
 from inverse_text_normalization.hi.graph_utils import GraphFst
+from inverse_text_normalization.fst_utils import select_classes
+from inverse_text_normalization.grammar_cache import ComponentBuilder
 from inverse_text_normalization.hi.verbalizers.cardinal import CardinalFst
 from inverse_text_normalization.hi.verbalizers.date import DateFst
 from inverse_text_normalization.hi.verbalizers.decimal import DecimalFst
@@ -23,22 +25,37 @@ from inverse_text_normalization.hi.verbalizers.ordinal import OrdinalFst
 from inverse_text_normalization.hi.verbalizers.time import TimeFst
 from inverse_text_normalization.hi.verbalizers.whitelist import WhiteListFst
 
+# semiotic classes verbalized when no selection is given
+DEFAULT_CLASSES = ('time', 'date', 'measure', 'ordinal', 'decimal', 'cardinal', 'whitelist')
+# verbalizer of every class, in the order of their union
+VERBALIZERS = {
+    'time': TimeFst,
+    'date': DateFst,
+    'money': MoneyFst,
+    'measure': MeasureFst,
+    'ordinal': OrdinalFst,
+    'decimal': DecimalFst,
+    'cardinal': CardinalFst,
+    'whitelist': WhiteListFst,
+}
+
 
 class VerbalizeFst(GraphFst):
     """
     Composes other verbalizer grammars. This class will be compiled and exported to thrax FAR.
+
+    Args:
+        classes: semiotic classes to verbalize, DEFAULT_CLASSES if None
+        cache: optional grammar_cache.GrammarCache, class grammars whose inputs did not change are loaded from it
     """
 
-    def __init__(self):
+    def __init__(self, classes=None, cache=None):
         super().__init__(name="verbalize", kind="verbalize")
-        cardinal = CardinalFst().fst
-        ordinal = OrdinalFst().fst
-        decimal = DecimalFst().fst
-        measure = MeasureFst().fst
-        time = TimeFst().fst
-        date = DateFst().fst
-        # money = MoneyFst().fst
-        whitelist = WhiteListFst().fst
-        graph = time | date | measure | ordinal | decimal | cardinal | whitelist
-        # graph = time | date | money | measure | ordinal | decimal | cardinal | whitelist
+        classes = select_classes(classes, DEFAULT_CLASSES)
+        builder = ComponentBuilder('verbalize', VERBALIZERS, cache=cache)
+        graph = None
+        for name in VERBALIZERS:
+            if name in classes:
+                class_graph = builder.fst(name)
+                graph = class_graph if graph is None else graph | class_graph
         self.fst = graph
@@ -0,0 +1,61 @@
+'''
+Please move this file to src/ before running the tests
+'''
+
+import unittest
+from inverse_text_normalization.cardinal_parser import get_cardinal_parser
+from inverse_text_normalization.post_processing import post_process_sentence
+from inverse_text_normalization.run_benchmark import spell_cardinals
+from inverse_text_normalization.run_predict import inverse_normalize_text
+
+
+class CardinalParser(unittest.TestCase):
+
+    def test_spoken_cardinals_are_parsed(self):
+        parser = get_cardinal_parser('hi')
+        data = ['एक हज़ार चार सौ बीस', 'पंद्रह सौ सात', 'बारह लाख बीस हज़ार सात सौ पंद्रह',
+                'बत्तीस करोड़ चार सौ', 'उन्निस सौ उन्निस करोड़ पाँच', 'दो सौ एंड बीस']
+        expected_output = ['1420', '1507', '1220715', '320000400', '19190000005', '220']
+
+        self.assertEqual(expected_output, [parser.parse(text) for text in data])
+
+    def test_lines_that_are_not_a_single_cardinal_are_left_to_the_grammars(self):
+        parser = get_cardinal_parser('hi')
+        data = ['एक', 'दो', 'मुझे दो सौ पानी की बोतल दो', 'चार सौ एंड', 'दो लाख पंद्रह सौ', 'चार लाख करोड़़',
+                'उन्निस सौ उन्निस करोड़', 'दो सौ लाख']
+
+        self.assertEqual([None] * len(data), [parser.parse(text) for text in data])
+
+    def test_fast_engine_gives_the_same_output_as_the_grammars(self):
+        data = ['एक हज़ार चार सौ बीस', 'एक', 'रीटा के पास चार सौ बीस बिल्लियाँ हैं।', 'बारह हज़ार सात सौ तीन',
+                'चार करोड़ इक्कीस लाख चार हज़ार चार सौ चार']
+
+        self.assertEqual(inverse_normalize_text(data, lang='hi'), inverse_normalize_text(data, lang='hi', engine='fast'))
+
+    def test_hundreds_prefixed_by_tens_give_the_same_output_as_the_grammars(self):
+        parser = get_cardinal_parser('hi')
+        values = [1919, 1100, 9999, 1507, 45678, 12000200003, 99990000001]
+        data = spell_cardinals(parser, values, tens_hundreds=1.0) + ['उन्नीस सौ', 'पंद्रह सौ सात']
+        outputs = [parser.parse(text) for text in data]
+
+        self.assertEqual([str(value) for value in values] + ['1900', '1507'], outputs)
+        self.assertEqual(inverse_normalize_text(data, lang='hi'),
+                         [post_process_sentence(output, format_lang='hi') for output in outputs])
+
+    def test_hundreds_prefixed_by_tens_the_grammar_writes_apart_are_left_to_it(self):
+        parser = get_cardinal_parser('hi')
+        data = spell_cardinals(parser, [201500, 3001100, 4000009999, 19190000000], tens_hundreds=1.0)
+
+        self.assertEqual([None] * len(data), [parser.parse(text) for text in data])
+
+
+    def test_fast_engine_is_refused_for_languages_without_a_parser(self):
+        for lang in ['gu', 'ta']:
+            with self.assertRaises(ValueError):
+                inverse_normalize_text(['एक हज़ार'], lang=lang, engine='fast')
+        with self.assertRaises(ValueError):
+            get_cardinal_parser('pa')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+'''
+Please move this file to src/ before running the tests
+'''
+
+import unittest
+from inverse_text_normalization.fst_utils import select_classes
+from inverse_text_normalization.hi.inverse_normalize import get_grammars
+from inverse_text_normalization.run_predict import inverse_normalize_text
+
+
+class SemioticClassSelection(unittest.TestCase):
+
+    def test_selected_classes_are_normalized(self):
+        # the cardinal grammar reads the letter के as K, so the sentence goes without it
+        data = ['मेरे पास चार सौ बीस बिल्लियाँ हैं।']
+        expected_output = ['मेरे पास 420 बिल्लियाँ हैं।']
+
+        self.assertEqual(expected_output, inverse_normalize_text(data, lang='hi', classes=['cardinal']))
+
+    def test_other_classes_are_left_as_words(self):
+        data = ['रीटा के पास चार सौ बीस बिल्लियाँ हैं।']
+
+        self.assertEqual(data, inverse_normalize_text(data, lang='hi', classes=['time']))
+
+    def test_grammars_are_cached_by_class_set(self):
+        self.assertIs(get_grammars(['cardinal', 'ordinal']), get_grammars(['ordinal', 'cardinal']))
+        self.assertIs(get_grammars(), get_grammars(None))
+
+    def test_unknown_classes_are_rejected(self):
+        with self.assertRaises(ValueError):
+            select_classes(['telephone'], ['cardinal'])
+        with self.assertRaises(ValueError):
+            select_classes([], ['cardinal'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+'''
+Please move this file to src/ before running the tests
+'''
+
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+from inverse_text_normalization.build_grammars import build_grammars
+from inverse_text_normalization.fst_utils import GRAMMAR_CACHE_ENV, load_cached_grammars
+from inverse_text_normalization.grammar_cache import GrammarCache
+
+
+class IncrementalGrammarBuild(unittest.TestCase):
+
+    def test_unchanged_components_are_loaded_from_the_cache(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            first = build_grammars('hi', cache_dir, classes=['cardinal', 'whitelist'])
+            second = build_grammars('hi', cache_dir, classes=['cardinal', 'whitelist'])
+
+        self.assertEqual({'classify/cardinal', 'classify/whitelist', 'verbalize/cardinal', 'verbalize/whitelist'},
+                         {build.component for build in first if build.changed_inputs == ['not cached']})
+        self.assertEqual([], [build.component for build in second
+                              if build.rebuilt and build.changed_inputs != ['union and optimize']])
+
+    def test_changed_inputs_invalidate_only_their_components(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            build_grammars('hi', cache_dir, classes=['cardinal', 'whitelist'])
+            manifest_path = os.path.join(cache_dir, 'hi', 'manifest.json')
+            with open(manifest_path, encoding='utf-8') as f:
+                manifest = json.load(f)
+            whitelist_inputs = manifest['components']['classify/whitelist']['inputs']
+            data_file = next(path for path in whitelist_inputs if path.endswith('whitelist.tsv'))
+            whitelist_inputs[data_file] = 'edited'
+            with open(manifest_path, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f)
+
+            cache = GrammarCache(cache_dir, 'hi')
+            self.assertEqual([data_file], cache.changed_inputs('classify/whitelist'))
+            self.assertEqual([], cache.changed_inputs('classify/cardinal'))
+
+
+class CachedFinalGrammars(unittest.TestCase):
+
+    def test_final_grammars_are_loaded_while_up_to_date(self):
+        classes = frozenset(['cardinal', 'whitelist'])
+        with tempfile.TemporaryDirectory() as cache_dir, mock.patch.dict(os.environ, {GRAMMAR_CACHE_ENV: cache_dir}):
+            self.assertIsNone(load_cached_grammars('hi', classes))
+            build_grammars('hi', cache_dir, classes=sorted(classes))
+
+            from inverse_text_normalization.hi import inverse_normalize
+            with mock.patch.object(inverse_normalize, 'ClassifyFinalFst', side_effect=AssertionError('built')):
+                tagger, verbalizer = inverse_normalize.get_grammars(classes)
+            self.assertGreater(tagger.fst.num_states(), 0)
+            self.assertGreater(verbalizer.fst.num_states(), 0)
+            self.assertIsNone(load_cached_grammars('hi', frozenset(['cardinal'])))
+
+            manifest_path = os.path.join(cache_dir, 'hi', 'manifest.json')
+            with open(manifest_path, encoding='utf-8') as f:
+                manifest = json.load(f)
+            inputs = manifest['components']['classify/tokenize_and_classify_final']['inputs']
+            inputs[next(path for path in inputs if path.endswith('whitelist.tsv'))] = 'edited'
+            with open(manifest_path, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f)
+            self.assertIsNone(load_cached_grammars('hi', classes))
+
+
+if __name__ == '__main__':
+    unittest.main()
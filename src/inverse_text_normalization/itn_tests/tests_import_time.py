@@ -0,0 +1,21 @@
+'''
+Please move this file to src/ before running the tests
+'''
+
+import unittest
+from inverse_text_normalization.run_benchmark import IMPORT_BUDGETS_MS, profile_import
+
+
+class ImportTime(unittest.TestCase):
+
+    def test_entry_point_does_not_load_heavy_dependencies(self):
+        seconds, heavy = profile_import('inverse_text_normalization.run_predict')
+        self.assertEqual([], heavy)
+        self.assertLess(seconds * 1000, IMPORT_BUDGETS_MS['inverse_text_normalization.run_predict'])
+
+    def test_language_packages_do_not_load_inflect_or_tqdm(self):
+        self.assertEqual([], profile_import('inverse_text_normalization.hi.inverse_normalize')[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+'''
+Please move this file to src/ before running the tests
+'''
+
+import unittest
+from inverse_text_normalization.lexicon_overlay import get_overlay, register_overlay, unregister_overlay
+from inverse_text_normalization.run_predict import inverse_normalize_text
+
+
+class LexiconOverlays(unittest.TestCase):
+
+    def tearDown(self):
+        for tenant in ('acme', 'globex'):
+            try:
+                unregister_overlay(tenant)
+            except KeyError:
+                pass
+
+    def test_overlay_phrases_take_priority_over_the_grammars(self):
+        register_overlay('acme', {'सात सितारे': 'SevenStars'})
+        data = ['मेरे पास सात सितारे हैं', 'मेरे पास चार सौ बीस बिल्लियाँ हैं']
+        expected_output = ['मेरे पास SevenStars हैं', 'मेरे पास 420 बिल्लियाँ हैं']
+
+        self.assertEqual(expected_output, inverse_normalize_text(data, lang='hi', tenant='acme'))
+
+    def test_longer_phrases_win(self):
+        register_overlay('acme', {'सात': 'Seven', 'सात सितारे': 'SevenStars'})
+
+        self.assertEqual(['SevenStars'], inverse_normalize_text(['सात सितारे'], lang='hi', tenant='acme'))
+
+    def test_phrases_are_tagged_with_the_rest_of_the_sentence(self):
+        register_overlay('acme', {'सात सितारे': 'SevenStars'})
+        data = ['चार सौ सात सितारे', 'सात सितारे बीस रुपये', 'मेरे पास सात सितारे और चार सौ बीस बिल्लियाँ हैं']
+
+        self.assertEqual(['407 सितारे'], inverse_normalize_text(data[:1], lang='hi'))
+        # the overlay token and the cardinal are on one shortest path, सात is read as part of the phrase
+        self.assertEqual(['400 SevenStars', 'SevenStars 20 रुपये', 'मेरे पास SevenStars और 420 बिल्लियाँ हैं'],
+                         inverse_normalize_text(data, lang='hi', tenant='acme'))
+
+    def test_written_forms_may_contain_spaces(self):
+        register_overlay('acme', {'सात सितारे': 'Seven Stars'})
+
+        self.assertEqual(['मेरे पास Seven Stars हैं'],
+                         inverse_normalize_text(['मेरे पास सात सितारे हैं'], lang='hi', tenant='acme'))
+
+    def test_fast_engine_leaves_lines_with_a_phrase_to_the_grammars(self):
+        register_overlay('acme', {'सात': 'Seven'})
+        data = ['सात', 'चार सौ बीस']
+
+        self.assertEqual(['Seven', '420'], inverse_normalize_text(data, lang='hi', engine='fast', tenant='acme'))
+
+    def test_tenants_with_equal_lexicons_share_one_compiled_overlay(self):
+        register_overlay('acme', {'सात सितारे': 'SevenStars'})
+        register_overlay('globex', {'सात  सितारे': 'SevenStars'})
+
+        self.assertIs(get_overlay('acme'), get_overlay('globex'))
+
+    def test_unknown_tenants_are_rejected(self):
+        with self.assertRaises(ValueError):
+            inverse_normalize_text(['सात सितारे'], lang='hi', tenant='initech')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,38 @@
+'''
+Please move this file to src/ before running the tests
+'''
+
+import os
+import tempfile
+import unittest
+from inverse_text_normalization.lexicon_registry import load_mapping, load_rows
+
+
+class LexiconRegistry(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix='.tsv')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write('एक\t1\nदो\t2\n\nइक\t1\n')
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_files_are_parsed_once(self):
+        self.assertEqual((('एक', '1'), ('दो', '2'), ('इक', '1')), load_rows(self.path))
+        self.assertIs(load_rows(self.path), load_rows(self.path))
+
+    def test_first_row_of_a_key_wins(self):
+        self.assertEqual({'1': 'एक', '2': 'दो'}, dict(load_mapping(self.path, key_column=1, value_column=0)))
+
+    def test_changed_files_are_reloaded(self):
+        load_rows(self.path)
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write('तीन\t3\n')
+        os.utime(self.path, ns=(0, os.stat(self.path).st_mtime_ns + 1))
+
+        self.assertEqual((('तीन', '3'),), load_rows(self.path))
+
+
+if __name__ == '__main__':
+    unittest.main()
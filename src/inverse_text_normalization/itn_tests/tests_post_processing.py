@@ -0,0 +1,59 @@
+'''
+Please move this file to src/ before running the tests
+'''
+
+import unittest
+from inverse_text_normalization.post_processing import format_numbers_with_commas, group_digits, post_process_sentence
+
+
+class NumberFormatting(unittest.TestCase):
+
+    def test_digits_are_grouped_in_indian_and_western_format(self):
+        self.assertEqual('10,01,420', group_digits('1001420', indian=True))
+        self.assertEqual('1,001,420', group_digits('1001420', indian=False))
+        self.assertEqual('420', group_digits('420', indian=True))
+        self.assertEqual('1,420', group_digits('1420', indian=True))
+
+    def test_only_numeric_tokens_are_formatted(self):
+        data = 'मेरे पास ₹1001420.50 और 12:30 बजे abc12345 -4040400 लोग 1420।'
+        expected_output = 'मेरे पास ₹10,01,420.50 और 12:30 बजे abc12345 -40,40,400 लोग 1,420।'
+
+        self.assertEqual(expected_output, format_numbers_with_commas(data, lang='hi', separator=','))
+        self.assertEqual('₹1,001,420.50', format_numbers_with_commas('₹1001420.50', lang='en', separator=','))
+
+    def test_default_separator_keeps_numbers_ungrouped(self):
+        data = 'मेरे पास ₹1001420 हैं'
+
+        self.assertEqual(data, format_numbers_with_commas(data, lang='hi'))
+
+
+class PostProcessing(unittest.TestCase):
+
+    def test_starting_zeros_are_removed(self):
+        data = ['0001420 लोग', '0000 लोग', '0.5 किलो', '00 लोग', '12:05 बजे']
+        expected_output = ['1420 लोग', ' लोग', '0.5 किलो', '00 लोग', '12:05 बजे']
+
+        self.assertEqual(expected_output, [post_process_sentence(sent) for sent in data])
+
+    def test_short_runs_of_zeros_are_trimmed_for_assamese(self):
+        data = ['00', '₹0', '000 लोग']
+
+        self.assertEqual(['00', '0', '000 लोग'], [post_process_sentence(sent) for sent in data])
+        self.assertEqual(['', '₹ ', ' लोग'], [post_process_sentence(sent, keep_short_zeros=False) for sent in data])
+
+    def test_currency_sign_is_split_from_amount(self):
+        data = ['मुझे ₹0200 दो', 'मुझे €5 दो', 'मुझे  €5 दो\r']
+        expected_output = ['मुझे ₹ 200 दो', 'मुझे €5 दो', 'मुझे  €5 दो']
+
+        self.assertEqual(expected_output, [post_process_sentence(sent, currency_signs='$₹') for sent in data])
+
+    def test_numbers_are_grouped_in_the_same_pass(self):
+        data = 'मेरे पास ₹0001001420 और 00012345.50 हैं'
+        expected_output = 'मेरे पास ₹ 10,01,420 और 12,345.50 हैं'
+
+        self.assertEqual(expected_output, post_process_sentence(data, format_lang='hi', separator=','))
+        self.assertEqual('मेरे पास ₹ 1001420 और 12345.50 हैं', post_process_sentence(data, format_lang='hi'))
+
+
+if __name__ == '__main__':
+    unittest.main()
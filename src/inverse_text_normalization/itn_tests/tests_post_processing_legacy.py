@@ -0,0 +1,101 @@
+'''
+Please move this file to src/ before running the tests
+'''
+
+import importlib
+import unittest
+from unittest import mock
+
+# currency signs of the former <lang>/run_predict.remove_starting_zeros copies and whether they returned 0, 00 and
+# 000 unchanged, the copies did not differ otherwise
+LEGACY_SETTINGS = {
+    'asm': (['$', '₹', '£', '€'], False),
+    'bn': (['$', '₹', '£', '€'], True),
+    'en': (['$', '₹'], True),
+    'gu': (['$', '₹'], True),
+    'hi': (['$', '₹'], True),
+    'kn': (['$', '₹', '£', '€'], True),
+    'ml': (['$', '₹', '£', '€'], True),
+    'mr': (['$', '₹'], True),
+    'ori': (['$', '₹', '£', '€'], True),
+    'pa': (['$', '₹', '£', '€'], True),
+    'ta': (['$', '₹'], True),
+    'te': (['$', '₹'], True),
+}
+
+CORPUS = [
+    'रीटा के पास 420 बिल्लियाँ हैं।',
+    '0001420 लोग 0000 लोग',
+    '0 00 000 0000 लोग',
+    '₹0 ₹00 ₹000 ₹0000 ₹0200',
+    '$5 £05 €0050 £0 €00',
+    '0.5 किलो 00.5 किलो 10.05 किलो 000.0',
+    '12:05 बजे 0:05 बजे',
+    'मेरे पास ₹0001001420 और 00012345.50 हैं',
+    '₹ 500 $ ₹',
+    '-0042 01a a01 ০০১২',
+    'कुछ नहीं\r',
+]
+
+
+def legacy_remove_starting_zeros(word, hindi_digits_with_zero, currency_handled, keep_short_zeros):
+    # the former per-language helper
+    currency = ''
+    if word[0] in currency_handled:
+        currency = word[0]
+        word = word[1:]
+
+    if keep_short_zeros and (word == "0" or word == "00" or word == "000"):
+        return word
+
+    if all(v == '0' for v in word):  # all the digits in num are zero eg: "00000000"
+        word = ''
+
+    elif word[0] in hindi_digits_with_zero and len(word) > 1:
+        if all([digit == "0" for digit in list(word)]):
+            return "1" + word
+        if '.' in word:
+            if len(word.split('.')[0]) == 1:
+                return word
+        pos_non_zero_nums = [pos for pos, word in enumerate(list(word)) if word != "0"]
+        first_non_zero_num = min(pos_non_zero_nums)
+        word = word[first_non_zero_num:]
+    if currency:
+        word = currency + ' ' + word
+    return word
+
+
+def legacy_post_process(sent, currency_handled, keep_short_zeros):
+    sent = sent.replace('\r', '')
+    return ' '.join(legacy_remove_starting_zeros(word, '0123456789', currency_handled, keep_short_zeros)
+                    for word in sent.split(' '))
+
+
+def unnormalized(text_list, verbose=False, classes=None, tenant=None):
+    return text_list
+
+
+class LegacyPostProcessing(unittest.TestCase):
+
+    def test_every_language_post_processes_like_its_former_helper(self):
+        for lang, (currency_handled, keep_short_zeros) in LEGACY_SETTINGS.items():
+            module = importlib.import_module(f'inverse_text_normalization.{lang}.run_predict')
+            expected_output = [legacy_post_process(sent, currency_handled, keep_short_zeros) for sent in CORPUS]
+
+            # the grammars are bypassed, only the post processing of the language runs
+            with mock.patch.dict(module.INVERSE_NORMALIZERS, {'nemo': unnormalized}):
+                output = module.inverse_normalize_text(CORPUS)
+
+            self.assertEqual(expected_output, output, lang)
+
+    def test_every_language_keeps_its_former_word_level_helper(self):
+        for lang, (currency_handled, keep_short_zeros) in LEGACY_SETTINGS.items():
+            module = importlib.import_module(f'inverse_text_normalization.{lang}.run_predict')
+            for sent in CORPUS:
+                for word in sent.replace('\r', '').split(' '):
+                    self.assertEqual(legacy_remove_starting_zeros(word, '0123456789', currency_handled, keep_short_zeros),
+                                     module.remove_starting_zeros(word, '0123456789'), (lang, word))
+
+
+if __name__ == '__main__':
+    unittest.main()
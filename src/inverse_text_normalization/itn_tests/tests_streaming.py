@@ -0,0 +1,48 @@
+'''
+Please move this file to src/ before running the tests
+'''
+
+import unittest
+from inverse_text_normalization.run_predict import inverse_normalize_text
+from inverse_text_normalization.streaming import StreamingInverseNormalizer
+
+
+class StreamingInverseNormalization(unittest.TestCase):
+
+    def test_streamed_utterance_is_normalized_like_the_whole_utterance(self):
+        data = ['रीटा के पास चार सौ बीस बिल्लियाँ हैं।', 'मुझे दो सौ पानी की बोतल दो',
+                'लेखों की संख्या एक हज़ार नौ सौ चौहत्तर हैं।']
+        expected_output = inverse_normalize_text(data, lang='hi')
+
+        normalizer = StreamingInverseNormalizer('hi')
+        outputs = []
+        for sent in data:
+            for word in sent.split():
+                normalizer.append(word)
+            outputs.append(normalizer.finalize())
+
+        self.assertEqual(expected_output, outputs)
+
+    def test_numbers_stay_open_until_a_word_outside_the_grammars_arrives(self):
+        normalizer = StreamingInverseNormalizer('hi')
+
+        normalizer.append('मुझे एक हज़ार')
+        self.assertEqual(['एक', 'हज़ार'], normalizer.tail)
+        normalizer.append('चार सौ')
+        self.assertEqual(['एक', 'हज़ार', 'चार', 'सौ'], normalizer.tail)
+        normalizer.append('बिल्लियाँ')
+        self.assertEqual([], normalizer.tail)
+        self.assertEqual('मुझे 1400 बिल्लियाँ', normalizer.committed)
+
+    def test_revised_partial_hypotheses_are_renormalized(self):
+        normalizer = StreamingInverseNormalizer('hi')
+        normalizer.update('रीटा के पास चार सौ')
+
+        self.assertEqual(inverse_normalize_text(['रीटा के पास चार सौ बीस'], lang='hi')[0],
+                         normalizer.update('रीटा के पास चार सौ बीस'))
+        self.assertEqual(inverse_normalize_text(['गीता के पास दो सौ'], lang='hi')[0],
+                         normalizer.update('गीता के पास दो सौ'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,31 @@
+'''
+Please move this file to src/ before running the tests
+'''
+
+import unittest
+import pynini
+from inverse_text_normalization.fst_utils import far_bytes_to_fsts, fsts_to_far_bytes
+from inverse_text_normalization.run_predict import inverse_normalize_text
+from inverse_text_normalization.warmup import warmup
+
+
+class GrammarWarmup(unittest.TestCase):
+
+    def test_fsts_survive_far_bytes(self):
+        fst = pynini.cross('चार सौ', '400')
+        fsts = far_bytes_to_fsts(fsts_to_far_bytes({'cardinal': fst}))
+
+        self.assertEqual(['cardinal'], list(fsts))
+        self.assertEqual('400', pynini.shortestpath(pynini.accep('चार सौ') @ fsts['cardinal']).string())
+
+    def test_warmed_up_languages_normalize_like_built_ones(self):
+        warmup(['hi', 'ta'])
+
+        self.assertEqual(['रीटा के पास 420 बिल्लियाँ हैं।'],
+                         inverse_normalize_text(['रीटा के पास चार सौ बीस बिल्लियाँ हैं।'], lang='hi'))
+        self.assertEqual(['139 படங்கள் பார்த்திருக்கிறேன்'],
+                         inverse_normalize_text(['ஒன்று நூறு முப்பத்து ஒன்பது படங்கள் பார்த்திருக்கிறேன்'], lang='ta'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from inverse_text_normalization.kn.data_loader_utils import get_abs_path
+from inverse_text_normalization.lexicon_registry import load_string_file
 from inverse_text_normalization.kn.graph_utils import (
     NEMO_DIGIT,
     NEMO_SIGMA,
@@ -53,7 +54,7 @@ class MoneyFst(GraphFst):
         cardinal_graph = cardinal.graph_no_exception
         graph_decimal_final = decimal.final_graph_wo_negative
 
-        unit = pynini.string_file(get_abs_path(lang_data_path+"currency.tsv"))
+        unit = load_string_file(get_abs_path(lang_data_path+"currency.tsv"))
         unit_singular = pynini.invert(unit)
         unit_plural = get_singulars(unit_singular)
 
@@ -0,0 +1,185 @@
+import csv
+import hashlib
+import json
+import threading
+from typing import Dict, Union
+
+from inverse_text_normalization.fst_utils import prepare_for_composition
+
+try:
+    import pynini
+    from pynini.lib import pynutil
+
+    PYNINI_AVAILABLE = True
+except (ModuleNotFoundError, ImportError):
+    PYNINI_AVAILABLE = False
+
+'''
+Per tenant lexicon overlays: spoken forms of brand names, product codes or domain units that take priority over the
+grammars, without recompiling them. An overlay is compiled into a small tagger of tokens { name: "..." } once per
+distinct lexicon, and unioned with the shared sentence tagger of a language when a sentence of the tenant contains one
+of its phrases. Overlay tokens weigh less than whitelist tokens and any other tagging of their words, and the whole
+sentence is tagged with one shortest path, so the grammars keep the context around a phrase.
+
+Example usage:
+from inverse_text_normalization.lexicon_overlay import register_overlay
+from inverse_text_normalization.run_predict import inverse_normalize_text
+
+register_overlay('acme', {'सात सितारे': 'SevenStars'})      # or a whitelist.tsv style file path
+inverse_normalize_text(['मेरे पास सात सितारे हैं'], lang='hi', tenant='acme')  # ['मेरे पास SevenStars हैं']
+'''
+
+# weight of an overlay token of n words: OVERLAY_TOKEN_WEIGHT + n * OVERLAY_WORD_WEIGHT. Far below the 1.01 of
+# whitelist tokens and below any tagging of the same words by the grammars, whose weights go down to -0.7, so phrases
+# win over the grammars. A phrase costs less than shorter phrases covering the same words, so longer phrases win.
+OVERLAY_TOKEN_WEIGHT = 1.0
+OVERLAY_WORD_WEIGHT = -10.0
+
+
+def load_overlay_file(path: str) -> Dict[str, str]:
+    """
+    Loads an overlay lexicon in the format of data/whitelist.tsv: written form, tab, spoken form
+
+    Args:
+        path: tsv file path
+
+    Returns: spoken form -> written form
+    """
+    with open(path, encoding='utf-8') as f:
+        return {row[1].strip(): row[0].strip() for row in csv.reader(f, delimiter='\t') if len(row) == 2}
+
+
+def clean_lexicon(lexicon: Dict[str, str]) -> Dict[str, str]:
+    """
+    Collapses runs of whitespace in spoken forms and drops empty ones
+    """
+    return {' '.join(spoken.split()): written for spoken, written in lexicon.items() if spoken.split()}
+
+
+def lexicon_digest(lexicon: Dict[str, str]) -> str:
+    """
+    Returns the content hash of a lexicon, equal lexicons have equal hashes whatever their order
+    """
+    return hashlib.sha256(json.dumps(sorted(lexicon.items()), ensure_ascii=False).encode('utf-8')).hexdigest()
+
+
+class LexiconOverlay:
+    """
+    Lexicon compiled into tokens { name: "<written form>" } tagging its spoken forms. Phrases match whole words only,
+    overlapping matches are resolved towards the one covering more words, see OVERLAY_WORD_WEIGHT.
+
+    Args:
+        lexicon: spoken form -> written form
+    """
+
+    def __init__(self, lexicon: Dict[str, str]):
+        self.lexicon = clean_lexicon(lexicon)
+        if not self.lexicon:
+            raise ValueError("Overlay lexicon is empty")
+        if any('"' in written for written in self.lexicon.values()):
+            raise ValueError("Overlay written forms can not contain double quotes")
+        self.digest = lexicon_digest(self.lexicon)
+        # first words of the phrases, as they appear in sentences and in escaped sentences
+        first_words = [spoken.split()[0] for spoken in self.lexicon]
+        self.first_words = frozenset(first_words + [pynini.escape(word) for word in first_words])
+
+        by_length = {}
+        for spoken, written in self.lexicon.items():
+            # spaces of written forms are non breaking within quotes, the word verbalizers turn them back into spaces
+            pair = (pynini.escape(spoken), pynini.escape(written.replace(' ', '\u00A0')))
+            by_length.setdefault(len(spoken.split()), []).append(pair)
+        phrases = pynini.union(*[pynutil.add_weight(pynini.string_map(pairs),
+                                                    OVERLAY_TOKEN_WEIGHT + length * OVERLAY_WORD_WEIGHT)
+                                 for length, pairs in by_length.items()])
+        self.fst = (pynutil.insert('tokens { name: "') + phrases + pynutil.insert('" }')).optimize()
+        # sentence taggers with the overlay, by id of the base tagger
+        self._taggers = {}
+        self._taggers_lock = threading.Lock()
+
+    def matches(self, text: str) -> bool:
+        """
+        Returns whether a sentence, escaped or not, may contain a phrase of the lexicon
+        """
+        return not self.first_words.isdisjoint(text.split())
+
+    def tagger(self, base: 'pynini.Fst') -> 'pynini.Fst':
+        """
+        Returns a sentence tagger of a language with the overlay tokens unioned in, built once per base tagger. The
+        base tagger is reused as it is for the stretches between phrases.
+
+        Args:
+            base: sentence tagger of a language, e.g. get_grammars(classes)[0].fst
+
+        Returns: tagger prepared for composition
+        """
+        with self._taggers_lock:
+            entry = self._taggers.get(id(base))
+        if entry is None:
+            white_space = pynini.union(' ', '\t', '\n', '\r', '\u00A0')
+            delete_extra_space = pynini.cross(pynini.closure(white_space, 1), ' ')
+            piece = pynini.union(base, self.fst)
+            tagger = prepare_for_composition(piece + pynini.closure(delete_extra_space + piece))
+            with self._taggers_lock:
+                # the base tagger is kept with its overlay tagger, so its id is not reused while the entry exists
+                entry = self._taggers.setdefault(id(base), (base, tagger))
+        return entry[1]
+
+
+# overlays by lexicon digest, tenants registering the same lexicon share one compiled overlay
+_compiled_overlays = {}
+# tenant -> overlay
+_tenant_overlays = {}
+# guards both dicts, overlays are registered while request threads look them up
+_overlays_lock = threading.Lock()
+
+
+def register_overlay(tenant: str, lexicon: Union[Dict[str, str], str]) -> LexiconOverlay:
+    """
+    Registers the overlay lexicon of a tenant, replacing its previous one
+
+    Args:
+        tenant: tenant name, passed as run_predict.inverse_normalize_text(..., tenant=tenant)
+        lexicon: spoken form -> written form, or path of a tsv file, see load_overlay_file
+
+    Returns: compiled overlay
+    """
+    if isinstance(lexicon, str):
+        lexicon = load_overlay_file(lexicon)
+    digest = lexicon_digest(clean_lexicon(lexicon))
+    with _overlays_lock:
+        overlay = _compiled_overlays.get(digest)
+    if overlay is None:
+        # compiled without holding the lock, lookups of other tenants go on meanwhile
+        overlay = LexiconOverlay(lexicon)
+    with _overlays_lock:
+        overlay = _compiled_overlays.setdefault(digest, overlay)
+        previous = _tenant_overlays.get(tenant)
+        _tenant_overlays[tenant] = overlay
+        if previous is not None:
+            _release(previous)
+    return overlay
+
+
+def _release(overlay: LexiconOverlay):
+    # called with _overlays_lock held
+    if overlay not in _tenant_overlays.values():
+        _compiled_overlays.pop(overlay.digest, None)
+
+
+def unregister_overlay(tenant: str):
+    """
+    Removes the overlay of a tenant, its compiled overlay is freed once no tenant uses it
+    """
+    with _overlays_lock:
+        _release(_tenant_overlays.pop(tenant))
+
+
+def get_overlay(tenant: str) -> LexiconOverlay:
+    """
+    Returns the overlay registered for a tenant
+    """
+    with _overlays_lock:
+        overlay = _tenant_overlays.get(tenant)
+    if overlay is None:
+        raise ValueError(f"No lexicon overlay registered for tenant: {tenant}")
+    return overlay
@@ -0,0 +1,88 @@
+import os
+from types import MappingProxyType
+from typing import Callable, Mapping, Tuple
+
+try:
+    import pynini
+
+    PYNINI_AVAILABLE = True
+except (ModuleNotFoundError, ImportError):
+    PYNINI_AVAILABLE = False
+
+'''
+Registry of the data files of all language packages. Every tsv file is read and parsed once per process, as rows,
+as a dictionary or as a compiled string_file fst, and shared by the taggers, verbalizers and helpers that use it.
+Files are keyed by absolute path, so each language package has its own entries, and an entry is reloaded when its
+file changes on disk.
+'''
+
+# (kind, path) -> (file modification time, parsed file)
+_registry = {}
+
+
+def _load(kind: str, path: str, parse: Callable[[str], object]):
+    path = os.path.abspath(path)
+    mtime = os.stat(path).st_mtime_ns
+    entry = _registry.get((kind, path))
+    if entry is None or entry[0] != mtime:
+        entry = _registry[(kind, path)] = (mtime, parse(path))
+    return entry[1]
+
+
+def _parse_rows(path: str) -> Tuple[Tuple[str, ...], ...]:
+    with open(path, encoding='utf-8') as f:
+        return tuple(tuple(column.strip() for column in line.split('\t')) for line in f if line.strip())
+
+
+def load_rows(path: str) -> Tuple[Tuple[str, ...], ...]:
+    """
+    Returns the non empty lines of a tsv file, split into stripped columns
+
+    Args:
+        path: absolute file path, e.g. get_abs_path(data_path + 'numbers/digit.tsv')
+
+    Returns: rows
+    """
+    return _load('rows', path, _parse_rows)
+
+
+def load_mapping(path: str, key_column: int = 0, value_column: int = 1) -> Mapping[str, str]:
+    """
+    Returns a read only dictionary between two columns of a tsv file, the first row of a key wins
+
+    Args:
+        path: absolute file path
+        key_column: index of the key column
+        value_column: index of the value column
+
+    Returns: key -> value
+    """
+
+    def parse(path):
+        mapping = {}
+        for row in load_rows(path):
+            if len(row) > max(key_column, value_column):
+                mapping.setdefault(row[key_column], row[value_column])
+        return MappingProxyType(mapping)
+
+    return _load(f'mapping {key_column} {value_column}', path, parse)
+
+
+def load_string_file(path: str) -> 'pynini.Fst':
+    """
+    Returns pynini.string_file(path), compiled once. The compiled fst is shared, so a copy is returned that
+    callers may modify in place, e.g. with invert() or optimize().
+
+    Args:
+        path: absolute file path
+
+    Returns: fst
+    """
+    return _load('string_file', path, pynini.string_file).copy()
+
+
+def clear():
+    """
+    Drops every loaded file
+    """
+    _registry.clear()
@@ -17,6 +17,7 @@ import pynini
 from pynini.lib import pynutil, utf8
 
 from inverse_text_normalization.ml.data_loader_utils import get_abs_path
+from inverse_text_normalization.lexicon_registry import load_rows, load_string_file
 from inverse_text_normalization.ml.graph_utils import (
     NEMO_DIGIT,
     NEMO_SIGMA,
@@ -59,22 +60,20 @@ class CardinalFst(GraphFst):
         # NEMO_NON_BREAKING_SPACE = u"\u00A0"
 
         hindi_digit_file = get_abs_path(data_path + 'numbers/digit.tsv')
-        with open(hindi_digit_file, encoding='utf-8') as f:
-            digits = f.readlines()
-        hindi_digits = ''.join([line.split()[-1] for line in digits])
+        hindi_digits = ''.join([row[-1] for row in load_rows(hindi_digit_file)])
         hindi_digits_with_zero = "0" + hindi_digits
         # # print(f'hindi digits is {hindi_digits}')
         HINDI_DIGIT = pynini.union(*hindi_digits).optimize()
         HINDI_DIGIT_WITH_ZERO = pynini.union(*hindi_digits_with_zero).optimize()
 
-        graph_zero = pynini.string_file(get_abs_path(data_path + "numbers/zero.tsv"))
-        graph_tens = pynini.string_file(get_abs_path(data_path + "numbers/tens.tsv"))
-        graph_digit = pynini.string_file(get_abs_path(data_path + "numbers/digit.tsv"))
-        graph_chars = pynini.string_file(get_abs_path(data_path + "numbers/alphabets.tsv"))
-        graph_multiples = pynini.string_file(get_abs_path(data_path + "numbers/multiples.tsv"))
-        malayalam_hundreds = pynini.string_file(get_abs_path(data_path + "numbers/ml_hundreds.tsv"))
-        graph_tens_en = pynini.string_file(get_abs_path(data_path + "numbers/tens_en.tsv"))
-        graph_char_multiples = pynini.string_file(get_abs_path(data_path + "numbers/multiples_alphabets.tsv"))
+        graph_zero = load_string_file(get_abs_path(data_path + "numbers/zero.tsv"))
+        graph_tens = load_string_file(get_abs_path(data_path + "numbers/tens.tsv"))
+        graph_digit = load_string_file(get_abs_path(data_path + "numbers/digit.tsv"))
+        graph_chars = load_string_file(get_abs_path(data_path + "numbers/alphabets.tsv"))
+        graph_multiples = load_string_file(get_abs_path(data_path + "numbers/multiples.tsv"))
+        malayalam_hundreds = load_string_file(get_abs_path(data_path + "numbers/ml_hundreds.tsv"))
+        graph_tens_en = load_string_file(get_abs_path(data_path + "numbers/tens_en.tsv"))
+        graph_char_multiples = load_string_file(get_abs_path(data_path + "numbers/multiples_alphabets.tsv"))
 
         cents = pynini.accep("നൂറ്") |  pynini.accep("നൂറു") | pynini.accep("നൂറ്റി") | pynini.accep("ഞ്ഞൂറ്") |  pynini.accep("ണ്ണൂറ്") | pynini.accep("ള്ളായിരം") | pynini.accep("ഞ്ഞൂറ്റി")  |  pynini.accep("ണ്ണൂറ്റി") | pynini.accep("ള്ളായിരത്തി") | pynini.accep("ഹണ്ട്രഡ്") | pynini.accep("ഹൺഡ്രഡ്")
         thousands = pynini.accep("യിരം") | pynini.accep("യിരത്തി") | pynini.accep("തൗസൻഡ്") | pynini.accep("തൌസൻഡ്") | pynini.accep("ആയിരം") | pynini.accep("ആയിരത്തി")
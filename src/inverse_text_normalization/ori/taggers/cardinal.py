@@ -17,6 +17,7 @@ import pynini
 from pynini.lib import pynutil, utf8
 
 from inverse_text_normalization.ori.data_loader_utils import get_abs_path
+from inverse_text_normalization.lexicon_registry import load_rows, load_string_file
 from inverse_text_normalization.ori.graph_utils import (
     NEMO_DIGIT,
     NEMO_SIGMA,
@@ -30,6 +31,13 @@ from inverse_text_normalization.ori.utils import num_to_word
 # data_path = f'data/{LANG}_data/'
 data_path = 'data/'
 
+# place value words of the cardinal grammar, also read by inverse_text_normalization.cardinal_parser
+HUNDREDS = ("ଶହେ", "ଶହ", "ହଣ୍ଡ୍ରେଡ", "ହଣ୍ଡ୍ରେଡ୍", "ହଣ୍ଟ୍ରେଡ୍")
+THOUSANDS = ("ହଜାର", "ଥାଉଜେଣ୍ଡ")
+LAKHS = ("ଲକ୍ଷ", "ଲକ୍ଷେ", "ଲାଖ୍\u200c", "ଲ୍ୟାକ୍", "ଲ୍ୟାକ୍ସ", "ଲାଖ")
+CRORES = ("କୋଟି", "କ୍ରୋର")
+AND_WORDS = ("ଆଣ୍ଡ",)
+
 
 def get_alternate_spellings(text):
     return
@@ -63,29 +71,27 @@ class CardinalFst(GraphFst):
         # NEMO_NON_BREAKING_SPACE = u"\u00A0"
 
         hindi_digit_file = get_abs_path(data_path + 'numbers/digit.tsv')
-        with open(hindi_digit_file, encoding='utf-8') as f:
-            digits = f.readlines()
-        hindi_digits = ''.join([line.split()[-1] for line in digits])
+        hindi_digits = ''.join([row[-1] for row in load_rows(hindi_digit_file)])
         hindi_digits_with_zero = "0" + hindi_digits
         # # print(f'hindi digits is {hindi_digits}')
         HINDI_DIGIT = pynini.union(*hindi_digits).optimize()
         HINDI_DIGIT_WITH_ZERO = pynini.union(*hindi_digits_with_zero).optimize()
 
-        graph_zero = pynini.string_file(get_abs_path(data_path + "numbers/zero.tsv"))
-        graph_tens = pynini.string_file(get_abs_path(data_path + "numbers/tens.tsv"))
-        graph_digit = pynini.string_file(get_abs_path(data_path + "numbers/digit.tsv"))
-        graph_multiples = pynini.string_file(get_abs_path(data_path + "numbers/multiples.tsv"))
-        graph_ties = pynini.string_file(get_abs_path(data_path + "numbers/ties.tsv"))
-        graph_chars = pynini.string_file(get_abs_path(data_path + "numbers/alphabets.tsv"))
-        graph_char_multiples = pynini.string_file(get_abs_path(data_path + "numbers/multiples_alphabets.tsv"))
-        graph_tens_en = pynini.string_file(get_abs_path(data_path + "numbers/tens-en.tsv"))
-
-        cents = pynini.accep("ଶହେ") | pynini.accep("ଶହ")  | pynini.accep("ହଣ୍ଡ୍ରେଡ")  | pynini.accep("ହଣ୍ଡ୍ରେଡ୍")  | pynini.accep("ହଣ୍ଟ୍ରେଡ୍")
-        thousands = pynini.accep("ହଜାର") | pynini.accep("ଥାଉଜେଣ୍ଡ")
-        lakhs = pynini.accep("ଲକ୍ଷ") | pynini.accep("ଲକ୍ଷେ") | pynini.accep("ଲାଖ୍‌") | pynini.accep("ଲ୍ୟାକ୍") | pynini.accep("ଲ୍ୟାକ୍ସ") | pynini.accep("ଲାଖ")
-        crores = pynini.accep("କୋଟି") | pynini.accep("କ୍ରୋର")
-
-        del_And = pynutil.delete(pynini.closure(pynini.accep("ଆଣ୍ଡ"), 1 ,1 ))
+        graph_zero = load_string_file(get_abs_path(data_path + "numbers/zero.tsv"))
+        graph_tens = load_string_file(get_abs_path(data_path + "numbers/tens.tsv"))
+        graph_digit = load_string_file(get_abs_path(data_path + "numbers/digit.tsv"))
+        graph_multiples = load_string_file(get_abs_path(data_path + "numbers/multiples.tsv"))
+        graph_ties = load_string_file(get_abs_path(data_path + "numbers/ties.tsv"))
+        graph_chars = load_string_file(get_abs_path(data_path + "numbers/alphabets.tsv"))
+        graph_char_multiples = load_string_file(get_abs_path(data_path + "numbers/multiples_alphabets.tsv"))
+        graph_tens_en = load_string_file(get_abs_path(data_path + "numbers/tens-en.tsv"))
+
+        cents = pynini.union(*HUNDREDS)
+        thousands = pynini.union(*THOUSANDS)
+        lakhs = pynini.union(*LAKHS)
+        crores = pynini.union(*CRORES)
+
+        del_And = pynutil.delete(pynini.union(*AND_WORDS))
 
         graph_hundred = pynini.cross("ଶହେ", "100") | pynini.cross("ଶହ", "100") | pynini.cross("ହଣ୍ଡ୍ରେଡ", "100") | pynini.cross("ହଣ୍ଡ୍ରେଡ୍", "100") | pynini.cross("ହଣ୍ଟ୍ରେଡ୍", "100")
         graph_thousand  = pynini.cross("ହଜାର", "1000") | pynini.cross("ଥାଉଜେଣ୍ଡ", "1000")
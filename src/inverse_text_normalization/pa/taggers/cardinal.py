@@ -17,6 +17,7 @@ import pynini
 from pynini.lib import pynutil, utf8
 
 from inverse_text_normalization.pa.data_loader_utils import get_abs_path
+from inverse_text_normalization.lexicon_registry import load_rows, load_string_file
 from inverse_text_normalization.pa.graph_utils import (
     NEMO_DIGIT,
     NEMO_SIGMA,
@@ -30,6 +31,13 @@ from inverse_text_normalization.pa.utils import num_to_word
 # data_path = f'data/{LANG}_data/'
 data_path = 'data/'
 
+# place value words of the cardinal grammar, also read by inverse_text_normalization.cardinal_parser
+HUNDREDS = ("ਸੌ", "ਹੰਡਰਡ", "ਹੰਡਰੈਡ")
+THOUSANDS = ("ਹਜਾਰ", "ਹਜ਼ਾਰ", "ਥਾਊਸੈਂਡ", "ਥੌਸੈਂਦ", "ਥਾੌਸੈਂਡ", "ਥਾਉਸੈਂਡ", "ਥੌਸੈਂਡ")
+LAKHS = ("ਲੱਖ", "ਲਖ", "ਲੈਕਸ", "ਲੈਕ", "ਲਖ਼ਸ")
+CRORES = ("ਕਰੋੜ",)
+AND_WORDS = ("ਐਂਡ",)
+
 try:
     import pynini
     from pynini.lib import pynutil
@@ -58,28 +66,26 @@ class CardinalFst(GraphFst):
         # NEMO_NON_BREAKING_SPACE = u"\u00A0"
 
         hindi_digit_file = get_abs_path(data_path + 'numbers/digit.tsv')
-        with open(hindi_digit_file, encoding='utf-8') as f:
-            digits = f.readlines()
-        hindi_digits = ''.join([line.split()[-1] for line in digits])
+        hindi_digits = ''.join([row[-1] for row in load_rows(hindi_digit_file)])
         hindi_digits_with_zero = "0" + hindi_digits
         # # print(f'hindi digits is {hindi_digits}')
         HINDI_DIGIT = pynini.union(*hindi_digits).optimize()
         HINDI_DIGIT_WITH_ZERO = pynini.union(*hindi_digits_with_zero).optimize()
 
-        graph_zero = pynini.string_file(get_abs_path(data_path + "numbers/zero.tsv"))
-        graph_tens = pynini.string_file(get_abs_path(data_path + "numbers/tens.tsv"))
-        graph_digit = pynini.string_file(get_abs_path(data_path + "numbers/digit.tsv"))
-        graph_chars = pynini.string_file(get_abs_path(data_path + "numbers/alphabets.tsv"))
-        graph_multiples = pynini.string_file(get_abs_path(data_path + "numbers/multiples.tsv"))
-        graph_tens_en = pynini.string_file(get_abs_path(data_path + "numbers/tens_en.tsv"))
-        graph_char_multiples = pynini.string_file(get_abs_path(data_path + "numbers/multiples_alphabets.tsv"))
+        graph_zero = load_string_file(get_abs_path(data_path + "numbers/zero.tsv"))
+        graph_tens = load_string_file(get_abs_path(data_path + "numbers/tens.tsv"))
+        graph_digit = load_string_file(get_abs_path(data_path + "numbers/digit.tsv"))
+        graph_chars = load_string_file(get_abs_path(data_path + "numbers/alphabets.tsv"))
+        graph_multiples = load_string_file(get_abs_path(data_path + "numbers/multiples.tsv"))
+        graph_tens_en = load_string_file(get_abs_path(data_path + "numbers/tens_en.tsv"))
+        graph_char_multiples = load_string_file(get_abs_path(data_path + "numbers/multiples_alphabets.tsv"))
 
-        cents = pynini.accep("ਸੌ") | pynini.accep("ਹੰਡਰਡ") | pynini.accep("ਹੰਡਰੈਡ")
-        thousands = pynini.accep("ਹਜਾਰ") | pynini.accep("ਹਜ਼ਾਰ") | pynini.accep("ਥਾਊਸੈਂਡ") | pynini.accep("ਥੌਸੈਂਦ") | pynini.accep("ਥਾੌਸੈਂਡ") | pynini.accep("ਥਾਉਸੈਂਡ") | pynini.accep("ਥੌਸੈਂਡ")
-        lakhs = pynini.accep("ਲੱਖ") | pynini.accep("ਲਖ") | pynini.accep("ਲੈਕਸ") | pynini.accep("ਲੈਕ") | pynini.accep("ਲਖ਼ਸ")
-        crores = pynini.accep("ਕਰੋੜ")
+        cents = pynini.union(*HUNDREDS)
+        thousands = pynini.union(*THOUSANDS)
+        lakhs = pynini.union(*LAKHS)
+        crores = pynini.union(*CRORES)
 
-        del_And = pynutil.delete(pynini.closure(pynini.accep("ਐਂਡ"), 1 ,1 ))
+        del_And = pynutil.delete(pynini.union(*AND_WORDS))
         
         graph_hundred = pynini.cross("ਸੌ", "100") | pynini.cross("ਹੰਡਰਡ", "100") | pynini.cross("ਹੰਡਰੈਡ", "100")
         graph_thousand  = pynini.cross("ਹਜਾਰ", "1000") | pynini.cross("ਹਜ਼ਾਰ", "1000") | pynini.cross("ਥਾਊਸੈਂਡ", "1000") | pynini.cross("ਥੌਸੈਂਦ", "1000") | pynini.cross("ਥਾੌਸੈਂਡ", "1000") | pynini.cross("ਥਾਉਸੈਂਡ", "1000") | pynini.cross("ਥੌਸੈਂਡ", "1000")
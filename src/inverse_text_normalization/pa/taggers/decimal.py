@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from inverse_text_normalization.pa.data_loader_utils import get_abs_path
+from inverse_text_normalization.lexicon_registry import load_rows, load_string_file
 from inverse_text_normalization.pa.graph_utils import (
     NEMO_DIGIT,
     GraphFst,
@@ -66,14 +67,13 @@ class DecimalFst(GraphFst):
             cardinal.graph_hundred_component_at_least_one_none_zero_digit
         )
 
-        graph_decimal = pynini.string_file(get_abs_path(data_path+"numbers/digit.tsv"))
-        graph_decimal |= pynini.string_file(get_abs_path(data_path +"numbers/zero.tsv"))
+        graph_decimal = load_string_file(get_abs_path(data_path+"numbers/digit.tsv"))
+        graph_decimal |= load_string_file(get_abs_path(data_path +"numbers/zero.tsv"))
 
         graph_decimal = pynini.closure(graph_decimal + delete_space) + graph_decimal
         self.graph = graph_decimal
 
-        with open(get_abs_path(data_path+"numbers/decimal.tsv"), encoding="utf-8") as f:
-            decimal_pt = f.read().strip()
+        decimal_pt = load_rows(get_abs_path(data_path+"numbers/decimal.tsv"))[0][0]
         point = pynutil.delete(decimal_pt)
 
         optional_graph_negative = pynini.closure(
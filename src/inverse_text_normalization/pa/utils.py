@@ -14,11 +14,26 @@
 
 from typing import Union
 
-import inflect
 from inverse_text_normalization.pa.data_loader_utils import get_abs_path
-_inflect = inflect.engine()
+
+_inflect = None
+
+
+def get_inflect():
+    """
+    Returns the inflect engine, created on first use since importing inflect is slow
+    """
+    global _inflect
+    if _inflect is None:
+        import inflect
+
+        _inflect = inflect.engine()
+    return _inflect
+
 
 data_path = 'data/numbers/'
+
+
 def num_to_word(x: Union[str, int]):
     """
     converts integer to spoken representation
@@ -30,7 +45,7 @@ def num_to_word(x: Union[str, int]):
     """
     if isinstance(x, int):
         x = str(x)
-        x = _inflect.number_to_words(str(x)).replace("-", " ").replace(",", "")
+        x = get_inflect().number_to_words(str(x)).replace("-", " ").replace(",", "")
     return x
 
 '''
@@ -0,0 +1,140 @@
+import re
+
+# Separator placed between digit groups. The sentence level formatter has been joining groups with an empty
+# string, so numbers are currently emitted ungrouped (e.g. 1001420); set this to ',' for 10,01,420.
+NUMBER_GROUP_SEPARATOR = ''
+
+CURRENCY_SIGNS = '$₹£€'
+
+# <currency><integer part><decimal part> surrounded by whitespace, trailing sentence punctuation is allowed.
+# Integer parts of up to three digits never need grouping and are left to the scan.
+NUMBER_TOKEN = re.compile(r'(?<!\S)([' + re.escape(CURRENCY_SIGNS) + r']?-?)(\d{4,})(\.\d+)?(?=[.,;!?।]*(?!\S))')
+NUMBER_WORD = re.compile(r'([' + re.escape(CURRENCY_SIGNS) + r']?-?)(\d{4,})(\.\d+)?([.,;!?।]*)')
+INDIAN_GROUP_BOUNDARY = re.compile(r'\B(?=(?:\d\d)+$)')
+WESTERN_GROUP_BOUNDARY = re.compile(r'\B(?=(?:\d{3})+$)')
+
+
+def group_digits(digits: str, indian: bool = True, separator: str = ',') -> str:
+    """
+    Groups the digits of an integer, e.g. 1001420 -> 10,01,420 (indian) or 1,001,420 (western)
+
+    Args:
+        digits: integer part of a number
+        indian: group in twos after the last three digits (lakh/crore) instead of in threes
+        separator: string placed between groups
+
+    Returns: grouped digits
+    """
+    if len(digits) <= 3:
+        return digits
+    boundary = INDIAN_GROUP_BOUNDARY if indian else WESTERN_GROUP_BOUNDARY
+    return boundary.sub(separator.replace('\\', r'\\'), digits[:-3]) + separator + digits[-3:]
+
+
+def format_numbers_with_commas(sent: str, lang: str, separator: str = None) -> str:
+    """
+    Groups the integer part of every numeric token in a sentence, e.g. ₹1001420.50 -> ₹10,01,420.50
+    Only tokens made of an optional currency sign, digits and an optional decimal part are rewritten.
+
+    Args:
+        sent: inverse normalized sentence
+        lang: 'hi' uses indian grouping, any other value western grouping
+        separator: group separator, defaults to NUMBER_GROUP_SEPARATOR
+
+    Returns: formatted sentence
+    """
+    if separator is None:
+        separator = NUMBER_GROUP_SEPARATOR
+    if not separator:
+        return sent
+    indian = lang == 'hi'
+    return NUMBER_TOKEN.sub(
+        lambda match: match.group(1) + group_digits(match.group(2), indian, separator) + (match.group(3) or ''),
+        sent,
+    )
+
+
+def format_word(word: str, indian: bool, separator: str) -> str:
+    """
+    Groups the integer part of a single numeric word, other words are returned unchanged
+
+    Args:
+        word: word without spaces
+        indian: use indian grouping instead of western
+        separator: group separator
+
+    Returns: formatted word
+    """
+    match = NUMBER_WORD.fullmatch(word)
+    if not match:
+        return word
+    return match.group(1) + group_digits(match.group(2), indian, separator) + (match.group(3) or '') + match.group(4)
+
+
+def post_process_sentence(sent: str, currency_signs: str = CURRENCY_SIGNS, format_lang: str = None,
+                          separator: str = None, keep_short_zeros: bool = True) -> str:
+    """
+    Single pass over an inverse normalized sentence shared by all languages. Every word is visited once to
+        - split a leading currency sign from the amount, e.g. ₹500 -> ₹ 500
+        - remove leading zeros left by the grammars, e.g. 0001420 -> 1420, 0000 -> ''
+        - group the digits of numbers when format_lang is given, e.g. 1001420 -> 10,01,420
+
+    Args:
+        sent: inverse normalized sentence
+        currency_signs: currency signs that are split from the amount
+        format_lang: 'hi' for indian grouping, any other language for western grouping, None to skip grouping
+        separator: group separator, defaults to NUMBER_GROUP_SEPARATOR
+        keep_short_zeros: keep 0, 00 and 000 as they are, dropping a currency sign before them. Assamese has always
+            trimmed them like longer runs of zeros instead, e.g. 00 -> '' and ₹0 -> '₹ '
+
+    Returns: post processed sentence
+    """
+    if separator is None:
+        separator = NUMBER_GROUP_SEPARATOR
+    group = bool(format_lang) and bool(separator)
+    indian = format_lang == 'hi'
+
+    words = []
+    for word in sent.replace('\r', '').split(' '):
+        if not word:
+            words.append(word)
+            continue
+
+        currency = ''
+        if word[0] in currency_signs:
+            currency = word[0]
+            word = word[1:]
+
+        if keep_short_zeros and (word == '0' or word == '00' or word == '000'):
+            # the currency sign is dropped here and for single digit decimals below, as it always has been
+            words.append(word)
+            continue
+        if not word.lstrip('0'):  # all the digits in num are zero eg: "00000000"
+            word = ''
+        elif word[0] in '0123456789' and len(word) > 1:
+            if word.find('.') == 1:
+                words.append(word)
+                continue
+            word = word.lstrip('0')
+
+        if group:
+            word = format_word(word, indian, separator)
+        words.append(currency + ' ' + word if currency else word)
+    return ' '.join(words)
+
+
+def remove_starting_zeros(word: str, hindi_digits_with_zero: str = None, currency_signs: str = CURRENCY_SIGNS,
+                          keep_short_zeros: bool = True) -> str:
+    """
+    Word level zero trimming and currency splitting, kept for callers of the former per-language helper.
+    hindi_digits_with_zero is accepted for backwards compatibility only, digits are always 0-9. Each
+    <lang>/run_predict binds currency_signs and keep_short_zeros of its language.
+    """
+    return post_process_sentence(word, currency_signs=currency_signs, keep_short_zeros=keep_short_zeros)
+
+
+def indian_format(word: str, hindi_digits_with_zero: str = None) -> str:
+    """
+    Word level indian grouping with commas, kept for callers of the former per-language helper.
+    """
+    return format_word(word, indian=True, separator=',')
@@ -0,0 +1,332 @@
+import importlib
+import itertools
+import os
+import random
+import subprocess
+import sys
+import time
+from argparse import ArgumentParser
+from itertools import cycle, islice
+from typing import Callable, List, Tuple
+
+from inverse_text_normalization.cardinal_parser import (CRORE, DIGIT, FAST_ENGINE_PACKAGES, LAKH,
+                                                        PLACE_VALUE_PACKAGES, TENS, THOUSAND, CardinalParser)
+from inverse_text_normalization.post_processing import format_numbers_with_commas, post_process_sentence
+from inverse_text_normalization.run_predict import LANG_PACKAGES, get_itn_function
+
+'''
+Benchmarks parts of the inverse text normalization pipeline
+
+Example usage:
+python -m inverse_text_normalization.run_benchmark --benchmark formatting --sentences 100000
+python -m inverse_text_normalization.run_benchmark --benchmark composition --langs hi ta --words 50 200 800
+python -m inverse_text_normalization.run_benchmark --benchmark cardinal --langs hi mr --sentences 20000
+python -m inverse_text_normalization.run_benchmark --benchmark imports --langs hi en
+'''
+
+COMPOSITION_SENTENCES = {
+    'hi': 'रीटा के पास चार सौ बीस बिल्लियाँ हैं मुझे दो सौ पानी की बोतल दो एक हज़ार चार सौ बीस',
+    'ta': 'என்னிடம் இருபத்து நான்கு பேனாக்கள் உள்ளன தொண்ணூற்றிநான்கு கோடி ஐந்து இலட்சம் முந்நூறு இருபத்து இரண்டு',
+}
+
+# cold import budget in milliseconds of the entry points, measured in a fresh interpreter
+IMPORT_BUDGETS_MS = {
+    'inverse_text_normalization.run_predict': 500,
+    'punctuate.punctuate_text': 200,
+}
+# dependencies that take seconds to import and must only be loaded by the code path that uses them
+HEAVY_MODULES = ('torch', 'transformers', 'nemo', 'indicnlp', 'inflect', 'tqdm')
+
+
+def parse_args():
+    parser = ArgumentParser()
+    parser.add_argument("--benchmark", help="benchmark to run",
+                        choices=['formatting', 'composition', 'cardinal', 'imports'], default='formatting', type=str)
+    parser.add_argument("--sentences", help="number of generated sentences", type=int, default=100000)
+    parser.add_argument("--repeat", help="timed runs, the best one is reported", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--langs", help="languages for the composition, cardinal and imports benchmarks", nargs='+',
+                        default=None)
+    parser.add_argument("--words", help="line lengths for the composition benchmark", nargs='+', type=int,
+                        default=[50, 200, 800])
+    parser.add_argument("--prune_threshold", help="also time decoding with lattice pruning", type=float,
+                        default=None)
+    return parser.parse_args()
+
+
+def legacy_format_numbers_with_commas(sent, lang, separator=''):
+    """
+    Word by word formatter used before post_processing.format_numbers_with_commas, kept as benchmark reference
+    """
+    words = []
+    for word in sent.split(' '):
+        word_contains_digit = any(map(str.isdigit, word))
+        currency_sign = ''
+        if word_contains_digit:
+            if len(word) > 4 and ':' not in word:
+                pos_of_first_digit_in_word = list(map(str.isdigit, word)).index(True)
+
+                if pos_of_first_digit_in_word != 0:  # word can be like $90,00,936.59
+                    currency_sign = word[:pos_of_first_digit_in_word]
+                    word = word[pos_of_first_digit_in_word:]
+
+                s, *d = str(word).partition(".")
+                if lang == 'hi':
+                    r = separator.join([s[x - 2:x] for x in range(-3, -len(s), -2)][::-1] + [s[-3:]])
+                else:
+                    r = separator.join([s[x - 3:x] for x in range(-3, -len(s), -3)][::-1] + [s[-3:]])
+
+                word = "".join([r] + d)
+
+                if currency_sign:
+                    word = currency_sign + word
+                words.append(word)
+            else:
+                words.append(word)
+        else:
+            words.append(word)
+    return ' '.join(words)
+
+
+def generate_itn_outputs(num_sentences: int, seed: int = 0) -> List[str]:
+    """
+    Generates sentences resembling inverse normalized output: words mixed with integers, amounts, decimals and times
+
+    Args:
+        num_sentences: number of sentences
+        seed: random seed
+
+    Returns: list of sentences
+    """
+    rng = random.Random(seed)
+    words = ['मेरे', 'पास', 'रुपये', 'हैं', 'किलो', 'और', 'कुल', 'लोग', 'आए', 'में']
+
+    def number():
+        kind = rng.random()
+        value = str(rng.randint(0, 10 ** rng.randint(1, 10)))
+        if kind < 0.2:
+            return '₹' + value
+        if kind < 0.3:
+            return value + '.' + str(rng.randint(0, 99))
+        if kind < 0.35:
+            return f'{rng.randint(0, 23)}:{rng.randint(10, 59)}'
+        return value
+
+    return [' '.join(number() if rng.random() < 0.3 else rng.choice(words) for _ in range(rng.randint(3, 30)))
+            for _ in range(num_sentences)]
+
+
+def time_function(function: Callable, sentences: List[str], repeat: int) -> float:
+    """
+    Returns the best wall time in seconds of applying function to every sentence
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for sent in sentences:
+            function(sent)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchmark_composition(langs: List[str], lengths: List[int], repeat: int, prune_threshold: float = None):
+    """
+    Times tagging of long lines with the load time prepared grammar against the previous decoding
+    (grammar as built, shortestpath with unique=True) and checks that both give the same tagged text
+    """
+    import pynini
+
+    for lang in langs:
+        module = importlib.import_module(f'inverse_text_normalization.{LANG_PACKAGES[lang]}.inverse_normalize')
+        unprepared_fst = module.ClassifyFinalFst().fst
+        words = COMPOSITION_SENTENCES[lang].split()
+
+        runs = [
+            ('previous', lambda text: pynini.shortestpath(text @ unprepared_fst, nshortest=1, unique=True).string()),
+            ('prepared', lambda text: module.select_tag(module.find_tags(text))),
+        ]
+        if prune_threshold is not None:
+            runs.append(('prepared, pruned',
+                         lambda text: module.select_tag(module.find_tags(text), prune_threshold)))
+
+        for length in lengths:
+            text = pynini.escape(' '.join(islice(cycle(words), length)))
+            outputs = {name: function(text) for name, function in runs}
+            if len(set(outputs.values())) != 1:
+                raise ValueError(f"{lang}: tagged output differs between decoders for {length} words")
+            for name, function in runs:
+                seconds = time_function(function, [text], repeat)
+                print(f'{lang} {length:>5} words {name:>17}: {seconds * 1000:.1f}ms')
+
+
+def spell_cardinals(parser: CardinalParser, values: List[int], seed: int = 0, tens_hundreds: float = 0.3) -> List[str]:
+    """
+    Spells numbers 1 <= value < 10^11 with spellings chosen at random from the lexicons of a cardinal parser. With
+    probability tens_hundreds the hundreds of a group are prefixed by tens, e.g. उन्नीस सौ for 1900: crore
+    coefficients of 1100 and more are always spelled that way, and thousands below ten with their hundreds, e.g.
+    दो लाख पंद्रह सौ, which the parser accepts only without a higher magnitude before it
+    """
+    rng = random.Random(seed)
+    below_hundred, magnitudes = {}, {}
+    for entries in parser.trie.values():
+        for kind, words, number in itertools.chain.from_iterable(entries.values()):
+            if kind in (DIGIT, TENS):
+                below_hundred.setdefault(number, []).append(' '.join(words))
+    for word, magnitude in sorted(parser.magnitudes.items()):
+        magnitudes.setdefault(magnitude, []).append(word)
+    hundreds = sorted(parser.hundreds)
+
+    def group(number):
+        # numbers of 1100 and more get their hundreds prefixed by tens
+        words = []
+        if number >= 100:
+            if number // 100 > 1 or rng.random() < 0.5:
+                words.append(rng.choice(below_hundred[number // 100]))
+            words.append(rng.choice(hundreds))
+        if number % 100:
+            words.append(rng.choice(below_hundred[number % 100]))
+        return words
+
+    sentences = []
+    for value in values:
+        words = []
+        for magnitude, coefficient in ((CRORE, value // CRORE), (LAKH, value // LAKH % 100)):
+            if coefficient:
+                words += group(coefficient) + [rng.choice(magnitudes[magnitude])]
+        tail = value % LAKH
+        if 1100 <= tail < 10000 and tail // 100 in below_hundred and rng.random() < tens_hundreds:
+            words += group(tail)
+        else:
+            if tail // THOUSAND:
+                words += group(tail // THOUSAND) + [rng.choice(magnitudes[THOUSAND])]
+            words += group(tail % THOUSAND)
+        sentences.append(' '.join(words))
+    return sentences
+
+
+def benchmark_cardinal(langs: List[str], num_sentences: int, repeat: int, seed: int = 0):
+    """
+    Differential test of the pure python cardinal parser against the grammars on generated numbers 1..10^11:
+    every line the parser accepts must be inverse normalized to the same text by both engines. Languages of any place
+    value grammar can be compared, the fast engine only uses the parser for FAST_ENGINE_PACKAGES
+    """
+    for lang in langs:
+        if LANG_PACKAGES[lang] not in PLACE_VALUE_PACKAGES:
+            print(f'{lang}: no cardinal parser')
+            continue
+        parser = CardinalParser.from_package(LANG_PACKAGES[lang])
+        rng = random.Random(seed)
+        values = [rng.randint(1, 10 ** rng.randint(1, 11) - 1) for _ in range(num_sentences)]
+        sentences = spell_cardinals(parser, values, seed)
+
+        parsed = [parser.parse(sent) for sent in sentences]
+        accepted = [(sent, value, output) for sent, value, output in zip(sentences, values, parsed) if output]
+        fst_outputs = get_itn_function(lang)([sent for sent, _, _ in accepted], format_lang='hi')
+        mismatches = [(sent, fst_output, post_process_sentence(output, format_lang='hi'))
+                      for (sent, _, output), fst_output in zip(accepted, fst_outputs)
+                      if fst_output != post_process_sentence(output, format_lang='hi')]
+        wrong_values = sum(output != str(value) for _, value, output in accepted)
+
+        print(f'{lang}: {len(accepted)}/{len(sentences)} lines parsed, {len(mismatches)} differ from the grammars, '
+              f'{wrong_values} parsed to a different value than spelled')
+        for sent, fst_output, output in mismatches[:10]:
+            print(f'    {sent!r}: fst {fst_output!r}, parser {output!r}')
+        if mismatches:
+            raise ValueError(f"{lang}: cardinal parser output differs from the grammars")
+
+        accepted_sentences = [sent for sent, _, _ in accepted]
+        runs = [
+            ('fst', lambda sent: get_itn_function(lang)([sent], format_lang='hi')),
+            ('parser', lambda sent: post_process_sentence(parser.parse(sent), format_lang='hi')),
+        ]
+        for name, function in runs:
+            seconds = time_function(function, accepted_sentences, repeat)
+            print(f'{lang} {name:>7}: {seconds:.3f}s  {len(accepted_sentences) / seconds:,.0f} lines/s')
+
+
+def profile_import(module: str) -> Tuple[float, List[str]]:
+    """
+    Imports a module in a fresh interpreter with -X importtime
+
+    Args:
+        module: module name, e.g. inverse_text_normalization.run_predict
+
+    Returns: cumulative import time of the module in seconds, heavy modules it loaded
+    """
+    src_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [src_dir, os.environ.get('PYTHONPATH')])))
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'], env=env,
+                             stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, universal_newlines=True)
+    if process.returncode != 0:
+        raise ValueError(f"importing {module} failed:\n{process.stderr}")
+
+    seconds = 0.0
+    loaded = set()
+    # lines look like 'import time:       512 |       2048 |   inverse_text_normalization.run_predict'
+    for line in process.stderr.splitlines():
+        columns = line.split('|')
+        if not line.startswith('import time:') or len(columns) != 3 or not columns[1].strip().isdigit():
+            continue
+        name = columns[2].strip()
+        loaded.add(name.split('.')[0])
+        if name == module:
+            seconds = int(columns[1]) / 1e6
+    return seconds, sorted(loaded.intersection(HEAVY_MODULES))
+
+
+def benchmark_imports(langs: List[str], repeat: int):
+    """
+    Times cold imports of the entry points against IMPORT_BUDGETS_MS and checks that none of them loads a heavy
+    dependency. Language packages build their grammars on import, they are only checked for heavy dependencies.
+    """
+    modules = dict(IMPORT_BUDGETS_MS)
+    for lang in langs:
+        modules[f'inverse_text_normalization.{LANG_PACKAGES[lang]}.inverse_normalize'] = None
+
+    failures = []
+    for module, budget in modules.items():
+        profiles = [profile_import(module) for _ in range(repeat)]
+        seconds = min(seconds for seconds, _ in profiles)
+        heavy = profiles[0][1]
+        print(f'{module:>50}: {seconds * 1000:7.1f}ms' + (f' (budget {budget}ms)' if budget else '') +
+              (f', loads {", ".join(heavy)}' if heavy else ''))
+        if heavy:
+            failures.append(f'{module} loads {heavy}')
+        if budget is not None and seconds * 1000 > budget:
+            failures.append(f'{module} takes {seconds * 1000:.0f}ms to import, budget {budget}ms')
+    if failures:
+        raise ValueError("Import benchmark failed: " + '; '.join(failures))
+
+
+def benchmark_formatting(num_sentences: int, repeat: int, seed: int = 0):
+    sentences = generate_itn_outputs(num_sentences, seed)
+    legacy = [legacy_format_numbers_with_commas(sent, lang='hi') for sent in sentences]
+    current = [format_numbers_with_commas(sent, lang='hi') for sent in sentences]
+    if legacy != current:
+        raise ValueError("format_numbers_with_commas output differs from the legacy formatter")
+
+    runs = [
+        ('legacy', lambda sent: legacy_format_numbers_with_commas(sent, lang='hi')),
+        ('regex', lambda sent: format_numbers_with_commas(sent, lang='hi')),
+        ('legacy, indian ","', lambda sent: legacy_format_numbers_with_commas(sent, lang='hi', separator=',')),
+        ('regex, indian ","', lambda sent: format_numbers_with_commas(sent, lang='hi', separator=',')),
+        ('regex, western ","', lambda sent: format_numbers_with_commas(sent, lang='en', separator=',')),
+    ]
+    print(f'{len(sentences)} sentences, {sum(len(sent) for sent in sentences) / 1e6:.1f}M characters')
+    for name, function in runs:
+        seconds = time_function(function, sentences, repeat)
+        print(f'{name:>20}: {seconds:.3f}s  {len(sentences) / seconds:,.0f} sentences/s')
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    if args.benchmark == 'formatting':
+        benchmark_formatting(args.sentences, args.repeat, args.seed)
+    elif args.benchmark == 'composition':
+        benchmark_composition(args.langs or list(COMPOSITION_SENTENCES), args.words, args.repeat,
+                              args.prune_threshold)
+    elif args.benchmark == 'cardinal':
+        langs = args.langs or [lang for lang, package in LANG_PACKAGES.items() if package in FAST_ENGINE_PACKAGES]
+        benchmark_cardinal(langs, args.sentences, args.repeat, args.seed)
+    elif args.benchmark == 'imports':
+        benchmark_imports(args.langs or [], args.repeat)
@@ -1,114 +1,139 @@
-from inverse_text_normalization.hi.run_predict import inverse_normalize_text as hi_itn
-from inverse_text_normalization.en.run_predict import inverse_normalize_text as en_itn
-from inverse_text_normalization.gu.run_predict import inverse_normalize_text as gu_itn
-from inverse_text_normalization.te.run_predict import inverse_normalize_text as te_itn
-from inverse_text_normalization.mr.run_predict import inverse_normalize_text as mr_itn
-from inverse_text_normalization.pa.run_predict import inverse_normalize_text as pa_itn
-from inverse_text_normalization.ta.run_predict import inverse_normalize_text as ta_itn
-# from inverse_text_normalization.ta.run_predict import inverse_normalize_text as ta_itn
-from inverse_text_normalization.bn.run_predict import inverse_normalize_text as bn_itn
-from inverse_text_normalization.ml.run_predict import inverse_normalize_text as ml_itn
-from inverse_text_normalization.ori.run_predict import inverse_normalize_text as or_itn
-# from inverse_text_normalization.asm.run_predict import inverse_normalize_text as as_itn
-from inverse_text_normalization.kn.run_predict import inverse_normalize_text as kn_itn
-
-def format_numbers_with_commas(sent, lang):
-    words = []
-    for word in sent.split(' '):
-        word_contains_digit = any(map(str.isdigit, word))
-        currency_sign = ''
-        if word_contains_digit:
-            if len(word) > 4 and ':' not in word:
-                pos_of_first_digit_in_word = list(map(str.isdigit, word)).index(True)
-
-                if pos_of_first_digit_in_word != 0:  # word can be like $90,00,936.59
-                    currency_sign = word[:pos_of_first_digit_in_word]
-                    word = word[pos_of_first_digit_in_word:]
-
-                s, *d = str(word).partition(".")
-                # getting [num_before_decimal_point, decimal_point, num_after_decimal_point]
-                if lang == 'hi':
-                    # adding commas after every 2 digits after the last 3 digits
-                    r = "".join([s[x - 2:x] for x in range(-3, -len(s), -2)][::-1] + [s[-3:]])
-                else:
-                    r = "".join([s[x - 3:x] for x in range(-3, -len(s), -3)][::-1] + [s[-3:]])
-
-                word = "".join([r] + d)  # joining decimal points as is
-
-                if currency_sign:
-                    word = currency_sign + word
-                words.append(word)
-            else:
-                words.append(word)
-        else:
-            words.append(word)
-    return ' '.join(words)
-
-
-def inverse_normalize_text(text_list, lang):
-    if lang == 'hi':
-        itn_results = hi_itn(text_list)
-        itn_results_formatted = [format_numbers_with_commas(sent=sent, lang=lang) for sent in itn_results]
-        return itn_results_formatted
-    elif lang in ['en', 'en_bio']:
-        itn_results = en_itn(text_list)
-        itn_results_formatted = [format_numbers_with_commas(sent=sent, lang='hi') for sent in itn_results]
-        return itn_results_formatted
-    elif lang == 'ta':
-        itn_results = ta_itn(text_list)
-        itn_results_formatted = [format_numbers_with_commas(sent=sent, lang='hi') for sent in itn_results]
-        return itn_results_formatted
-    elif lang == 'or':
-        itn_results = or_itn(text_list)
-        itn_results_formatted = [format_numbers_with_commas(sent=sent, lang='hi') for sent in itn_results]
-        return itn_results_formatted
-    
-    #     return itn_results_formatted
-    elif lang == 'gu':
-        itn_results = gu_itn(text_list)
-        itn_results_formatted = [format_numbers_with_commas(sent=sent, lang='hi') for sent in itn_results]
-        return itn_results_formatted
-
-    elif lang == 'te':
-
-        itn_results = te_itn(text_list)
-        itn_results_formatted = [format_numbers_with_commas(sent=sent, lang='hi') for sent in itn_results]
-        return itn_results_formatted
-
-    elif lang == 'mr':
-
-        itn_results = mr_itn(text_list)
-        itn_results_formatted = [format_numbers_with_commas(sent=sent, lang='hi') for sent in itn_results]
-        return itn_results_formatted
-
-    elif lang == 'pa':
-
-        itn_results = pa_itn(text_list)
-        itn_results_formatted = [format_numbers_with_commas(sent=sent, lang='hi') for sent in itn_results]
-        return itn_results_formatted
-
-
-    elif lang == 'bn':
-
-        itn_results = bn_itn(text_list)
-        itn_results_formatted = [format_numbers_with_commas(sent=sent, lang='hi') for sent in itn_results]
-        return itn_results_formatted
-
-    elif lang == 'ml':
-
-        itn_results = ml_itn(text_list)
-        itn_results_formatted = [format_numbers_with_commas(sent=sent, lang='hi') for sent in itn_results]
-        return itn_results_formatted
-
-    # elif lang == 'as':
-
-    #     itn_results = as_itn(text_list)
-    #     itn_results_formatted = [format_numbers_with_commas(sent=sent, lang='hi') for sent in itn_results]
-    #     return itn_results_formatted
-
-    
-    elif lang == 'kn':
-
-        itn_results = kn_itn(text_list)
-        itn_results_formatted = [format_numbers_with_commas(sent=sent, lang='hi') for sent in itn_results]
-        return itn_results_formatted
+import importlib
+import multiprocessing
+from collections import deque
+from itertools import islice
+from typing import Iterable, Iterator, List
+
+from inverse_text_normalization.cardinal_parser import FAST_ENGINE_PACKAGES, get_cardinal_parser
+from inverse_text_normalization.lexicon_overlay import get_overlay
+from inverse_text_normalization.post_processing import post_process_sentence
+
+# language code -> package holding the grammars of that language. Languages are imported on first use,
+# so asking for one language does not build the grammars of all the others.
+LANG_PACKAGES = {
+    'hi': 'hi',
+    'en': 'en',
+    'en_bio': 'en',
+    'gu': 'gu',
+    'te': 'te',
+    'mr': 'mr',
+    'pa': 'pa',
+    'ta': 'ta',
+    'bn': 'bn',
+    'ml': 'ml',
+    'or': 'ori',
+    # 'as': 'asm',
+    'kn': 'kn',
+}
+
+# fst runs every line through the grammars, fast parses lines that are a single spoken cardinal in pure python
+# (see cardinal_parser.py) and sends the other lines, including sentences with cardinals, to the grammars. fast
+# supports the languages of cardinal_parser.FAST_ENGINE_PACKAGES only
+ENGINES = ('fst', 'fast')
+
+
+def check_engine(lang, engine):
+    """
+    Raises ValueError for unknown engines and for the fast engine on languages without a cardinal parser
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Unsupported engine: {engine}")
+    if engine == 'fast' and LANG_PACKAGES[lang] not in FAST_ENGINE_PACKAGES:
+        raise ValueError(f"The fast engine does not support language: {lang}, use engine='fst'")
+
+
+def get_itn_function(lang):
+    """
+    Imports the language package, building its grammars the first time, and returns its inverse_normalize_text
+    """
+    module = importlib.import_module(f'inverse_text_normalization.{LANG_PACKAGES[lang]}.run_predict')
+    return module.inverse_normalize_text
+
+
+def build_grammars(lang, classes=None):
+    """
+    Builds the grammars of a language for a semiotic class selection ahead of the first call that uses them
+    """
+    module = importlib.import_module(f'inverse_text_normalization.{LANG_PACKAGES[lang]}.inverse_normalize')
+    module.get_grammars(classes)
+
+
+def inverse_normalize_text(text_list, lang, engine='fst', classes=None, tenant=None):
+    if lang not in LANG_PACKAGES:
+        return None
+    check_engine(lang, engine)
+    # phrases of the tenant overlay (see lexicon_overlay.py) are tagged together with the grammars
+    overlay = get_overlay(tenant) if tenant is not None else None
+    # zero trimming, currency handling and digit grouping run in a single pass per sentence,
+    # every language is formatted with indian grouping
+    itn_function = get_itn_function(lang)
+    use_parser = engine == 'fast' and (classes is None or 'cardinal' in classes)
+    cardinal_parser = get_cardinal_parser(LANG_PACKAGES[lang]) if use_parser else None
+    if cardinal_parser is None:
+        return itn_function(text_list, format_lang='hi', classes=classes, tenant=tenant)
+
+    # lines with an overlay phrase are left to the grammars
+    cardinals = [None if overlay is not None and overlay.matches(text) else cardinal_parser.parse(text)
+                 for text in text_list]
+    others = [text for text, cardinal in zip(text_list, cardinals) if cardinal is None]
+    others = iter(itn_function(others, format_lang='hi', classes=classes, tenant=tenant) if others else [])
+    return [next(others) if cardinal is None else post_process_sentence(cardinal, format_lang='hi')
+            for cardinal in cardinals]
+
+
+def inverse_normalize_lines(lines: List[str], lang: str, engine: str = 'fst',
+                            classes: Iterable[str] = None, tenant: str = None) -> List[str]:
+    """
+    Inverse normalizes stripped lines, blank lines are kept blank so that outputs stay aligned with inputs
+    """
+    lines = [line.strip() for line in lines]
+    non_empty = [line for line in lines if line]
+    outputs = iter(inverse_normalize_text(non_empty, lang, engine, classes, tenant) if non_empty else [])
+    return [next(outputs) if line else '' for line in lines]
+
+
+def inverse_normalize_stream(lines: Iterable[str], lang: str, chunk_size: int = 1000,
+                             workers: int = 1, engine: str = 'fst', classes: Iterable[str] = None,
+                             tenant: str = None) -> Iterator[str]:
+    """
+    Lazily inverse normalizes an iterable of lines (e.g. an open file) in chunks, yielding outputs in input order.
+    At most 2 * workers chunks are held in memory at any time, whatever the input size.
+
+    Args:
+        lines: input lines
+        lang: language code
+        chunk_size: lines normalized per call
+        workers: number of worker processes, 1 normalizes in this process
+        engine: 'fst' or 'fast', see ENGINES
+        classes: semiotic classes to normalize, None for all classes of the language
+        tenant: tenant whose lexicon overlay applies, registered with lexicon_overlay.register_overlay
+
+    Returns: iterator of inverse normalized lines
+    """
+    if lang not in LANG_PACKAGES:
+        raise ValueError(f"Unsupported language: {lang}")
+    check_engine(lang, engine)
+    if tenant is not None:
+        get_overlay(tenant)
+    lines = iter(lines)
+    chunks = iter(lambda: list(islice(lines, chunk_size)), [])
+
+    if workers <= 1:
+        for chunk in chunks:
+            yield from inverse_normalize_lines(chunk, lang, engine, classes, tenant)
+        return
+
+    # build the grammars before starting the pool so that forked workers inherit them, with the tenant overlays
+    get_itn_function(lang)
+    if classes is not None:
+        build_grammars(lang, classes)
+    if engine == 'fast':
+        get_cardinal_parser(LANG_PACKAGES[lang])
+    with multiprocessing.Pool(workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.apply_async(inverse_normalize_lines, (chunk, lang, engine, classes, tenant)))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().get()
+        while pending:
+            yield from pending.popleft().get()
@@ -0,0 +1,151 @@
+import ast
+import csv
+import glob
+import os
+import string
+from functools import lru_cache
+from typing import FrozenSet, Iterable, List
+
+from inverse_text_normalization.run_predict import LANG_PACKAGES, check_engine, inverse_normalize_text
+
+'''
+Incremental inverse text normalization of growing ASR partial hypotheses
+
+Example usage:
+normalizer = StreamingInverseNormalizer('hi')
+normalizer.append('मुझे एक हज़ार')
+normalizer.append('चार सौ बिल्लियाँ')  # committed: 'मुझे 1400 बिल्लियाँ'
+normalizer.finalize()
+'''
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+PUNCTUATION = string.punctuation + '।॥'
+
+
+@lru_cache(maxsize=None)
+def grammar_vocabulary(package: str) -> FrozenSet[str]:
+    """
+    Collects every word the grammars of a language package can match: the words of its data tsv files (some list
+    the spoken form first, some last) and of the string literals of its taggers. Semiotic spans never contain
+    other words.
+
+    Args:
+        package: language package, e.g. 'hi'
+
+    Returns: lowercased words
+    """
+    vocabulary = set()
+    for path in glob.glob(os.path.join(PACKAGE_DIR, package, 'data', '**', '*.tsv'), recursive=True):
+        with open(path, encoding='utf-8') as f:
+            for row in csv.reader(f, delimiter='\t'):
+                for column in row:
+                    vocabulary.update(column.lower().split())
+    for path in glob.glob(os.path.join(PACKAGE_DIR, package, 'taggers', '*.py')):
+        with open(path, encoding='utf-8') as f:
+            tree = ast.parse(f.read())
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Constant) and isinstance(node.value, str):
+                vocabulary.update(node.value.lower().split())
+    return frozenset(vocabulary)
+
+
+class StreamingInverseNormalizer:
+    """
+    Inverse normalizes one utterance while its words arrive. Words up to the last word no semiotic span can
+    cross (a word outside the grammar vocabulary, or one ending with punctuation) are normalized once and
+    committed, only the open tail after it is normalized again on every update.
+
+    Args:
+        lang: language code
+        engine: 'fst' or 'fast', see run_predict.ENGINES
+        classes: semiotic classes to normalize, None for all classes of the language
+    """
+
+    def __init__(self, lang: str, engine: str = 'fst', classes: Iterable[str] = None):
+        if lang not in LANG_PACKAGES:
+            raise ValueError(f"Unsupported language: {lang}")
+        check_engine(lang, engine)
+        self.lang = lang
+        self.engine = engine
+        self.classes = None if classes is None else tuple(classes)
+        self.vocabulary = grammar_vocabulary(LANG_PACKAGES[lang])
+        self.reset()
+
+    def reset(self):
+        """
+        Starts a new utterance
+        """
+        self.committed_words = []
+        self.committed_outputs = []
+        self.tail = []
+        self._tail_output = ((), '')
+
+    def _closes_spans(self, word: str) -> bool:
+        core = word.strip(PUNCTUATION)
+        return word[-1] in PUNCTUATION or (core and core.lower() not in self.vocabulary)
+
+    def _normalize(self, words: List[str]) -> str:
+        return inverse_normalize_text([' '.join(words)], self.lang, self.engine, self.classes)[0]
+
+    def _commit_stable_prefix(self):
+        stable = max((i + 1 for i, word in enumerate(self.tail) if self._closes_spans(word)), default=0)
+        if stable:
+            self.committed_outputs.append(self._normalize(self.tail[:stable]))
+            self.committed_words += self.tail[:stable]
+            self.tail = self.tail[stable:]
+
+    @property
+    def committed(self) -> str:
+        """
+        Normalized text that later words can no longer change
+        """
+        return ' '.join(output for output in self.committed_outputs if output)
+
+    @property
+    def text(self) -> str:
+        """
+        Normalized text of the whole utterance so far, the part after `committed` is provisional
+        """
+        if self._tail_output[0] != tuple(self.tail):
+            self._tail_output = (tuple(self.tail), self._normalize(self.tail) if self.tail else '')
+        return ' '.join(output for output in (self.committed, self._tail_output[1]) if output)
+
+    def append(self, text: str) -> str:
+        """
+        Appends newly recognized words to the utterance
+
+        Args:
+            text: one or more words
+
+        Returns: normalized text of the whole utterance so far
+        """
+        self.tail += text.split()
+        self._commit_stable_prefix()
+        return self.text
+
+    def update(self, partial: str) -> str:
+        """
+        Replaces the utterance with a new partial hypothesis. Hypotheses usually only revise their last words,
+        when a committed word is revised the utterance is normalized again from the start.
+
+        Args:
+            partial: whole partial transcript of the utterance
+
+        Returns: normalized text of the whole utterance so far
+        """
+        words = partial.split()
+        if words[:len(self.committed_words)] != self.committed_words:
+            self.reset()
+        self.tail = words[len(self.committed_words):]
+        self._commit_stable_prefix()
+        return self.text
+
+    def finalize(self) -> str:
+        """
+        Commits the rest of the utterance and starts a new one
+
+        Returns: normalized text of the whole utterance
+        """
+        text = self.text
+        self.reset()
+        return text
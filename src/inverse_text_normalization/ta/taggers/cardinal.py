@@ -18,6 +18,7 @@ import pynini
 from pynini.lib import pynutil, utf8
 
 from inverse_text_normalization.ta.data_loader_utils import get_abs_path
+from inverse_text_normalization.lexicon_registry import load_rows, load_string_file
 from inverse_text_normalization.ta.graph_utils import (
     NEMO_DIGIT,
     NEMO_SIGMA,
@@ -57,34 +58,32 @@ class CardinalFst(GraphFst):
         # NEMO_NON_BREAKING_SPACE = u"\u00A0"
 
         tamil_digit_file = get_abs_path(data_path + "numbers/ta_digit.tsv")
-        with open(tamil_digit_file, encoding='utf-8') as f:
-            digits = f.readlines()
-        tamil_digits = ''.join([line.split()[-1] for line in digits])
+        tamil_digits = ''.join([row[-1] for row in load_rows(tamil_digit_file)])
         tamil_digits_with_zero = "0" + tamil_digits
 
         TAMIL_DIGIT = pynini.union(*tamil_digits).optimize()
         TAMIL_DIGIT_WITH_ZERO = pynini.union(*tamil_digits_with_zero).optimize()
 
-        tamil_graph_zero = pynini.string_file(get_abs_path(data_path + "numbers/ta_zero.tsv"))
-        tamil_graph_tens = pynini.string_file(get_abs_path(data_path + "numbers/ta_tens.tsv"))
-        tamil_graph_digit = pynini.string_file(get_abs_path(data_path + "numbers/ta_digit.tsv"))
-        tamil_graph_hundred_digit = pynini.string_file(get_abs_path(data_path + "numbers/ta_hundred_digit.tsv"))
-        tamil_graph_thousand_digit = pynini.string_file(get_abs_path(data_path + "numbers/ta_thousand_digit.tsv"))
-        tamil_graph_lakh_digit = pynini.string_file(get_abs_path(data_path + "numbers/ta_lakh_digit.tsv"))
-        tamil_graph_crore_digit = pynini.string_file(get_abs_path(data_path + "numbers/ta_crore_digit.tsv"))
-        tamil_graph_exception_list = pynini.string_file(get_abs_path(data_path + "numbers/ta_exceptions.tsv"))
-        tamil_hundreds = pynini.string_file(get_abs_path(data_path + "numbers/ta_hundreds.tsv"))
-        tamil_thousands = pynini.string_file(get_abs_path(data_path + "numbers/ta_thousands.tsv"))
-
-
-
-        graph_zero = pynini.string_file(get_abs_path(data_path + "numbers/zero.tsv"))  
-        graph_digit = pynini.string_file(get_abs_path(data_path + "numbers/digit.tsv"))
-        graph_multiples = pynini.string_file(get_abs_path(data_path + "numbers/multiples.tsv"))
-        graph_ties = pynini.string_file(get_abs_path(data_path + "numbers/ties.tsv"))
-        graph_chars = pynini.string_file(get_abs_path(data_path + "numbers/alphabets.tsv"))
-        graph_char_multiples = pynini.string_file(get_abs_path(data_path + "numbers/multiples_alphabets.tsv"))
-        graph_tens_en = pynini.string_file(get_abs_path(data_path + "numbers/tens-en.tsv"))
+        tamil_graph_zero = load_string_file(get_abs_path(data_path + "numbers/ta_zero.tsv"))
+        tamil_graph_tens = load_string_file(get_abs_path(data_path + "numbers/ta_tens.tsv"))
+        tamil_graph_digit = load_string_file(get_abs_path(data_path + "numbers/ta_digit.tsv"))
+        tamil_graph_hundred_digit = load_string_file(get_abs_path(data_path + "numbers/ta_hundred_digit.tsv"))
+        tamil_graph_thousand_digit = load_string_file(get_abs_path(data_path + "numbers/ta_thousand_digit.tsv"))
+        tamil_graph_lakh_digit = load_string_file(get_abs_path(data_path + "numbers/ta_lakh_digit.tsv"))
+        tamil_graph_crore_digit = load_string_file(get_abs_path(data_path + "numbers/ta_crore_digit.tsv"))
+        tamil_graph_exception_list = load_string_file(get_abs_path(data_path + "numbers/ta_exceptions.tsv"))
+        tamil_hundreds = load_string_file(get_abs_path(data_path + "numbers/ta_hundreds.tsv"))
+        tamil_thousands = load_string_file(get_abs_path(data_path + "numbers/ta_thousands.tsv"))
+
+
+
+        graph_zero = load_string_file(get_abs_path(data_path + "numbers/zero.tsv"))  
+        graph_digit = load_string_file(get_abs_path(data_path + "numbers/digit.tsv"))
+        graph_multiples = load_string_file(get_abs_path(data_path + "numbers/multiples.tsv"))
+        graph_ties = load_string_file(get_abs_path(data_path + "numbers/ties.tsv"))
+        graph_chars = load_string_file(get_abs_path(data_path + "numbers/alphabets.tsv"))
+        graph_char_multiples = load_string_file(get_abs_path(data_path + "numbers/multiples_alphabets.tsv"))
+        graph_tens_en = load_string_file(get_abs_path(data_path + "numbers/tens-en.tsv"))
 
         cents = pynini.accep("ஹண்ட்ரட்‌") | pynini.accep("ஹண்ட்ரெட்‌") | pynini.accep("ஹன்ட்ரட்‌") | pynini.accep("ஹன்ட்ரெட்‌") | pynini.accep("ஹண்ட்ரட்") | pynini.accep("ற்று") | pynini.accep('த்தி') | pynini.accep('நூற்று') | pynini.accep('நூறு') | pynini.accep('ஒன்று நூறு') | pynini.accep('நூத்தி') | pynini.accep('நூற்றுப்') | pynini.accep('நூற்றை')
         thousands = pynini.accep("தவுசண்ட்‌") | pynini.accep("தௌசண்ட்‌") | pynini.accep("தௌசண்ட்‌") | pynini.accep("தௌசண்ட்") | pynini.accep('யிரத்து') | pynini.accep('யிரத்தி') | pynini.accep('யிரம்') | pynini.accep('ஆயிரம்') | pynini.accep('ஆயிரத்து') | pynini.accep('வாயிரம்') | pynini.accep('ஆாயிரம்') | pynini.accep('ஆயிரத்தி') | pynini.accep('ஆாயிரத்தி') | pynini.accep('ஓராயிரம்') | pynini.accep('ஆயிரத்திப்')
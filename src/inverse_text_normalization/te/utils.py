@@ -14,9 +14,19 @@
 
 from typing import Union
 
-import inflect
+_inflect = None
 
-_inflect = inflect.engine()
+
+def get_inflect():
+    """
+    Returns the inflect engine, created on first use since importing inflect is slow
+    """
+    global _inflect
+    if _inflect is None:
+        import inflect
+
+        _inflect = inflect.engine()
+    return _inflect
 
 
 def num_to_word(x: Union[str, int]):
@@ -30,5 +40,5 @@ def num_to_word(x: Union[str, int]):
     """
     if isinstance(x, int):
         x = str(x)
-        x = _inflect.number_to_words(str(x)).replace("-", " ").replace(",", "")
+        x = get_inflect().number_to_words(str(x)).replace("-", " ").replace(",", "")
     return x
@@ -0,0 +1,117 @@
+import importlib
+import multiprocessing
+import sys
+import time
+from argparse import ArgumentParser
+from collections import namedtuple
+from typing import Dict, FrozenSet, Iterable, List, Tuple
+
+from inverse_text_normalization.fst_utils import (SEMIOTIC_CLASSES, far_bytes_to_fsts, fsts_to_far_bytes,
+                                                  preload_grammars, select_classes)
+from inverse_text_normalization.grammar_cache import GrammarCache
+from inverse_text_normalization.run_predict import LANG_PACKAGES
+
+'''
+Builds the grammars of several languages concurrently, one worker process per language package, so that a service
+handling many languages starts in about the time of its slowest language instead of the sum of all of them.
+Workers send the compiled tagger and verbalizer back as FAR bytes, which the language packages take over on import.
+
+Example usage:
+from inverse_text_normalization.warmup import warmup
+warmup(['hi', 'en', 'ta', 'bn'])
+
+python -m inverse_text_normalization.warmup --langs hi en gu te mr pa ta bn ml or kn
+'''
+
+# warmup report of one language package, build_seconds is spent in the worker, load_seconds in this process
+LanguageWarmup = namedtuple('LanguageWarmup', 'package build_seconds load_seconds far_bytes')
+
+
+def parse_args():
+    parser = ArgumentParser()
+    parser.add_argument("--langs", help="languages to build", nargs='+', choices=sorted(LANG_PACKAGES),
+                        required=True)
+    parser.add_argument("--workers", help="worker processes, one per language package by default", type=int,
+                        default=None)
+    parser.add_argument("--classes", help="semiotic classes to build", nargs='+', choices=SEMIOTIC_CLASSES,
+                        default=None)
+    parser.add_argument("--cache_dir", help="grammar component cache, see build_grammars.py", type=str,
+                        default=None)
+    return parser.parse_args()
+
+
+def _build_package(task: Tuple[str, Tuple[str, ...], str]) -> Tuple[str, Dict[FrozenSet[str], bytes], float]:
+    """
+    Worker: builds the taggers and verbalizers of a language package for its default classes, which importing the
+    package needs, and for the requested classes. Returns them as FAR bytes by class selection.
+    """
+    package, classes, cache_dir = task
+    start = time.perf_counter()
+    cache = GrammarCache(cache_dir, package) if cache_dir else None
+    taggers = importlib.import_module(f'inverse_text_normalization.{package}.taggers.tokenize_and_classify')
+    tagger_final = importlib.import_module(f'inverse_text_normalization.{package}.taggers.tokenize_and_classify_final')
+    verbalizer_final = importlib.import_module(f'inverse_text_normalization.{package}.verbalizers.verbalize_final')
+
+    far_bytes = {}
+    for key in {select_classes(None, taggers.DEFAULT_CLASSES), select_classes(classes, taggers.DEFAULT_CLASSES)}:
+        far_bytes[key] = fsts_to_far_bytes({
+            'tokenize_and_classify_final': tagger_final.ClassifyFinalFst(key, cache).fst,
+            'verbalize_final': verbalizer_final.VerbalizeFinalFst(key, cache).fst,
+        })
+    return package, far_bytes, time.perf_counter() - start
+
+
+def warmup(langs: List[str], classes: Iterable[str] = None, workers: int = None,
+           cache_dir: str = None) -> Dict[str, LanguageWarmup]:
+    """
+    Builds the grammars of languages in parallel worker processes and loads them into this process. Language
+    packages that are already imported are skipped.
+
+    Args:
+        langs: language codes
+        classes: semiotic classes to build besides the default classes of every language
+        workers: number of worker processes, one per language package if None
+        cache_dir: optional grammar component cache directory shared by the workers, see grammar_cache.py
+
+    Returns: language package -> warmup report
+    """
+    unknown = [lang for lang in langs if lang not in LANG_PACKAGES]
+    if unknown:
+        raise ValueError(f"Unsupported languages: {unknown}")
+    classes = None if classes is None else tuple(classes)
+    packages = list(dict.fromkeys(LANG_PACKAGES[lang] for lang in langs))
+    tasks = [(package, classes, cache_dir) for package in packages
+             if f'inverse_text_normalization.{package}.inverse_normalize' not in sys.modules]
+
+    report = {}
+    if tasks:
+        with multiprocessing.Pool(workers or len(tasks)) as pool:
+            for package, far_bytes, build_seconds in pool.imap_unordered(_build_package, tasks):
+                start = time.perf_counter()
+                for key, data in far_bytes.items():
+                    fsts = far_bytes_to_fsts(data)
+                    preload_grammars(package, key, fsts['tokenize_and_classify_final'], fsts['verbalize_final'])
+                report[package] = LanguageWarmup(package, build_seconds, time.perf_counter() - start,
+                                                 sum(map(len, far_bytes.values())))
+
+    # importing the language packages takes over the preloaded grammars
+    for package in packages:
+        start = time.perf_counter()
+        module = importlib.import_module(f'inverse_text_normalization.{package}.inverse_normalize')
+        module.get_grammars(classes)
+        importlib.import_module(f'inverse_text_normalization.{package}.run_predict')
+        if package in report:
+            load_seconds = report[package].load_seconds + time.perf_counter() - start
+            report[package] = report[package]._replace(load_seconds=load_seconds)
+    return report
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    start = time.perf_counter()
+    report = warmup(args.langs, args.classes, args.workers, args.cache_dir)
+    for package, build_seconds, load_seconds, far_bytes in sorted(report.values(), key=lambda item: item.package):
+        print(f'{package:>4}: built in {build_seconds:7.2f}s, loaded in {load_seconds:5.2f}s, '
+              f'{far_bytes / 1e6:6.1f}MB')
+    print(f'total: {time.perf_counter() - start:.2f}s, sum of build times: '
+          f'{sum(item.build_seconds for item in report.values()):.2f}s')
@@ -0,0 +1,143 @@
+import asyncio
+import queue
+import threading
+import time
+from collections import Counter
+
+'''
+Asyncio front end that batches concurrent punctuation requests. Requests are queued and coalesced into micro
+batches of up to max_batch_size texts, waiting at most max_wait_ms for a batch to fill, and every batch is punctuated
+with one punctuate_text call on a dedicated inference thread, so the event loop is never blocked by the model.
+
+Example usage:
+from punctuate.batching import BatchingPunctuator
+from punctuate.punctuate_text import Punctuation
+
+punctuator = BatchingPunctuator(Punctuation('hi'), max_batch_size=32, max_wait_ms=5)
+
+async def handler(request):
+    return await punctuator.punctuate(request.text)
+
+await punctuator.aclose()   # on shutdown
+'''
+
+
+class BatchingPunctuator:
+    '''
+    Punctuates texts of concurrent coroutines in batches
+
+    Args:
+        punctuation: loaded punctuate_text.Punctuation model, only used by the inference thread
+        max_batch_size: texts per punctuate_text call
+        max_wait_ms: time a batch waits for more texts after its first one
+    '''
+
+    def __init__(self, punctuation, max_batch_size=32, max_wait_ms=5.0):
+        if max_batch_size < 1:
+            raise ValueError('max_batch_size must be at least 1')
+        self.punctuation = punctuation
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self._requests = queue.Queue()
+        self._lock = threading.Lock()
+        self._batch_sizes = Counter()
+        self._max_queue_depth = 0
+        self._busy_seconds = 0.0
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name='punctuation-inference', daemon=True)
+        self._thread.start()
+
+    async def punctuate(self, text):
+        '''
+        Returns the punctuated text, once the batch it was queued into has run
+        '''
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        # checked and queued under the lock, so no request can be queued behind the sentinel queued by close
+        with self._lock:
+            if self._closed:
+                raise RuntimeError('BatchingPunctuator is closed')
+            self._requests.put((text, future, loop))
+            self._max_queue_depth = max(self._max_queue_depth, self._requests.qsize())
+        return await future
+
+    def _next_batch(self):
+        first = self._requests.get()
+        if first is None:
+            return None
+        batch = [first]
+        deadline = time.perf_counter() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - time.perf_counter()
+            try:
+                request = self._requests.get(timeout=timeout) if timeout > 0 else self._requests.get_nowait()
+            except queue.Empty:
+                break
+            if request is None:
+                # finish the batch, then stop
+                self._requests.put(None)
+                break
+            batch.append(request)
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            start = time.perf_counter()
+            try:
+                results = self.punctuation.punctuate_text([text for text, _, _ in batch])
+                error = None
+            except Exception as e:
+                results, error = [None] * len(batch), e
+            with self._lock:
+                self._batch_sizes[len(batch)] += 1
+                self._busy_seconds += time.perf_counter() - start
+            for (_, future, loop), result in zip(batch, results):
+                loop.call_soon_threadsafe(_resolve, future, result, error)
+
+    def metrics(self):
+        '''
+        Returns queue and batching statistics since the punctuator was created
+        '''
+        with self._lock:
+            batches = sum(self._batch_sizes.values())
+            requests = sum(size * count for size, count in self._batch_sizes.items())
+            return {
+                'queue_depth': self._requests.qsize(),
+                'max_queue_depth': self._max_queue_depth,
+                'requests': requests,
+                'batches': batches,
+                'mean_batch_size': requests / batches if batches else 0.0,
+                'batch_sizes': dict(sorted(self._batch_sizes.items())),
+                'inference_seconds': self._busy_seconds,
+            }
+
+    def close(self):
+        '''
+        Punctuates the queued texts and stops the inference thread. Blocks until the queued texts are punctuated, use
+        aclose from a coroutine
+        '''
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._requests.put(None)
+        self._thread.join()
+
+    async def aclose(self):
+        '''
+        close without blocking the event loop
+        '''
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+
+def _resolve(future, result, error):
+    # the awaiting coroutine may have been cancelled meanwhile
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
@@ -0,0 +1,126 @@
+import json
+import os
+from typing import Optional, Sequence
+
+'''
+TorchScript cache of the ALBERT punctuation models for CPU inference. The loaded token classification model is
+traced once with representative input lengths, frozen and saved next to <lang>.pt as <lang>.torchscript.pt. Later
+starts load the saved graph instead of tracing again. The graph is only used if it was traced from the same
+weights with the same torch and transformers versions, otherwise it is traced again, and Punctuation falls back to
+the eager model if tracing fails or the graph can not run an input.
+
+Example usage:
+from punctuate.punctuate_text import Punctuation
+hindi = Punctuation('hi', compiled=True)
+'''
+
+# input lengths in subword tokens the model is traced with, and batch sizes, the traced graph is checked against the
+# eager model on every combination of them. get_logits sends it padded batches of equal length sentences too, so a
+# graph that baked in the batch dimension has to be caught here
+TRACE_LENGTHS = (16, 64)
+TRACE_BATCH_SIZES = (1, 4)
+METADATA_FILE = 'metadata.json'
+
+
+def compile_metadata(weights_path: str) -> dict:
+    """
+    Returns what a compiled graph depends on: the library versions and the weights file it was traced from
+
+    Args:
+        weights_path: file the eager model weights were loaded from
+
+    Returns: json serializable metadata
+    """
+    import torch
+    import transformers
+
+    stat = os.stat(weights_path)
+    return {
+        'torch': torch.__version__,
+        'transformers': transformers.__version__,
+        'weights': os.path.basename(weights_path),
+        'weights_size': stat.st_size,
+        'weights_mtime_ns': stat.st_mtime_ns,
+        'checked_batch_sizes': list(TRACE_BATCH_SIZES),
+    }
+
+
+def _logits_module(model):
+    import torch
+
+    class TokenClassificationLogits(torch.nn.Module):
+        """
+        Returns the logits of a transformers token classification model as a plain tensor, which tracing needs
+        """
+
+        def __init__(self, model):
+            super().__init__()
+            self.model = model
+
+        def forward(self, input_ids):
+            return self.model(input_ids, return_dict=False)[0]
+
+    return TokenClassificationLogits(model).eval()
+
+
+def trace(model, lengths: Sequence[int] = TRACE_LENGTHS, batch_sizes: Sequence[int] = TRACE_BATCH_SIZES,
+          tolerance: float = 1e-4):
+    """
+    Traces and freezes a token classification model for CPU inference
+
+    Args:
+        model: eager transformers token classification model on cpu
+        lengths: input lengths traced with and checked, the first one is traced
+        batch_sizes: batch sizes checked on every length, the first one is traced
+        tolerance: largest allowed difference between traced and eager logits
+
+    Returns: frozen TorchScript module mapping input ids of shape (batch, length) to logits, or None if the traced
+        graph does not reproduce the eager model on every length and batch size
+    """
+    import torch
+
+    module = _logits_module(model)
+    examples = [torch.randint(5, model.config.vocab_size, (batch_size, length))
+                for length in lengths for batch_size in batch_sizes]
+    with torch.no_grad():
+        traced = torch.jit.freeze(torch.jit.trace(module, examples[0], check_trace=False))
+        for input_ids in examples:
+            if not torch.allclose(traced(input_ids), module(input_ids), atol=tolerance):
+                return None
+    return traced
+
+
+def load_or_compile(model, compiled_path: str, weights_path: str) -> Optional['torch.jit.ScriptModule']:
+    """
+    Loads the compiled graph of a model if it is up to date, otherwise traces the model and saves the graph
+
+    Args:
+        model: eager transformers token classification model on cpu
+        compiled_path: file of the saved graph, e.g. <lang>.torchscript.pt
+        weights_path: file the eager model weights were loaded from
+
+    Returns: compiled module, None if the model could not be traced
+    """
+    import torch
+
+    metadata = compile_metadata(weights_path)
+    if os.path.exists(compiled_path):
+        extra_files = {METADATA_FILE: ''}
+        try:
+            compiled = torch.jit.load(compiled_path, map_location='cpu', _extra_files=extra_files)
+            if json.loads(extra_files[METADATA_FILE] or '{}') == metadata:
+                return compiled
+        except RuntimeError:
+            # saved by an incompatible torch version
+            pass
+
+    try:
+        compiled = trace(model)
+    except (RuntimeError, TypeError):
+        compiled = None
+    if compiled is None:
+        return None
+    temp_path = compiled_path + '.tmp'
+    torch.jit.save(compiled, temp_path, _extra_files={METADATA_FILE: json.dumps(metadata)})
+    os.replace(temp_path, compiled_path)
+    return compiled
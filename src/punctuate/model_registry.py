@@ -0,0 +1,136 @@
+import threading
+from collections import OrderedDict
+
+'''
+Registry of loaded punctuation models, one shared Punctuation instance per language, for processes serving many
+languages. The registry tracks the memory held by every model and evicts the least recently used languages once
+the models together exceed a memory budget. Hot languages can be preloaded in a background thread.
+
+Example usage:
+from punctuate.model_registry import PunctuationRegistry
+
+registry = PunctuationRegistry(memory_budget_mb=2000, preload=['hi', 'en'], download=False)
+registry.get('ta').punctuate_text(['உங்கள் பெயர் என்ன'])
+print(registry.stats())
+'''
+
+# languages served by the model of another language
+SHARED_MODELS = {'en_bio': 'en'}
+
+
+def model_size(punctuation) -> int:
+    '''
+    Returns the bytes held by the parameters and buffers of a loaded model
+    '''
+    model = punctuation.model
+    size = sum(tensor.numel() * tensor.element_size() for tensor in list(model.parameters()) + list(model.buffers()))
+    if getattr(punctuation, 'compiled_model', None) is not None:
+        # a frozen TorchScript graph holds its own copy of the weights as constants
+        size *= 2
+    return size
+
+
+class PunctuationRegistry:
+    '''
+    Loads Punctuation models on first use and keeps them within a memory budget
+
+    Args:
+        memory_budget_mb: memory the models may hold together, unlimited if None. The most recently used model is
+            never evicted, even if it alone exceeds the budget
+        preload: languages to load in a background thread right away
+        **punctuation_kwargs: passed to Punctuation, e.g. download=False or compiled=True
+    '''
+
+    def __init__(self, memory_budget_mb=None, preload=None, **punctuation_kwargs):
+        self.memory_budget = memory_budget_mb * 1e6 if memory_budget_mb is not None else None
+        self.punctuation_kwargs = punctuation_kwargs
+        # language -> (Punctuation, bytes), least recently used first
+        self._models = OrderedDict()
+        self._lock = threading.Lock()
+        self._loading = {}
+        self._counts = {'hits': 0, 'loads': 0, 'evictions': 0}
+        self.preload_errors = {}
+        self.preload_thread = self.preload(preload) if preload else None
+
+    def get(self, language_code):
+        '''
+        Returns the shared Punctuation instance of a language, loading it if needed. Loading a language may evict
+        others, instances already handed out stay usable but are no longer shared
+        '''
+        from punctuate.punctuate_text import Punctuation
+
+        language_code = SHARED_MODELS.get(language_code, language_code)
+        with self._lock:
+            if language_code in self._models:
+                return self._use(language_code)
+            load_lock = self._loading.setdefault(language_code, threading.Lock())
+
+        # other languages can be served and loaded meanwhile
+        with load_lock:
+            with self._lock:
+                if language_code in self._models:
+                    return self._use(language_code)
+            punctuation = Punctuation(language_code, **self.punctuation_kwargs)
+            with self._lock:
+                self._models[language_code] = (punctuation, model_size(punctuation))
+                self._counts['loads'] += 1
+                self._loading.pop(language_code, None)
+                self._evict(keep=language_code)
+            return punctuation
+
+    def _use(self, language_code):
+        self._models.move_to_end(language_code)
+        self._counts['hits'] += 1
+        return self._models[language_code][0]
+
+    def _evict(self, keep):
+        if self.memory_budget is None:
+            return
+        while self.resident_bytes() > self.memory_budget and len(self._models) > 1:
+            language_code = next(iter(self._models))
+            if language_code == keep:
+                self._models.move_to_end(language_code)
+                continue
+            del self._models[language_code]
+            self._counts['evictions'] += 1
+
+    def evict(self, language_code):
+        '''
+        Drops the model of a language from the registry
+        '''
+        with self._lock:
+            self._models.pop(SHARED_MODELS.get(language_code, language_code), None)
+
+    def resident_bytes(self):
+        return sum(size for _, size in self._models.values())
+
+    def preload(self, language_codes):
+        '''
+        Loads languages in a background daemon thread, in the given order
+
+        Returns: the started thread
+        '''
+        thread = threading.Thread(target=self._preload, args=(list(language_codes),), name='punctuation-preload',
+                                  daemon=True)
+        thread.start()
+        return thread
+
+    def _preload(self, language_codes):
+        for language_code in language_codes:
+            try:
+                self.get(language_code)
+            except Exception as e:
+                # reported by stats(), get() raises it again for the caller that needs the language
+                self.preload_errors[language_code] = e
+
+    def stats(self):
+        '''
+        Returns the loaded languages from least to most recently used, their sizes and hit, load and eviction counts
+        '''
+        with self._lock:
+            return dict(self._counts,
+                        languages=list(self._models),
+                        resident_mb={language_code: size / 1e6 for language_code, (_, size) in self._models.items()},
+                        total_mb=self.resident_bytes() / 1e6,
+                        preload_errors={language_code: str(e) for language_code, e in self.preload_errors.items()},
+                        budget_mb=self.memory_budget / 1e6 if self.memory_budget is not None else None)
@@ -0,0 +1,121 @@
+import hashlib
+import json
+import os
+import shutil
+import tarfile
+import tempfile
+
+'''
+Persistent cache of unpacked .nemo archives. Restoring a .nemo archive normally unpacks the whole tarball into a
+temporary directory on every start. The archive is unpacked once instead, into a directory named after its
+checksum, and later starts restore the model from that directory. A changed archive gets a new checksum and so a
+new directory.
+'''
+
+
+def archive_checksum(archive_path: str) -> str:
+    """
+    Returns the sha256 of an archive. The checksum is remembered next to the archive with its size and modification
+    time, and only computed again if those change
+
+    Args:
+        archive_path: .nemo file path
+
+    Returns: hex digest
+    """
+    stat = os.stat(archive_path)
+    signature = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+    checksum_path = archive_path + '.sha256.json'
+    try:
+        with open(checksum_path, encoding='utf-8') as f:
+            stored = json.load(f)
+        if stored['size'] == signature['size'] and stored['mtime_ns'] == signature['mtime_ns']:
+            return stored['sha256']
+    except (OSError, ValueError, KeyError):
+        pass
+
+    digest = hashlib.sha256()
+    with open(archive_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    signature['sha256'] = digest.hexdigest()
+    try:
+        with open(checksum_path, 'w', encoding='utf-8') as f:
+            json.dump(signature, f)
+    except OSError:
+        # read only model directory, the checksum is computed on every start
+        pass
+    return signature['sha256']
+
+
+def extract_archive(archive_path: str, directory: str):
+    """
+    Unpacks an archive into a directory. Archives are downloaded, so members that would be written outside the
+    directory, links and device files are refused: with tarfile's data filter where available (Python 3.12, and
+    3.8.17+, 3.9.17+, 3.10.12+, 3.11.4+), by checking every member otherwise
+
+    Args:
+        archive_path: .nemo file path
+        directory: target directory
+    """
+    with tarfile.open(archive_path, 'r:*') as archive:
+        if hasattr(tarfile, 'data_filter'):
+            archive.extractall(directory, filter='data')
+            return
+        root = os.path.realpath(directory)
+        for member in archive.getmembers():
+            path = os.path.realpath(os.path.join(root, member.name))
+            if os.path.commonpath([root, path]) != root:
+                raise tarfile.TarError(f'{archive_path}: {member.name} would be extracted outside {directory}')
+            if not (member.isfile() or member.isdir()):
+                raise tarfile.TarError(f'{archive_path}: {member.name} is not a regular file or directory')
+        archive.extractall(directory)
+
+
+def extracted_model_dir(archive_path: str, cache_dir: str) -> str:
+    """
+    Returns the directory holding the unpacked archive, unpacking it first if it is not cached yet
+
+    Args:
+        archive_path: .nemo file path
+        cache_dir: directory of the unpacked archives
+
+    Returns: directory path
+    """
+    extracted_dir = os.path.join(cache_dir, archive_checksum(archive_path)[:16])
+    if not os.path.isdir(extracted_dir):
+        os.makedirs(cache_dir, exist_ok=True)
+        temp_dir = tempfile.mkdtemp(dir=cache_dir)
+        try:
+            extract_archive(archive_path, temp_dir)
+        except BaseException:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            raise
+        try:
+            os.rename(temp_dir, extracted_dir)
+        except OSError:
+            # unpacked concurrently by another process
+            shutil.rmtree(temp_dir, ignore_errors=True)
+    return extracted_dir
+
+
+def restore_from_cache(model_class, archive_path: str, cache_dir: str):
+    """
+    Restores a NeMo model from its cached unpacked archive
+
+    Args:
+        model_class: NeMo model class, e.g. PunctuationCapitalizationModel
+        archive_path: .nemo file path
+        cache_dir: directory of the unpacked archives
+
+    Returns: restored model
+    """
+    try:
+        from nemo.core.connectors.save_restore_connector import SaveRestoreConnector
+    except ImportError:
+        # NeMo < 1.3 always unpacks the archive
+        return model_class.restore_from(archive_path)
+
+    connector = SaveRestoreConnector()
+    connector.model_extracted_dir = extracted_model_dir(archive_path, cache_dir)
+    return model_class.restore_from(archive_path, save_restore_connector=connector)
@@ -0,0 +1,130 @@
+import multiprocessing
+import os
+import time
+from collections import Counter
+from itertools import islice
+
+'''
+Punctuation on many cpu cores with several worker processes, each holding its own model and running torch with a
+fixed number of intra op threads, pinned to its own cores. One large torch thread pool scales poorly past a few
+cores, a few small ones side by side do not. Batches are distributed over the workers and results are returned in
+input order.
+
+Example usage:
+from punctuate.pool import PunctuationPool
+
+with PunctuationPool('hi', workers=8, threads=4) as pool:
+    punctuated = pool.punctuate_text(sentences, batch_size=32)
+    print(pool.metrics())
+
+python -m punctuate.run_benchmark --lang hi --input=<INPUT> --pool_splits 32x1 8x4 4x8
+'''
+
+# worker process state, set by _init_worker
+_punctuation = None
+_worker_index = None
+_worker_error = None
+
+
+def _init_worker(language_code, threads, cpus, counter, loaded, punctuation_kwargs):
+    global _punctuation, _worker_index, _worker_error
+    with counter.get_lock():
+        _worker_index = counter.value
+        counter.value += 1
+    # before torch is imported, so that its thread pools are sized accordingly
+    os.environ['OMP_NUM_THREADS'] = str(threads)
+    os.environ['MKL_NUM_THREADS'] = str(threads)
+    try:
+        if cpus and hasattr(os, 'sched_setaffinity'):
+            first = _worker_index * threads % len(cpus)
+            os.sched_setaffinity(0, cpus[first:first + threads])
+        import torch
+        from punctuate.punctuate_text import Punctuation
+
+        torch.set_num_threads(threads)
+        _punctuation = Punctuation(language_code, **punctuation_kwargs)
+    except Exception as e:
+        # raised by the first batch, a failing initializer would be restarted by the pool forever
+        _worker_error = e
+    with loaded.get_lock():
+        loaded.value += 1
+
+
+def _punctuate_batch(batch):
+    if _worker_error is not None:
+        raise _worker_error
+    start = time.perf_counter()
+    results = _punctuation.punctuate_text(batch)
+    return _worker_index, results, time.perf_counter() - start
+
+
+class PunctuationPool:
+    '''
+    Punctuation model replicated over worker processes
+
+    Args:
+        language_code: language of the model
+        workers: number of worker processes
+        threads: torch intra op threads of every worker
+        pin_threads: pin every worker to its own threads cpus, if the host has workers * threads of them
+        **punctuation_kwargs: passed to Punctuation, e.g. download=False or compiled=True
+    '''
+
+    def __init__(self, language_code, workers=None, threads=1, pin_threads=True, **punctuation_kwargs):
+        cpus = sorted(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else []
+        self.workers = workers or max(1, (len(cpus) or os.cpu_count() or 1) // threads)
+        self.threads = threads
+        if not pin_threads or self.workers * threads > len(cpus):
+            cpus = []
+        # spawned workers import torch themselves instead of inheriting the state of this process
+        context = multiprocessing.get_context('spawn')
+        self._loaded = context.Value('i', 0)
+        self._pool = context.Pool(self.workers, initializer=_init_worker,
+                                  initargs=(language_code, threads, cpus, context.Value('i', 0), self._loaded,
+                                            punctuation_kwargs))
+        # by worker index, a worker restarted by the pool gets a new index
+        self._sentences = Counter()
+        self._busy_seconds = Counter()
+
+    def wait_until_loaded(self, poll_seconds=0.1):
+        '''
+        Blocks until every worker has loaded its model
+        '''
+        while self._loaded.value < self.workers:
+            time.sleep(poll_seconds)
+
+    def punctuate_iter(self, texts, batch_size=32):
+        '''
+        Punctuates any iterable of texts on the workers, batch_size texts per task, and yields results in input
+        order
+        '''
+        texts = iter(texts)
+        batches = iter(lambda: list(islice(texts, batch_size)), [])
+        for worker, results, seconds in self._pool.imap(_punctuate_batch, batches):
+            self._sentences[worker] += len(results)
+            self._busy_seconds[worker] += seconds
+            yield from results
+
+    def punctuate_text(self, texts, batch_size=32):
+        return list(self.punctuate_iter(texts, batch_size))
+
+    def metrics(self):
+        '''
+        Returns sentences punctuated, busy time and throughput of every worker
+        '''
+        return [{
+            'worker': worker,
+            'sentences': self._sentences[worker],
+            'busy_seconds': self._busy_seconds[worker],
+            'sentences_per_second': self._sentences[worker] / self._busy_seconds[worker],
+        } for worker in sorted(self._sentences) if self._busy_seconds[worker]]
+
+    def close(self):
+        self._pool.close()
+        self._pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,62 @@
+'''
+Please move this file to src/ before running the tests
+'''
+
+import asyncio
+import unittest
+
+from punctuate.batching import BatchingPunctuator
+
+
+class UpperCasePunctuation:
+
+    def punctuate_text(self, text):
+        return [sentence.upper() + '.' for sentence in text]
+
+
+class BatchingPunctuation(unittest.TestCase):
+
+    def test_concurrent_requests_are_batched(self):
+        async def run():
+            punctuator = BatchingPunctuator(UpperCasePunctuation(), max_batch_size=4, max_wait_ms=50)
+            results = await asyncio.gather(*[punctuator.punctuate(f'text {i}') for i in range(10)])
+            await punctuator.aclose()
+            return results, punctuator.metrics()
+
+        results, metrics = asyncio.run(run())
+
+        self.assertEqual([f'TEXT {i}.' for i in range(10)], results)
+        self.assertEqual(10, metrics['requests'])
+        self.assertLess(metrics['batches'], 10)
+
+    def test_requests_racing_close_are_punctuated_or_refused(self):
+        async def request(punctuator, i):
+            await asyncio.sleep(0.001 * (i % 5))
+            try:
+                return await punctuator.punctuate(str(i))
+            except RuntimeError:
+                return None
+
+        async def run():
+            punctuator = BatchingPunctuator(UpperCasePunctuation(), max_batch_size=8, max_wait_ms=1)
+            requests = [asyncio.ensure_future(request(punctuator, i)) for i in range(50)]
+            await asyncio.sleep(0.002)
+            await punctuator.aclose()
+            return await asyncio.wait_for(asyncio.gather(*requests), timeout=10)
+
+        results = asyncio.run(run())
+
+        self.assertTrue(all(result in (None, f'{i}.') for i, result in enumerate(results)))
+
+    def test_closed_punctuator_refuses_requests(self):
+        async def run():
+            punctuator = BatchingPunctuator(UpperCasePunctuation())
+            await punctuator.aclose()
+            await punctuator.punctuate('text')
+
+        with self.assertRaises(RuntimeError):
+            asyncio.run(run())
+
+
+if __name__ == '__main__':
+    unittest.main()
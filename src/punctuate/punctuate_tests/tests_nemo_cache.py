@@ -0,0 +1,49 @@
+'''
+Please move this file to src/ before running the tests
+'''
+
+import io
+import os
+import tarfile
+import tempfile
+import unittest
+
+from punctuate.nemo_cache import extracted_model_dir
+
+
+def write_archive(path, members):
+    with tarfile.open(path, 'w:gz') as archive:
+        for name, data in members.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+
+
+class NemoArchiveCache(unittest.TestCase):
+
+    def test_archive_is_unpacked_once(self):
+        with tempfile.TemporaryDirectory() as directory:
+            archive_path = os.path.join(directory, 'model.nemo')
+            write_archive(archive_path, {'./model_config.yaml': b'name: test', './model_weights.ckpt': b'0'})
+            cache_dir = os.path.join(directory, 'cache')
+
+            extracted_dir = extracted_model_dir(archive_path, cache_dir)
+            with open(os.path.join(extracted_dir, 'model_config.yaml'), 'rb') as f:
+                self.assertEqual(b'name: test', f.read())
+            self.assertEqual(extracted_dir, extracted_model_dir(archive_path, cache_dir))
+            self.assertEqual([os.path.basename(extracted_dir)], os.listdir(cache_dir))
+
+    def test_members_outside_the_cache_are_refused(self):
+        with tempfile.TemporaryDirectory() as directory:
+            archive_path = os.path.join(directory, 'model.nemo')
+            write_archive(archive_path, {'./model_config.yaml': b'name: test', '../../escaped.txt': b'x'})
+            cache_dir = os.path.join(directory, 'nested', 'cache')
+
+            with self.assertRaises(tarfile.TarError):
+                extracted_model_dir(archive_path, cache_dir)
+            self.assertFalse(os.path.exists(os.path.join(directory, 'escaped.txt')))
+            self.assertEqual([], os.listdir(cache_dir))
+
+
+if __name__ == '__main__':
+    unittest.main()
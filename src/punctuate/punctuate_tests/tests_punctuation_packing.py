@@ -0,0 +1,46 @@
+'''
+Please move this file to src/ before running the tests
+'''
+
+import unittest
+
+import numpy as np
+import torch
+
+from punctuate.punctuate_tests.tiny_models import tiny_punctuation
+
+
+class PunctuationPacking(unittest.TestCase):
+
+    def test_packed_labels_equal_labels_of_each_sentence_alone(self):
+        punctuation = tiny_punctuation(max_positions=64, packing=True)
+        rng = np.random.RandomState(0)
+        encoded = [[2] + list(rng.randint(5, 100, size=length)) + [3] for length in [3, 20, 7, 1, 12, 30, 5, 9]]
+
+        packed = punctuation.get_packed_label_indices(encoded, max_length=40, batch_size=3)
+
+        for ids, labels in zip(encoded, packed):
+            with torch.no_grad():
+                logits = punctuation.get_logits(torch.tensor([ids]))
+            self.assertEqual(list(np.argmax(logits.numpy(), axis=2)[0]), list(labels))
+
+    def test_packed_logits_equal_logits_of_each_sentence_alone(self):
+        punctuation = tiny_punctuation(max_positions=64, packing=True)
+        first, second = [2, 10, 11, 12, 3], [2, 20, 21, 3]
+        input_ids = torch.tensor([first + second + [0]])
+        position_ids = torch.tensor([list(range(len(first))) + list(range(len(second))) + [0]])
+        block_mask = torch.zeros((1, 10, 10), dtype=torch.long)
+        block_mask[0, :5, :5] = 1
+        block_mask[0, 5:9, 5:9] = 1
+        block_mask[0, 9, 9] = 1
+
+        with torch.no_grad():
+            packed = punctuation.get_packed_logits(input_ids, block_mask, position_ids)
+            alone = [punctuation.get_logits(torch.tensor([ids])) for ids in [first, second]]
+
+        self.assertTrue(torch.allclose(alone[0][0], packed[0, :5], atol=1e-5))
+        self.assertTrue(torch.allclose(alone[1][0], packed[0, 5:9], atol=1e-5))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+'''
+Please move this file to src/ before running the tests
+'''
+
+import unittest
+
+from punctuate.punctuate_tests.tiny_models import tiny_punctuation
+from punctuate.streaming import PunctuationSession
+
+
+class StreamingPunctuation(unittest.TestCase):
+
+    def test_words_longer_than_the_model_input_are_punctuated(self):
+        punctuation = tiny_punctuation()
+        words = ['शब्द' + str(i) for i in range(200)]
+        self.assertGreater(len(punctuation.tokenizer.tokenize(' '.join(words))), 512)
+
+        pieces = punctuation.punctuate_words(words)
+
+        self.assertEqual(len(words), len(pieces))
+        for word, piece in zip(words, pieces):
+            self.assertTrue(piece.startswith(word))
+            self.assertIn(piece[len(word):], punctuation.punctuation_dict.values())
+
+    def test_session_windows_longer_than_the_model_input_are_punctuated(self):
+        punctuation = tiny_punctuation()
+        session = PunctuationSession(punctuation)
+        words = ['शब्द' + str(i) for i in range(400)]
+        window = words[:session.left_context + session.max_window + session.right_context]
+        self.assertGreater(len(punctuation.tokenizer.tokenize(' '.join(window))), 512)
+
+        committed = session.add(' '.join(words))
+        text = session.finish()
+
+        self.assertTrue(text.startswith(committed.strip()))
+        self.assertEqual(words, [piece.rstrip(',।') for piece in text.split()])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+'''
+Small random weight punctuation models for the tests, no model files needed
+'''
+
+import torch
+from transformers import AlbertConfig, AlbertForTokenClassification
+
+from punctuate.punctuate_text import Punctuation
+
+
+class SubwordTokenizer:
+    '''
+    Splits every word into subwords of two characters, the first one marked with ▁ like sentencepiece does
+    '''
+    pad_token_id, cls_token_id, sep_token_id = 0, 2, 3
+
+    def __init__(self):
+        self.vocab = {'<pad>': 0, '<unk>': 1, '[CLS]': 2, '[SEP]': 3}
+
+    def tokenize(self, text):
+        tokens = []
+        for word in text.split():
+            tokens += ['▁' + word[:2]] + [word[i:i + 2] for i in range(2, len(word), 2)]
+        return tokens
+
+    def convert_tokens_to_ids(self, tokens):
+        return [self.vocab.setdefault(token, len(self.vocab) % 100) for token in tokens]
+
+    def encode(self, text):
+        return [self.cls_token_id] + self.convert_tokens_to_ids(self.tokenize(text)) + [self.sep_token_id]
+
+
+def tiny_punctuation(max_positions=512, packing=False):
+    '''
+    Hindi Punctuation around a small random weight ALBERT model
+    '''
+    torch.manual_seed(0)
+    config = AlbertConfig(vocab_size=100, embedding_size=16, hidden_size=32, num_hidden_layers=2,
+                          num_attention_heads=4, intermediate_size=64, max_position_embeddings=max_positions,
+                          num_labels=4)
+    train_encoder = {'blank': 0, 'end': 1, 'comma': 2, 'PAD': 3}
+    punctuation_dict = {'blank': ' ', 'end': '। ', 'comma': ', '}
+    return Punctuation.from_components('hi', SubwordTokenizer(), AlbertForTokenClassification(config).eval(),
+                                       train_encoder, punctuation_dict, packing=packing)
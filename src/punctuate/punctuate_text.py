@@ -1,35 +1,78 @@
-import torch
-from transformers import AlbertForTokenClassification, AlbertTokenizer
-import numpy as np
+import bisect
+import inspect
 import json
-import torch.nn as nn
-from indicnlp.tokenize import indic_tokenize
 import os
 import wget
 import sys
-from nemo.collections.nlp.models import PunctuationCapitalizationModel
 import sysconfig
 import string
 import shutil
+from itertools import islice
 cache = sysconfig.get_path('purelib') + '/'
 
+# torch, transformers, nemo and indicnlp take seconds to import, they are imported by the code path that uses them:
+# nemo for English, transformers and indicnlp for the Indic languages
+
 
 class Punctuation:
-    def __init__(self, language_code):
-        self.language_code = language_code
-        self.device = "cuda" if torch.cuda.is_available() else "cpu"
+    def __init__(self, language_code, download=True, use_safetensors=True, compiled=False, packing=False):
+        import torch
+
+        self.set_options(language_code, download, use_safetensors, packing,
+                         "cuda" if torch.cuda.is_available() else "cpu")
         if self.language_code in ['en', 'en_bio']:
+            from nemo.collections.nlp.models import PunctuationCapitalizationModel
+            from punctuate.nemo_cache import restore_from_cache
+
             os.environ["TRANSFORMERS_CACHE"] = str(cache + 'deployed_models/model_data/transformers_cache')
             self.model_path = cache+'deployed_models/model_data/punctuation_en_distilbert.nemo'
-            self.download_model_data()
-            self.model = PunctuationCapitalizationModel.restore_from(self.model_path)
+            self.ensure_model_data()
+            self.model = restore_from_cache(PunctuationCapitalizationModel, self.model_path,
+                                            cache + 'deployed_models/model_data/nemo_extracted/')
             self.model = self.model.to(self.device)
         else:
             self.model_path = cache + 'deployed_models/model_data/' + self.language_code + '.pt'
+            self.weights_path = cache + 'deployed_models/model_data/' + self.language_code + '.safetensors'
             self.albert_metadata = cache + 'deployed_models/model_data/albert_metadata/'
             self.encoder_path = cache + 'deployed_models/model_data/' + self.language_code + '.json'
             self.dict_map = cache + 'deployed_models/model_data/' + self.language_code + '_dict.json'
-            self.tokenizer, self.model, self.train_encoder, self.punctuation_dict = self.load_model_parameters()
+            self.compiled_path = cache + 'deployed_models/model_data/' + self.language_code + '.torchscript.pt'
+            self.set_components(*self.load_model_parameters())
+            if compiled and self.device == 'cpu':
+                from punctuate.compiled_model import load_or_compile
+
+                weights = self.weights_path if self.has_converted_weights() else self.model_path
+                self.compiled_model = load_or_compile(self.model, self.compiled_path, weights)
+
+    @classmethod
+    def from_components(cls, language_code, tokenizer, model, train_encoder, punctuation_dict, packing=False,
+                        device='cpu'):
+        '''
+        Punctuation of an Indic language around an already loaded tokenizer and model, nothing is downloaded. The
+        model is expected on device
+        '''
+        punctuation = cls.__new__(cls)
+        punctuation.set_options(language_code, False, False, packing, device)
+        punctuation.set_components(tokenizer, model, train_encoder, punctuation_dict)
+        return punctuation
+
+    def set_options(self, language_code, download, use_safetensors, packing, device):
+        self.language_code = language_code
+        self.download = download
+        self.use_safetensors = use_safetensors
+        # TorchScript graph of the Indic model used on cpu instead of the eager model, see compiled_model.py
+        self.compiled_model = None
+        # pack short Indic sentences into shared model inputs, see get_packed_word_punctuations
+        self.packing = packing
+        self.device = device
+
+    def set_components(self, tokenizer, model, train_encoder, punctuation_dict):
+        self.tokenizer = tokenizer
+        self.model = model
+        self.train_encoder = train_encoder
+        self.punctuation_dict = punctuation_dict
+        # input length limit of the model, including [CLS] and [SEP]
+        self.max_positions = getattr(self.model.config, 'max_position_embeddings', 512)
 
     def bar_thermometer(self, current, total, width=80):
         progress_message = "Downloading: %d%% [%d / %d] bytes" % (current / total * 100, current, total)
@@ -79,7 +122,7 @@ class Punctuation:
                     self.albert_metadata + 'spiece.vocab', bar=self.bar_thermometer
                 )
 
-            if not os.path.exists(self.model_path):
+            if not os.path.exists(self.model_path) and not self.has_converted_weights():
                 wget.download(
                     f'https://storage.googleapis.com/vakyansh-open-models/punctuation_models/{self.language_code}/{self.language_code}.pt',
                     self.model_path, bar=self.bar_thermometer
@@ -95,14 +138,67 @@ class Punctuation:
                     self.dict_map, bar=self.bar_thermometer
                 )
 
+    def ensure_model_data(self):
+        if self.download:
+            self.download_model_data()
+            return
+        if self.language_code in ['en', 'en_bio']:
+            required = [self.model_path]
+        else:
+            weights = self.weights_path if self.has_converted_weights() else self.model_path
+            required = [weights, self.encoder_path, self.dict_map, self.albert_metadata]
+        missing = [path for path in required if not os.path.exists(path)]
+        if missing:
+            raise FileNotFoundError(f'Model files not found for {self.language_code} and download is disabled: {missing}')
+
+    def has_converted_weights(self):
+        '''
+        Returns True if <lang>.safetensors, written by punctuate.safetensors_weights, should be loaded: it exists
+        and is not older than the <lang>.pt checkpoint
+        '''
+        if not self.use_safetensors or not os.path.exists(self.weights_path):
+            return False
+        return not os.path.exists(self.model_path) or \
+            os.path.getmtime(self.weights_path) >= os.path.getmtime(self.model_path)
+
+    def load_converted_model(self, num_labels):
+        '''
+        Builds the model from the albert config and memory maps its weights from <lang>.safetensors
+        '''
+        from transformers import AlbertConfig, AlbertForTokenClassification
+        from punctuate.safetensors_weights import load_safetensors
+
+        state_dict, metadata = load_safetensors(self.weights_path)
+        if int(metadata.get('num_labels', num_labels)) != num_labels:
+            raise ValueError(f'{self.weights_path} was converted for {metadata["num_labels"]} labels, '
+                             f'{self.encoder_path} has {num_labels}, convert the model again')
+        config = AlbertConfig.from_pretrained(self.albert_metadata, num_labels=num_labels, output_attentions=False,
+                                              output_hidden_states=False)
+        model = AlbertForTokenClassification(config)
+        try:
+            # parameters become the memory mapped tensors instead of copies of them
+            model.load_state_dict(state_dict, assign=True)
+        except TypeError:
+            # torch < 2.1
+            model.load_state_dict(state_dict)
+        return model.to(self.device)
+
     def load_model_parameters(self):
-        self.download_model_data()
+        import torch
+        import torch.nn as nn
+        from transformers import AlbertForTokenClassification, AlbertTokenizer
+
+        self.ensure_model_data()
         with open(self.encoder_path, encoding='utf-8') as label_encoder:
             train_encoder = json.load(label_encoder)
         with open(self.dict_map, encoding='utf-8') as dict_map:
             punctuation_dict = json.load(dict_map)
 
         tokenizer = AlbertTokenizer.from_pretrained(self.albert_metadata)
+        if self.has_converted_weights():
+            model = self.load_converted_model(len(train_encoder))
+            model.eval()
+            return tokenizer, model, train_encoder, punctuation_dict
 
         model = AlbertForTokenClassification.from_pretrained(self.albert_metadata,
                                                              num_labels=len(train_encoder),
@@ -117,33 +213,171 @@ class Punctuation:
         model.eval()
         return tokenizer, model, train_encoder, punctuation_dict
 
+    def get_logits(self, input_ids, attention_mask=None, position_ids=None):
+        '''
+        Runs the Indic model, compiled if available. The compiled graph takes no attention mask or position ids,
+        padded batches run eagerly, packed batches go through get_packed_logits. The eager model is used from then
+        on if the compiled graph fails on an input
+        '''
+        unmasked = attention_mask is None or (attention_mask.dim() == 2 and bool(attention_mask.all()))
+        if self.compiled_model is not None and unmasked and position_ids is None:
+            try:
+                return self.compiled_model(input_ids)
+            except RuntimeError:
+                self.compiled_model = None
+        return self.model(input_ids, attention_mask=attention_mask, position_ids=position_ids)[0]
+
     def get_tokens_and_labels_indices_from_text(self, text):
+        import numpy as np
+        import torch
 
         tokenized_sentence = self.tokenizer.encode(text)
         input_ids = torch.tensor([tokenized_sentence]).to(self.device)
         with torch.no_grad():
-            output = self.model(input_ids)
-        label_indices = np.argmax(output[0].to('cpu').numpy(), axis=2)
+            logits = self.get_logits(input_ids)
+        label_indices = np.argmax(logits.to('cpu').numpy(), axis=2)
         tokens = self.tokenizer.convert_ids_to_tokens(input_ids.to('cpu').numpy()[0])
         return tokens, label_indices
 
-    def punctuate_text_others_sentence(self, sentence):
-
+    def get_word_punctuations(self, sentence):
+        '''
+        Returns the words of a sentence and the punctuation predicted after each word
+        '''
         tokens, label_indices = self.get_tokens_and_labels_indices_from_text(sentence)
-
+        return self.align_word_punctuations(sentence, tokens, label_indices[0])
+
+    def get_batch_word_punctuations(self, sentences, encoded=None):
+        '''
+        get_word_punctuations of several sentences, with one forward pass over the padded batch. encoded are the
+        already tokenized input ids of the sentences, if available
+        '''
+        import numpy as np
+        import torch
+
+        encoded = encoded or [self.tokenizer.encode(sentence) for sentence in sentences]
+        length = max(len(ids) for ids in encoded)
+        pad_id = self.tokenizer.pad_token_id or 0
+        input_ids = torch.tensor([ids + [pad_id] * (length - len(ids)) for ids in encoded]).to(self.device)
+        attention_mask = torch.tensor([[1] * len(ids) + [0] * (length - len(ids)) for ids in encoded]).to(self.device)
+        with torch.no_grad():
+            logits = self.get_logits(input_ids, attention_mask)
+        label_indices = np.argmax(logits.to('cpu').numpy(), axis=2)
+        return [self.align_word_punctuations(sentence, self.tokenizer.convert_ids_to_tokens(ids), labels)
+                for sentence, ids, labels in zip(sentences, encoded, label_indices)]
+
+    def get_packed_logits(self, input_ids, block_mask, position_ids):
+        '''
+        Runs the eager Indic model over packed rows. block_mask is a (batch, length, length) 0/1 mask of the positions
+        every position may attend to. AlbertModel only accepts (batch, length) masks, and across transformers
+        versions a 3-D mask is either broadcast into the wrong attention score shape or rejected, so the embeddings
+        and encoder are run here with the additive (batch, 1, length, length) mask the attention layers expect
+        '''
+        import torch
+
+        albert = self.model.albert
+        dtype = next(self.model.parameters()).dtype
+        extended_mask = (1.0 - block_mask[:, None, :, :].to(dtype)) * torch.finfo(dtype).min
+        embeddings = albert.embeddings(input_ids, position_ids=position_ids,
+                                       token_type_ids=input_ids.new_zeros(input_ids.shape))
+        encoder_kwargs = {}
+        if 'head_mask' in inspect.signature(albert.encoder.forward).parameters:
+            encoder_kwargs['head_mask'] = [None] * self.model.config.num_hidden_layers
+        sequence_output = albert.encoder(embeddings, extended_mask, **encoder_kwargs)[0]
+        return self.model.classifier(self.model.dropout(sequence_output))
+
+    def get_packed_label_indices(self, encoded, max_length=None, batch_size=8):
+        '''
+        Returns the label indices of every token of input ids that fit into max_length ids, packed first fit
+        decreasing into rows of up to max_length ids instead of one padded row each. A block diagonal attention mask
+        keeps every sentence from attending to the others in its row and position ids restart at every sentence, so
+        each sentence is labelled as if it ran alone. batch_size rows run per forward pass
+        '''
+        import numpy as np
+        import torch
+
+        max_length = max_length or self.max_positions
+        rows = []
+        for i in sorted(range(len(encoded)), key=lambda i: -len(encoded[i])):
+            for row in rows:
+                if row['length'] + len(encoded[i]) <= max_length:
+                    row['length'] += len(encoded[i])
+                    row['sentences'].append(i)
+                    break
+            else:
+                rows.append({'length': len(encoded[i]), 'sentences': [i]})
+
+        results = [None] * len(encoded)
+        pad_id = self.tokenizer.pad_token_id or 0
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            length = max(row['length'] for row in batch)
+            input_ids = torch.full((len(batch), length), pad_id, dtype=torch.long)
+            position_ids = torch.zeros((len(batch), length), dtype=torch.long)
+            block_mask = torch.zeros((len(batch), length, length), dtype=torch.long)
+            spans = []
+            for r, row in enumerate(batch):
+                offset = 0
+                for i in row['sentences']:
+                    end = offset + len(encoded[i])
+                    input_ids[r, offset:end] = torch.tensor(encoded[i])
+                    position_ids[r, offset:end] = torch.arange(len(encoded[i]))
+                    block_mask[r, offset:end, offset:end] = 1
+                    spans.append((i, r, offset, end))
+                    offset = end
+                # padding only attends to itself
+                for position in range(offset, length):
+                    block_mask[r, position, position] = 1
+            with torch.no_grad():
+                logits = self.get_packed_logits(input_ids.to(self.device), block_mask.to(self.device),
+                                                position_ids.to(self.device))
+            label_indices = np.argmax(logits.to('cpu').numpy(), axis=2)
+            for i, r, offset, end in spans:
+                results[i] = label_indices[r][offset:end]
+        return results
+
+    def get_packed_word_punctuations(self, sentences, encoded, max_length=None, batch_size=8):
+        '''
+        get_word_punctuations of sentences that fit into max_length ids, packed into shared model inputs, see
+        get_packed_label_indices
+        '''
+        label_indices = self.get_packed_label_indices(encoded, max_length, batch_size)
+        return [self.align_word_punctuations(sentence, self.tokenizer.convert_ids_to_tokens(ids), labels)
+                for sentence, ids, labels in zip(sentences, encoded, label_indices)]
+
+    def align_word_punctuations(self, sentence, tokens, label_indices):
+        '''
+        Merges subword tokens into words and maps the label predicted for the first subword of each word to its
+        punctuation
+        '''
         new_tokens = []
-        new_labels = []
+        word_label_indices = []
         for i in range(1, len(tokens) - 1):
             if tokens[i].startswith("▁"):
                 current_word = tokens[i][1:]
-                new_labels.append(list(self.train_encoder.keys())[list(self.train_encoder.values()).index(label_indices[0][i])])
+                word_label_indices.append(label_indices[i])
                 for j in range(i + 1, len(tokens) - 1):
                     if not tokens[j].startswith("▁"):
                         current_word = current_word + tokens[j]
                     if tokens[j].startswith("▁"):
                         break
                 new_tokens.append(current_word)
-        full_text = ''
+        return self.word_punctuations(sentence, new_tokens, word_label_indices)
+
+    def label_name(self, label_index):
+        for name, index in self.train_encoder.items():
+            if index == label_index:
+                return name
+        raise ValueError(f'Unknown label index {label_index}')
+
+    def word_punctuations(self, sentence, words, label_indices):
+        '''
+        Maps the label predicted for every word of a sentence to its punctuation, and returns the words of the
+        sentence with their punctuations
+        '''
+        from indicnlp.tokenize import indic_tokenize
+
+        new_tokens = words
+        new_labels = [self.label_name(label_index) for label_index in label_indices]
         tokenized_text = indic_tokenize.trivial_tokenize_indic(sentence)
             
         new_labels = ['blank' if x=='PAD' else x for x in new_labels] #fix for PAD predicted in outputs
@@ -153,34 +387,122 @@ class Punctuation:
         else:
             full_text_tokens = new_tokens
 
-        for word, punctuation in zip(full_text_tokens, new_labels):
-            full_text = full_text + word + self.punctuation_dict[punctuation]
+        return full_text_tokens, [self.punctuation_dict[label] for label in new_labels]
 
-        return full_text
+    def punctuate_text_others_sentence(self, sentence):
+        full_text = ''
+        for word, punctuation in zip(*self.get_word_punctuations(sentence)):
+            full_text = full_text + word + punctuation
 
-    def punctuate_text_others_buffer(self, sentence, buffer_length=400):
-        words = sentence.split()
-        sentence_length = len(words)
-        txt = ''
-        beg_word = 0
-        i = 1
-        while sentence_length > buffer_length:
-            sentence_segment = ' '.join(words[beg_word:i*buffer_length])
-            txt = txt + self.punctuate_text_others_sentence(sentence_segment) + ' '
-            full_stop_position = len(txt) - txt[::-1].find('.') - 1
-            viram_position = len(txt) - txt[::-1].find('।') - 1
-            question_mark_position = len(txt) - txt[::-1].find('?') - 1
-            end_position = max([full_stop_position, viram_position, question_mark_position])
-            beg_word = len(txt[:end_position].translate(str.maketrans('', '', string.punctuation + '।')).split())
-            sentence_length = sentence_length - beg_word
-            i = i + 1
-            sentence = ' '.join(words[beg_word:])
-        return txt + self.punctuate_text_others_sentence(sentence)
+        return full_text
 
-    def punctuate_text_others(self, text):
-        sentences = []
-        for sentence in text:
-            sentences.append(self.punctuate_text_others_buffer(sentence))
+    def punctuate_words(self, words):
+        '''
+        Punctuates a list of words and returns one piece per input word, the word followed by its punctuation
+        (and capitalized for English), so that ''.join(pieces) is the punctuated text. Indic words go through
+        get_word_labels, so that any number of words fits the model's maximum positions
+        '''
+        sentence = ' '.join(words)
+        if self.language_code in ['en', 'en_bio']:
+            outputs = self.model.add_punctuation_capitalization([sentence])[0].split()
+            pieces = [word + ' ' for word in outputs]
+        else:
+            outputs, punctuations = self.word_punctuations(sentence, *self.get_word_labels(sentence))
+            pieces = [word + punctuation for word, punctuation in zip(words, punctuations)]
+        if len(outputs) != len(words):
+            # predictions can not be aligned with the input words, keep them unpunctuated
+            return [word + ' ' for word in words]
+        return pieces
+
+    def get_word_labels(self, sentence, max_length=None, overlap=32):
+        '''
+        Returns the words of a sentence of any length and the label predicted for each of them. The sentence is
+        tokenized once, and the model runs over windows of up to max_length ids, the model's maximum positions by
+        default, cut at word boundaries. A window starts with up to overlap tokens of already labelled words as left
+        context, and keeps the labels of its words up to the last predicted sentence end that still has overlap
+        tokens of right context, or of all words with that much right context if it predicts none. The next window
+        starts after them, so every forward pass except the last is full length, and the last one is filled with
+        left context
+        '''
+        import numpy as np
+        import torch
+
+        window_length = (max_length or self.max_positions) - 2
+        overlap = min(overlap, window_length // 4)
+        tokens = self.tokenizer.tokenize(sentence)
+        ids = self.tokenizer.convert_tokens_to_ids(tokens)
+        # first token of every word, tokens before the first word are only context
+        starts = [i for i, token in enumerate(tokens) if token.startswith("▁")]
+        ends = starts[1:] + [len(tokens)]
+        words = [tokens[start][1:] + ''.join(tokens[start + 1:end]) for start, end in zip(starts, ends)]
+
+        labels = [None] * len(starts)
+        word = 0
+        begin = 0
+        while word < len(starts):
+            if len(tokens) - begin <= window_length:
+                end, last_word = len(tokens), len(starts)
+            else:
+                # words that fit entirely, or the first word to label cut to the window
+                last_word = max(bisect.bisect_right(starts, begin + window_length) - 1, word + 1)
+                end = min(ends[last_word - 1], begin + window_length)
+            input_ids = torch.tensor([[self.tokenizer.cls_token_id] + ids[begin:end] +
+                                      [self.tokenizer.sep_token_id]]).to(self.device)
+            with torch.no_grad():
+                logits = self.get_logits(input_ids)
+            label_indices = np.argmax(logits.to('cpu').numpy(), axis=2)[0]
+            for k in range(word, last_word):
+                labels[k] = label_indices[1 + starts[k] - begin]
+            if last_word == len(starts):
+                break
+
+            # words followed by at least overlap tokens of the window
+            with_context = [k for k in range(word, last_word) if ends[k] <= end - overlap] or [word]
+            commit = with_context[-1] + 1
+            for k in reversed(with_context):
+                if any(mark in self.punctuation_dict.get(self.label_name(labels[k]), '') for mark in '.।?'):
+                    commit = k + 1
+                    break
+            word = commit
+            if len(tokens) - starts[word] <= window_length:
+                # last window, as much left context as fits
+                context_word = bisect.bisect_left(starts, len(tokens) - window_length)
+            else:
+                context_word = bisect.bisect_left(starts, starts[word] - overlap)
+            begin = starts[min(context_word, word)]
+        return words, labels
+
+    def punctuate_text_others_buffer(self, sentence, max_length=None):
+        '''
+        Punctuates a sentence longer than the model input, see get_word_labels
+        '''
+        words, label_indices = self.get_word_labels(sentence, max_length)
+        return ''.join(word + punctuation
+                       for word, punctuation in zip(*self.word_punctuations(sentence, words, label_indices)))
+
+    def punctuate_text_others(self, text, max_length=None, batch_size=32):
+        '''
+        Punctuates sentences that fit into max_length input ids in padded batches of batch_size, sorted by length to
+        keep padding low, or packed if packing is enabled, and longer sentences window by window
+        '''
+        max_length = max_length or self.max_positions
+        sentences = [None] * len(text)
+        encoded = [self.tokenizer.encode(sentence) for sentence in text]
+        short = sorted((i for i, ids in enumerate(encoded) if len(ids) <= max_length), key=lambda i: len(encoded[i]))
+        if self.packing:
+            outputs = self.get_packed_word_punctuations([text[i] for i in short], [encoded[i] for i in short],
+                                                        max_length)
+            for i, (words, punctuations) in zip(short, outputs):
+                sentences[i] = ''.join(word + punctuation for word, punctuation in zip(words, punctuations))
+            short = []
+        for start in range(0, len(short), batch_size):
+            batch = short[start:start + batch_size]
+            outputs = self.get_batch_word_punctuations([text[i] for i in batch], [encoded[i] for i in batch])
+            for i, (words, punctuations) in zip(batch, outputs):
+                sentences[i] = ''.join(word + punctuation for word, punctuation in zip(words, punctuations))
+        for i, sentence in enumerate(text):
+            if sentences[i] is None:
+                sentences[i] = self.punctuate_text_others_buffer(sentence, max_length)
         return sentences
 
     def punctuate_english_sentence(self, sentence, buffer_length=400):
@@ -202,10 +524,31 @@ class Punctuation:
 
         return txt + self.model.add_punctuation_capitalization([sentence])[0]
 
-    def punctuate_text_english(self, text):
-        sentences = []
-        for sentence in text:
-            sentences.append(self.punctuate_english_sentence(sentence))
+    def punctuate_text_english(self, text, batch_size=32, max_seq_length=128, step=8, margin=16, buffer_length=400):
+        '''
+        Punctuates all texts with one add_punctuation_capitalization call, batch_size windows per forward pass. NeMo
+        splits long texts into windows of max_seq_length tokens, step tokens apart, and drops margin tokens at the
+        inner edges of every window. NeMo versions without windowed inference get the texts of up to buffer_length
+        words in one call and longer texts buffer by buffer
+        '''
+        text = list(text)
+        if not text:
+            # NeMo's infer dataloader fails on zero queries
+            return []
+        parameters = inspect.signature(self.model.add_punctuation_capitalization).parameters
+        if 'step' in parameters and 'margin' in parameters:
+            return self.model.add_punctuation_capitalization(text, batch_size=batch_size,
+                                                             max_seq_length=max_seq_length, step=step, margin=margin)
+
+        sentences = [None] * len(text)
+        short = [i for i, sentence in enumerate(text) if len(sentence.split()) <= buffer_length]
+        if short:
+            outputs = self.model.add_punctuation_capitalization([text[i] for i in short], batch_size=batch_size)
+            for i, output in zip(short, outputs):
+                sentences[i] = output
+        for i, sentence in enumerate(text):
+            if sentences[i] is None:
+                sentences[i] = self.punctuate_english_sentence(sentence, buffer_length)
         return sentences
 
     def punctuate_text(self, text):
@@ -214,6 +557,15 @@ class Punctuation:
         elif self.language_code in ['hi', 'gu', 'te', 'mr', 'kn', 'pa', 'ta', 'bn', 'or', 'ml', 'as']:
             return self.punctuate_text_others(text)
 
+    def punctuate_iter(self, texts, batch_size=32):
+        '''
+        Lazily punctuates any iterable of texts (file lines, iter(queue.get, None), ...) and yields results in
+        input order. Only one batch of batch_size texts is held in memory at a time.
+        '''
+        texts = iter(texts)
+        for batch in iter(lambda: list(islice(texts, batch_size)), []):
+            yield from self.punctuate_text(batch)
+
 
 if __name__ == "__main__":
     
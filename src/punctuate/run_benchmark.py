@@ -0,0 +1,249 @@
+import json
+import resource
+import time
+from argparse import ArgumentParser
+from typing import Dict, List
+
+import numpy as np
+import torch
+
+from punctuate.pool import PunctuationPool
+from punctuate.punctuate_text import Punctuation
+
+'''
+Benchmarks Punctuation.punctuate_text on CPU for the ALBERT (Indic) and NeMo (English) models.
+Model files are loaded from the local cache only, nothing is downloaded.
+
+Example usage:
+python -m punctuate.run_benchmark --lang hi --input=<INPUT> --threads 1 2 4 --batch_sizes 1 8 32
+python -m punctuate.run_benchmark --lang hi --input=<INPUT> --modes eager compiled packed
+python -m punctuate.run_benchmark --lang hi --input=<INPUT> --pool_splits 32x1 8x4 4x8 --batch_sizes 32
+'''
+
+
+def parse_args():
+    parser = ArgumentParser()
+    parser.add_argument("--lang", help="language code, e.g. hi or en", required=True, type=str)
+    parser.add_argument("--input", help="text file with one sentence per line", required=True, type=str)
+    parser.add_argument("--threads", help="values for torch.set_num_threads", nargs='+', type=int, default=[1])
+    parser.add_argument("--batch_sizes", help="sentences per punctuate_text call", nargs='+', type=int, default=[1])
+    parser.add_argument("--buckets", help="upper word count bound of each length bucket", nargs='+', type=int,
+                        default=[16, 64, 256])
+    parser.add_argument("--max_sentences", help="sentences per bucket", type=int, default=200)
+    parser.add_argument("--warmup", help="untimed batches before each run", type=int, default=2)
+    parser.add_argument("--modes", help="eager, TorchScript compiled and/or sequence packed ALBERT model, compared "
+                                        "per run", nargs='+', choices=['eager', 'compiled', 'packed'],
+                        default=['eager'])
+    parser.add_argument("--pool_splits", help="benchmark PunctuationPool instead, for every workers x threads "
+                                              "split, e.g. 8x4", nargs='+', type=str, default=None)
+    parser.add_argument("--output", help="optional json file for the results", required=False, type=str)
+    return parser.parse_args()
+
+
+def load_file(file_path: str) -> List[str]:
+    """
+    Loads non empty lines of a text file
+
+    Args:
+        file_path: file path
+
+    Returns: list of sentences
+    """
+    with open(file_path, encoding='utf-8') as fp:
+        return [line.strip() for line in fp if line.strip()]
+
+
+def peak_rss_mb() -> float:
+    """
+    Returns peak resident memory of this process in MB
+    """
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def bucket_by_length(sentences: List[str], bounds: List[int], max_sentences: int) -> Dict[str, List[str]]:
+    """
+    Groups sentences into word count buckets, e.g. bounds [16, 64] -> 1-16, 17-64, 65+
+
+    Args:
+        sentences: input sentences
+        bounds: sorted upper bound of every bucket
+        max_sentences: maximum number of sentences kept per bucket
+
+    Returns: bucket name -> sentences
+    """
+    lower_bounds = [1] + [bound + 1 for bound in bounds]
+    names = [f'{low}-{high}' for low, high in zip(lower_bounds, bounds)] + [f'{lower_bounds[-1]}+']
+    buckets = {name: [] for name in names}
+    for sentence in sentences:
+        length = len(sentence.split())
+        index = int(np.searchsorted(bounds, length))
+        if len(buckets[names[index]]) < max_sentences:
+            buckets[names[index]].append(sentence)
+    return {name: bucket for name, bucket in buckets.items() if bucket}
+
+
+def run_config(punctuation: Punctuation, sentences: List[str], batch_size: int, warmup: int) -> dict:
+    """
+    Times punctuate_text over all sentences in batches of batch_size
+
+    Args:
+        punctuation: loaded Punctuation model
+        sentences: input sentences
+        batch_size: sentences per punctuate_text call
+        warmup: untimed batches run first
+
+    Returns: throughput, amortized time per sentence, and latency percentiles of the punctuate_text calls: the time
+        a caller waits for its batch, which equals per sentence latency for batch_size 1
+    """
+    batches = [sentences[i:i + batch_size] for i in range(0, len(sentences), batch_size)]
+    for batch in batches[:warmup]:
+        punctuation.punctuate_text(batch)
+
+    latencies = []
+    start = time.perf_counter()
+    for batch in batches:
+        batch_start = time.perf_counter()
+        punctuation.punctuate_text(batch)
+        latencies.append(time.perf_counter() - batch_start)
+    total_time = time.perf_counter() - start
+
+    num_tokens = sum(len(sentence.split()) for sentence in sentences)
+    latencies_ms = np.array(latencies) * 1000
+    return {
+        'sentences': len(sentences),
+        'tokens': num_tokens,
+        'tokens_per_second': num_tokens / total_time,
+        'sentences_per_second': len(sentences) / total_time,
+        'amortized_ms_per_sentence': total_time * 1000 / len(sentences),
+        'batch_latency_ms_p50': float(np.percentile(latencies_ms, 50)),
+        'batch_latency_ms_p90': float(np.percentile(latencies_ms, 90)),
+        'batch_latency_ms_p99': float(np.percentile(latencies_ms, 99)),
+    }
+
+
+def run_benchmark(lang: str, sentences: List[str], threads: List[int], batch_sizes: List[int],
+                  buckets: List[int], max_sentences: int = 200, warmup: int = 2, compiled: bool = False,
+                  packing: bool = False) -> dict:
+    """
+    Loads the model for lang from local files and sweeps threads x batch size x length bucket
+
+    Args:
+        lang: language code
+        sentences: benchmark sentences
+        threads: values for torch.set_num_threads
+        batch_sizes: sentences per punctuate_text call
+        buckets: upper word count bound of each length bucket
+        max_sentences: sentences per bucket
+        warmup: untimed batches before each run
+        compiled: run the TorchScript compiled model, see compiled_model.py
+        packing: pack short sentences into shared model inputs, see Punctuation.get_packed_word_punctuations
+
+    Returns: dictionary with model load statistics and one entry per configuration
+    """
+    rss_before = peak_rss_mb()
+    start = time.perf_counter()
+    punctuation = Punctuation(lang, download=False, compiled=compiled, packing=packing)
+    load_time = time.perf_counter() - start
+    report = {
+        'lang': lang,
+        'device': punctuation.device,
+        'mode': 'packed' if packing else 'compiled' if punctuation.compiled_model is not None else 'eager',
+        'model_load_seconds': load_time,
+        'model_load_peak_rss_mb': peak_rss_mb() - rss_before,
+        'runs': [],
+    }
+
+    length_buckets = bucket_by_length(sentences, sorted(buckets), max_sentences)
+    for num_threads in threads:
+        torch.set_num_threads(num_threads)
+        for batch_size in batch_sizes:
+            for bucket, bucket_sentences in length_buckets.items():
+                result = run_config(punctuation, bucket_sentences, batch_size, warmup)
+                result.update({'threads': num_threads, 'batch_size': batch_size, 'bucket': bucket,
+                               'peak_rss_mb': peak_rss_mb()})
+                report['runs'].append(result)
+    return report
+
+
+def print_report(report: dict):
+    print(f"lang: {report['lang']}  device: {report['device']}  mode: {report['mode']}  "
+          f"load: {report['model_load_seconds']:.2f}s  load rss: {report['model_load_peak_rss_mb']:.0f}MB")
+    # p50/p90/p99: latency of a punctuate_text call for the whole batch, ms/sent: amortized time per sentence
+    print(f"{'threads':>7} {'batch':>5} {'bucket':>8} {'tok/s':>9} {'ms/sent':>8} {'p50 ms':>8} {'p90 ms':>8} "
+          f"{'p99 ms':>8} {'rss MB':>7}")
+    for run in report['runs']:
+        print(f"{run['threads']:>7} {run['batch_size']:>5} {run['bucket']:>8} {run['tokens_per_second']:>9.1f} "
+              f"{run['amortized_ms_per_sentence']:>8.2f} {run['batch_latency_ms_p50']:>8.1f} "
+              f"{run['batch_latency_ms_p90']:>8.1f} {run['batch_latency_ms_p99']:>8.1f} {run['peak_rss_mb']:>7.0f}")
+
+
+def run_pool_benchmark(lang: str, sentences: List[str], splits: List[str], batch_size: int) -> dict:
+    """
+    Punctuates all sentences with a PunctuationPool of every workers x threads split
+
+    Args:
+        lang: language code
+        sentences: benchmark sentences
+        splits: e.g. ['32x1', '8x4']
+        batch_size: sentences per pool task
+
+    Returns: dictionary with one entry per split, with overall and per worker throughput
+    """
+    report = {'lang': lang, 'batch_size': batch_size, 'splits': []}
+    for split in splits:
+        workers, threads = (int(value) for value in split.split('x'))
+        start = time.perf_counter()
+        with PunctuationPool(lang, workers=workers, threads=threads, download=False) as pool:
+            pool.wait_until_loaded()
+            load_time = time.perf_counter() - start
+            start = time.perf_counter()
+            pool.punctuate_text(sentences, batch_size=batch_size)
+            total_time = time.perf_counter() - start
+            report['splits'].append({
+                'workers': workers,
+                'threads': threads,
+                'load_seconds': load_time,
+                'sentences_per_second': len(sentences) / total_time,
+                'workers_report': pool.metrics(),
+            })
+    return report
+
+
+def print_pool_report(report: dict):
+    print(f"lang: {report['lang']}  batch: {report['batch_size']}")
+    print(f"{'workers':>7} {'threads':>7} {'load s':>7} {'sent/s':>9} {'worker sent/s min-max':>22}")
+    for split in report['splits']:
+        per_worker = [worker['sentences_per_second'] for worker in split['workers_report']] or [0.0]
+        print(f"{split['workers']:>7} {split['threads']:>7} {split['load_seconds']:>7.1f} "
+              f"{split['sentences_per_second']:>9.1f} {min(per_worker):>10.1f}-{max(per_worker):<11.1f}")
+
+
+def print_comparison(eager: dict, other: dict):
+    print(f"{'threads':>7} {'batch':>5} {'bucket':>8} {'eager p50':>10} {other['mode'] + ' p50':>13} {'speedup':>8}")
+    for eager_run, other_run in zip(eager['runs'], other['runs']):
+        print(f"{eager_run['threads']:>7} {eager_run['batch_size']:>5} {eager_run['bucket']:>8} "
+              f"{eager_run['batch_latency_ms_p50']:>10.1f} {other_run['batch_latency_ms_p50']:>13.1f} "
+              f"{eager_run['batch_latency_ms_p50'] / other_run['batch_latency_ms_p50']:>7.2f}x")
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    sentences = load_file(args.input)
+    if args.pool_splits:
+        output = run_pool_benchmark(args.lang, sentences, args.pool_splits, args.batch_sizes[0])
+        print_pool_report(output)
+    else:
+        reports = {}
+        for mode in args.modes:
+            reports[mode] = run_benchmark(args.lang, sentences, args.threads, args.batch_sizes, args.buckets,
+                                          max_sentences=args.max_sentences, warmup=args.warmup,
+                                          compiled=mode == 'compiled', packing=mode == 'packed')
+            print_report(reports[mode])
+        for mode, report in reports.items():
+            # a compiled run falls back to eager if the model could not be traced
+            if 'eager' in reports and mode != 'eager' and report['mode'] == mode:
+                print_comparison(reports['eager'], report)
+        output = reports[args.modes[0]] if len(reports) == 1 else list(reports.values())
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as fp:
+            json.dump(output, fp, indent=2)
@@ -0,0 +1,128 @@
+import json
+import mmap
+import os
+import struct
+from argparse import ArgumentParser
+from typing import Dict, Tuple
+
+'''
+Inference only weights of the ALBERT punctuation models in the safetensors format. The converted file holds only
+the tensors of the loaded token classification model, without the training state of the <lang>.pt checkpoint.
+It is memory mapped on load: loading takes no time, and worker processes on one host share the weight pages
+through the page cache instead of each holding a private copy.
+
+Example usage:
+python -m punctuate.safetensors_weights --langs hi ta bn
+
+Punctuation('hi') then loads <lang>.safetensors instead of <lang>.pt, as long as it is newer than the checkpoint.
+'''
+
+INDIC_LANGUAGES = ['hi', 'gu', 'te', 'mr', 'kn', 'pa', 'ta', 'bn', 'or', 'ml', 'as']
+
+
+def parse_args():
+    parser = ArgumentParser()
+    parser.add_argument("--langs", help="languages to convert", nargs='+', choices=INDIC_LANGUAGES,
+                        default=INDIC_LANGUAGES)
+    return parser.parse_args()
+
+
+def _dtype_names() -> dict:
+    import torch
+
+    return {torch.float64: 'F64', torch.float32: 'F32', torch.float16: 'F16', torch.bfloat16: 'BF16',
+            torch.int64: 'I64', torch.int32: 'I32', torch.int16: 'I16', torch.int8: 'I8', torch.uint8: 'U8',
+            torch.bool: 'BOOL'}
+
+
+def save_safetensors(tensors: Dict[str, 'torch.Tensor'], path: str, metadata: Dict[str, str] = None):
+    """
+    Writes tensors to a safetensors file, atomically
+
+    Args:
+        tensors: name -> tensor, tensors are copied to cpu
+        path: output file path
+        metadata: optional string metadata stored in the header
+    """
+    import torch
+
+    dtype_names = _dtype_names()
+    header = {'__metadata__': dict(metadata or {})}
+    buffers = []
+    offset = 0
+    for name, tensor in sorted(tensors.items()):
+        data = tensor.detach().cpu().contiguous().reshape(-1).view(torch.uint8).numpy().tobytes()
+        header[name] = {'dtype': dtype_names[tensor.dtype], 'shape': list(tensor.shape),
+                        'data_offsets': [offset, offset + len(data)]}
+        buffers.append(data)
+        offset += len(data)
+    header_bytes = json.dumps(header, separators=(',', ':')).encode('utf-8')
+    # tensor data starts 8 byte aligned
+    header_bytes += b' ' * (-len(header_bytes) % 8)
+
+    temp_path = path + '.tmp'
+    with open(temp_path, 'wb') as f:
+        f.write(struct.pack('<Q', len(header_bytes)))
+        f.write(header_bytes)
+        for data in buffers:
+            f.write(data)
+    os.replace(temp_path, path)
+
+
+def load_safetensors(path: str) -> Tuple[Dict[str, 'torch.Tensor'], Dict[str, str]]:
+    """
+    Memory maps a safetensors file. The tensors are views of a copy on write mapping: the pages are read from the
+    page cache on first access and shared between processes, a page is only copied if a tensor is written to.
+
+    Args:
+        path: safetensors file path
+
+    Returns: name -> cpu tensor, header metadata
+    """
+    import torch
+
+    dtypes = {name: dtype for dtype, name in _dtype_names().items()}
+    with open(path, 'rb') as f:
+        mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+    header_length, = struct.unpack('<Q', mapping[:8])
+    header = json.loads(mapping[8:8 + header_length].decode('utf-8'))
+    metadata = header.pop('__metadata__', {})
+
+    tensors = {}
+    for name, info in header.items():
+        dtype = dtypes[info['dtype']]
+        begin, end = info['data_offsets']
+        if begin == end:
+            tensors[name] = torch.empty(info['shape'], dtype=dtype)
+            continue
+        count = (end - begin) // torch.empty((), dtype=dtype).element_size()
+        # the tensors keep the mapping alive
+        tensors[name] = torch.frombuffer(mapping, dtype=dtype, count=count,
+                                         offset=8 + header_length + begin).reshape(info['shape'])
+    return tensors, metadata
+
+
+def convert(language_code: str) -> str:
+    """
+    Loads the ALBERT model of a language from its <lang>.pt checkpoint and writes its weights next to it as
+    <lang>.safetensors
+
+    Args:
+        language_code: Indic language code
+
+    Returns: path of the converted file
+    """
+    from punctuate.punctuate_text import Punctuation
+
+    punctuation = Punctuation(language_code, download=False, use_safetensors=False)
+    save_safetensors(punctuation.model.state_dict(), punctuation.weights_path,
+                     {'num_labels': str(len(punctuation.train_encoder)),
+                      'source': os.path.basename(punctuation.model_path)})
+    return punctuation.weights_path
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    for lang in args.langs:
+        path = convert(lang)
+        print(f'{lang}: {path} ({os.path.getsize(path) / 1e6:.1f}MB)')
@@ -0,0 +1,103 @@
+'''
+Incremental punctuation of live transcripts
+
+Example usage:
+from punctuate.punctuate_text import Punctuation
+from punctuate.streaming import PunctuationSession
+
+session = PunctuationSession(Punctuation('hi'))
+for chunk in asr_word_chunks:
+    print(session.add(chunk), end='')   # newly committed punctuated text
+print(session.finish())                 # whole punctuated transcript
+'''
+
+
+class PunctuationSession:
+    '''
+    Punctuates a stream of words. The model only runs over a sliding window: up to left_context already committed
+    words, then the new words. A word is committed once right_context words follow it; committed words are never
+    punctuated again, so the cost of a chunk does not depend on how long the session has been running.
+
+    Args:
+        punctuation: loaded punctuate_text.Punctuation model
+        right_context: words that must follow a word before its punctuation is committed
+        left_context: committed words given to the model as context for the next window
+        max_window: new words per model call, larger chunks are punctuated in several windows
+    '''
+
+    def __init__(self, punctuation, right_context=8, left_context=32, max_window=128):
+        if max_window <= right_context:
+            raise ValueError('max_window must be larger than right_context')
+        self.punctuation = punctuation
+        self.right_context = right_context
+        self.left_context = left_context
+        self.max_window = max_window
+        self.reset()
+
+    def reset(self):
+        '''
+        Starts a new session
+        '''
+        self.committed_pieces = []
+        self.context_words = []
+        self.pending_words = []
+
+    def _punctuate_window(self, words):
+        '''
+        Punctuates words after the left context and returns one piece per word
+        '''
+        pieces = self.punctuation.punctuate_words(self.context_words + words)
+        return pieces[len(self.context_words):]
+
+    def _commit(self, words, pieces):
+        self.committed_pieces += pieces
+        self.context_words = (self.context_words + words)[-self.left_context:] if self.left_context else []
+        return ''.join(pieces)
+
+    @property
+    def text(self):
+        '''
+        Committed punctuated text
+        '''
+        return ''.join(self.committed_pieces)
+
+    def add(self, text):
+        '''
+        Adds a chunk of words to the session
+
+        Args:
+            text: one or more words
+
+        Returns: punctuated text committed because of this chunk, possibly empty
+        '''
+        self.pending_words += text.split()
+        committed = ''
+        while len(self.pending_words) > self.right_context:
+            num_commit = min(self.max_window, len(self.pending_words)) - self.right_context
+            window = self.pending_words[:num_commit + self.right_context]
+            pieces = self._punctuate_window(window)
+            committed += self._commit(window[:num_commit], pieces[:num_commit])
+            self.pending_words = self.pending_words[num_commit:]
+        return committed
+
+    def provisional(self):
+        '''
+        Punctuation of the words not committed yet, it may still change when more words arrive
+        '''
+        if not self.pending_words:
+            return ''
+        return ''.join(self._punctuate_window(self.pending_words))
+
+    def finish(self):
+        '''
+        Commits the remaining words and starts a new session
+
+        Returns: whole punctuated text of the session
+        '''
+        while self.pending_words:
+            window = self.pending_words[:self.max_window]
+            self._commit(window, self._punctuate_window(window))
+            self.pending_words = self.pending_words[len(window):]
+        text = self.text.strip()
+        self.reset()
+        return text